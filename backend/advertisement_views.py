@@ -1,6 +1,6 @@
 from rest_framework import status
 from rest_framework.decorators import api_view, permission_classes, parser_classes
-from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
+from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from django.views.decorators.csrf import csrf_exempt
@@ -8,23 +8,29 @@ from django.utils import timezone
 from django.core.files.storage import default_storage
 from django.core.files.uploadedfile import UploadedFile
 from django.http.request import QueryDict
+from core.changes import ChangeFeed
+from core.live import publish
 from core.models import Advertisement
+from core.parsers import ORJSONParser
 from core.serializers import AdvertisementSerializer
 import json
 import os
 import uuid
 
+# How long an advertisement stays listed after submission or renewal
+AD_LIFETIME_DAYS = 30
+
 @csrf_exempt
 @api_view(['GET'])
 @permission_classes([AllowAny])
 def api_advertisements(request):
-    """Get all approved advertisements"""
+    """Get all approved, unexpired advertisements"""
     try:
-        ads = Advertisement.objects.filter(status='approved').order_by('-created_at')
-        serializer = AdvertisementSerializer(ads, many=True)
+        ads = Advertisement.objects.public().order_by('-created_at')
+        rows = AdvertisementSerializer.list_data(request, ads)
         return Response({
             'success': True,
-            'advertisements': serializer.data
+            'advertisements': rows
         })
     except Exception as e:
         return Response({
@@ -40,11 +46,16 @@ def api_advertisements_admin(request):
         return Response({'success': False, 'error': 'Authentication required'}, status=401)
     """Get all advertisements for admin dashboard"""
     try:
-        ads = Advertisement.objects.all().order_by('-created_at')
-        serializer = AdvertisementSerializer(ads, many=True)
+        try:
+            feed = ChangeFeed.from_request(request, Advertisement)
+        except ValueError as e:
+            return Response({'success': False, 'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        ads = feed.filter(Advertisement.objects.all().order_by('-created_at'))
+        rows = AdvertisementSerializer.list_data(request, ads)
         return Response({
             'success': True,
-            'advertisements': serializer.data
+            'advertisements': rows,
+            **feed.meta(rows),
         })
     except Exception as e:
         return Response({
@@ -54,7 +65,7 @@ def api_advertisements_admin(request):
 
 @csrf_exempt
 @api_view(['POST'])
-@parser_classes([JSONParser, MultiPartParser, FormParser])
+@parser_classes([ORJSONParser, MultiPartParser, FormParser])
 @permission_classes([AllowAny])
 def api_create_advertisement(request):
     if not request.user.is_authenticated:
@@ -91,10 +102,11 @@ def api_create_advertisement(request):
                 images.append(_save_advertisement_image(value))
         data['images'] = images
 
-        data['expires_at'] = timezone.now() + timezone.timedelta(days=30)
+        data['expires_at'] = timezone.now() + timezone.timedelta(days=AD_LIFETIME_DAYS)
         serializer = AdvertisementSerializer(data=data)
         if serializer.is_valid():
-            serializer.save()
+            ad = serializer.save()
+            publish('advertisement', 'created', ad.id)
             return Response({
                 'success': True,
                 'message': 'Advertisement submitted successfully. Admin will review and approve.',
@@ -128,7 +140,7 @@ def _save_advertisement_image(file):
 
 @csrf_exempt
 @api_view(['PUT'])
-@parser_classes([JSONParser, MultiPartParser, FormParser])
+@parser_classes([ORJSONParser, MultiPartParser, FormParser])
 @permission_classes([AllowAny])
 def api_update_advertisement(request, ad_id):
     if not request.user.is_authenticated:
@@ -182,9 +194,18 @@ def api_update_advertisement(request, ad_id):
 
             data['images'] = images
 
+        # Renewal: re-approving an expired ad (or passing renew=true) puts the
+        # same listing back up for another AD_LIFETIME_DAYS.
+        renew = data.get('renew') in (True, 'true', 'True', '1')
+        reapproved = ad.status == 'expired' and data['status'] == 'approved'
+        if renew or reapproved:
+            data['status'] = 'approved'
+            data['expires_at'] = timezone.now() + timezone.timedelta(days=AD_LIFETIME_DAYS)
+
         serializer = AdvertisementSerializer(ad, data=data, partial=True)
         if serializer.is_valid():
             serializer.save()
+            publish('advertisement', 'updated', ad.id)
             return Response({
                 'success': True,
                 'advertisement': serializer.data
@@ -214,6 +235,7 @@ def api_delete_advertisement(request, ad_id):
     try:
         ad = Advertisement.objects.get(id=ad_id)
         ad.delete()
+        publish('advertisement', 'deleted', ad_id)
         return Response({
             'success': True,
             'message': 'Advertisement deleted successfully'
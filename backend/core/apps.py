@@ -4,3 +4,27 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from django.db.models.signals import post_delete, post_save, pre_save
+        from .changes import SYNCED_MODELS, record_deletion
+        from .metrics import install_query_recorder
+        from .payloads import invalidate_payloads
+        from .related import schedule_refresh
+        from .stats import TRACKED_MODELS, remember_stats_state, update_stats_on_delete, update_stats_on_save
+        connection_created.connect(install_query_recorder, dispatch_uid='core_query_recorder')
+        # Site stats first: payloads built from them must not be rebuilt
+        # between the generation bump and the SiteStats update
+        for model in TRACKED_MODELS:
+            label = model._meta.label_lower
+            pre_save.connect(remember_stats_state, sender=model, dispatch_uid=f'core_site_stats_pre_save_{label}')
+            post_save.connect(update_stats_on_save, sender=model, dispatch_uid=f'core_site_stats_save_{label}')
+            post_delete.connect(update_stats_on_delete, sender=model, dispatch_uid=f'core_site_stats_delete_{label}')
+        post_save.connect(invalidate_payloads, dispatch_uid='core_payload_invalidation_save')
+        post_delete.connect(invalidate_payloads, dispatch_uid='core_payload_invalidation_delete')
+        post_save.connect(schedule_refresh, sender='core.BlogPost', dispatch_uid='core_related_posts_save')
+        post_delete.connect(schedule_refresh, sender='core.BlogPost', dispatch_uid='core_related_posts_delete')
+        for model in SYNCED_MODELS:
+            label = model._meta.label_lower
+            post_delete.connect(record_deletion, sender=model, dispatch_uid=f'core_tombstone_{label}')
@@ -0,0 +1,222 @@
+"""
+High-traffic public read endpoints as native async views.
+
+The website polls these from every open tab. Under ASGI (uvicorn workers)
+they wait on the database without holding a worker, and under WSGI Django
+runs them through async_to_sync, so the same code serves both modes.
+DRF's @api_view is sync-only, hence plain Django views and JsonResponse.
+Payloads are built and cached in core.payloads; the lists the dashboard
+syncs take ``?since=`` (core.changes). The admin dashboard's
+live-update stream (core.live) is here too: under ASGI an open stream is
+just a suspended coroutine.
+"""
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_safe
+
+from . import live
+from .changes import ChangeFeed
+from .fieldsets import requested_fieldset
+from .models import Event, GalleryItem, Testimonial
+from .payloads import aget_payload, aget_stamped_payload
+
+
+def _flag(request, name):
+    return request.GET.get(name, 'false').lower() == 'true'
+
+
+def _fieldset(request):
+    fields, exclude = requested_fieldset(request)
+    return {'fields': fields, 'exclude': exclude}
+
+
+def _gallery_filters(request):
+    """?category=&congregation=&dateFrom=&dateTo=&featured=&mediaType= as builder params."""
+    filters = {
+        'category': request.GET.get('category') or None,
+        'congregation': request.GET.get('congregation') or None,
+        'featured': {'true': True, 'false': False}.get(request.GET.get('featured', '').lower()),
+        'media_type': request.GET.get('mediaType') or None,
+    }
+    if filters['media_type'] and filters['media_type'] not in GalleryItem.MEDIA_TYPES:
+        raise ValueError(f'mediaType must be one of {", ".join(GalleryItem.MEDIA_TYPES)}')
+    for param, name in (('dateFrom', 'date_from'), ('dateTo', 'date_to')):
+        raw = request.GET.get(param)
+        try:
+            filters[name] = parse_date(raw) if raw else None
+        except ValueError:
+            filters[name] = None
+        if raw and filters[name] is None:
+            raise ValueError(f'{param} must be a date (YYYY-MM-DD)')
+    return filters
+
+
+def _event_bound(request, param, end=False):
+    """?from= / ?to= as an aware datetime; a bare ``to`` date includes that whole day."""
+    raw = request.GET.get(param)
+    if not raw:
+        return None
+    try:
+        # Dates first: parse_datetime would also accept '2025-03-01' as midnight
+        day = parse_date(raw)
+        if day is not None:
+            value = datetime.combine(day + timedelta(days=1) if end else day, time.min)
+        else:
+            value = parse_datetime(raw)
+    except ValueError:
+        value = None
+    if value is None:
+        raise ValueError(f'{param} must be a date (YYYY-MM-DD) or ISO datetime')
+    return value if timezone.is_aware(value) else timezone.make_aware(value)
+
+
+def _calendar_month(request):
+    raw = request.GET.get('month')
+    if not raw:
+        return timezone.localdate().replace(day=1)
+    try:
+        return datetime.strptime(raw, '%Y-%m').date()
+    except ValueError:
+        raise ValueError('month must be YYYY-MM')
+
+
+def _last_event_id(request):
+    """The Last-Event-ID header EventSource sends on reconnect (or ?lastEventId=)."""
+    return request.headers.get('Last-Event-ID') or request.GET.get('lastEventId') or None
+
+
+def _error(e):
+    return JsonResponse({'success': False, 'error': str(e)}, status=500)
+
+
+@csrf_exempt
+@require_safe
+async def api_events(request):
+    """Get all events with optional filtering"""
+    try:
+        event_type = request.GET.get('type')
+        try:
+            start, end = _event_bound(request, 'from'), _event_bound(request, 'to', end=True)
+            feed = ChangeFeed.from_request(request, Event)
+        except ValueError as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+        events, built_at = await aget_stamped_payload(
+            'events',
+            type=event_type if event_type in ('upcoming', 'past') else None,
+            exclude_deleted=request.GET.get('excludeDeleted') == 'true',
+            start=start,
+            end=end,
+            since=feed.since,
+            **_fieldset(request),
+        )
+        return JsonResponse({'success': True, 'events': events, **await feed.ameta(events, built_at)})
+    except Exception as e:
+        return _error(e)
+
+
+@csrf_exempt
+@require_safe
+async def api_events_calendar(request):
+    """One month of events grouped by day (?month=YYYY-MM, default this month)"""
+    try:
+        try:
+            month = _calendar_month(request)
+        except ValueError as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+        calendar = await aget_payload('events_calendar', month=month)
+        return JsonResponse({'success': True, **calendar})
+    except Exception as e:
+        return _error(e)
+
+
+@csrf_exempt
+@require_safe
+async def api_ministries(request):
+    try:
+        ministries = await aget_payload('ministries', deleted=_flag(request, 'deleted'), **_fieldset(request))
+        return JsonResponse({'success': True, 'ministries': ministries})
+    except Exception as e:
+        return _error(e)
+
+
+@csrf_exempt
+@require_safe
+async def api_testimonials(request):
+    """Get all testimonials"""
+    try:
+        try:
+            feed = ChangeFeed.from_request(request, Testimonial)
+        except ValueError as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+        # forWebsite: only approved testimonials for the main website
+        testimonials, built_at = await aget_stamped_payload(
+            'testimonials',
+            for_website=_flag(request, 'forWebsite'),
+            deleted=_flag(request, 'deleted'),
+            since=feed.since,
+            **_fieldset(request),
+        )
+        return JsonResponse({'success': True, 'testimonials': testimonials, **await feed.ameta(testimonials, built_at)})
+    except Exception as e:
+        return _error(e)
+
+
+@csrf_exempt
+@require_safe
+async def api_gallery_items(request):
+    """Get gallery items, optionally filtered, with facet counts for the filter UI"""
+    try:
+        # Gallery does not currently support soft-delete; deleted=true returns empty
+        if _flag(request, 'deleted'):
+            return JsonResponse({'success': True, 'media': []})
+        try:
+            filters = _gallery_filters(request)
+            feed = ChangeFeed.from_request(request, GalleryItem)
+        except ValueError as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+        media, built_at = await aget_stamped_payload('gallery', **filters, since=feed.since, **_fieldset(request))
+        facets = await aget_payload('gallery_facets', **filters)
+        return JsonResponse({'success': True, 'media': media, 'facets': facets, **await feed.ameta(media, built_at)})
+    except Exception as e:
+        return _error(e)
+
+
+@csrf_exempt
+@require_safe
+async def api_announcements(request):
+    """Get all announcements (public)"""
+    try:
+        return JsonResponse({'success': True, 'announcements': await aget_payload('announcements', **_fieldset(request))})
+    except Exception as e:
+        return _error(e)
+
+
+@require_safe
+async def api_admin_events(request):
+    """Live change notifications for the dashboard (text/event-stream)"""
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({'success': False, 'error': 'Authentication required'}, status=401)
+    if not settings.SHARED_CACHE:
+        # Other workers' events never reach this one's cache; EventSource
+        # gives up on a 503 and the dashboard keeps polling
+        return JsonResponse(
+            {'success': False, 'error': 'Live updates need a shared cache (REDIS_URL)', 'poll': True}, status=503,
+        )
+    last_id = _last_event_id(request)
+    if isinstance(request, ASGIRequest):
+        response = StreamingHttpResponse(live.stream(last_id), content_type='text/event-stream')
+    else:
+        # Under WSGI an open stream would pin a sync worker: answer with what
+        # is pending and let EventSource reconnect after the retry delay
+        body = ''.join([chunk async for chunk in live.stream(last_id, duration=0)])
+        response = HttpResponse(body, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx: don't buffer the stream
+    return response
@@ -0,0 +1,28 @@
+"""
+Fire-and-forget work that should not hold up the response.
+
+Notification mails that are sent with ``fail_silently=True`` have no
+outcome the client waits for, so they run on a small thread pool instead
+of the request's worker (or, under ASGI, its per-request thread).
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='ypg-background')
+
+
+def _run(func, args, kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception('Background task %s failed', getattr(func, '__name__', func))
+    finally:
+        connections.close_all()
+
+
+def run_in_background(func, *args, **kwargs):
+    return _executor.submit(_run, func, args, kwargs)
@@ -0,0 +1,57 @@
+"""
+Write-time rendering for blog posts.
+
+Posts are written as plain text in the dashboard: blank lines separate
+paragraphs and single newlines are line breaks. BlogPost.save() runs the
+text through ``summarize()`` once, so the read endpoints serve stored HTML,
+excerpts and reading times instead of every client deriving them from the
+full content. Everything is escaped before markup is added (links are the
+only tags produced), so the HTML is safe to insert as-is.
+"""
+import re
+
+from django.utils.html import linebreaks, urlize
+from django.utils.text import Truncator, normalize_newlines
+
+WORDS_PER_MINUTE = 200
+EXCERPT_WORDS = 40
+
+
+def render_html(content):
+    """Escaped paragraphs and line breaks, with bare URLs turned into links."""
+    text = normalize_newlines(content or '').strip()
+    if not text:
+        return ''
+    # urlize(autoescape=True) escapes everything outside the links it adds
+    return linebreaks(urlize(text, nofollow=True, autoescape=True))
+
+
+def make_excerpt(content, words=EXCERPT_WORDS):
+    """The first ``words`` words of the opening paragraph, whitespace collapsed."""
+    text = normalize_newlines(content or '').strip()
+    first_paragraph = re.split(r'\n\s*\n', text, maxsplit=1)[0]
+    return Truncator(' '.join(first_paragraph.split())).words(words, truncate='…')
+
+
+def count_words(content):
+    return len((content or '').split())
+
+
+def reading_minutes(word_count):
+    if not word_count:
+        return 0
+    return max(1, -(-word_count // WORDS_PER_MINUTE))
+
+
+def summarize(content, excerpt=''):
+    """The precomputed BlogPost columns for ``content``.
+
+    A hand-written ``excerpt`` wins over the automatic one.
+    """
+    word_count = count_words(content)
+    return {
+        'content_html': render_html(content),
+        'summary': excerpt.strip() if excerpt and excerpt.strip() else make_excerpt(content),
+        'word_count': word_count,
+        'reading_time': reading_minutes(word_count),
+    }
@@ -0,0 +1,128 @@
+"""
+Incremental dashboard lists: ``?since=<timestamp>``.
+
+With ``since`` an admin list returns only the rows created or changed at or
+after that moment (by ``updated_at``), plus ``deleted``: the ids that left
+the list since then, whether hard-deleted (``record_deletion`` keeps a
+Tombstone per row) or changed so they no longer match it (soft deletes,
+status changes). Every list response carries ``synced_at``, the value to
+send as ``since`` next time, and ``full``, which tells the client to
+replace its copy rather than merge into it: it is true without ``since``
+and when ``since`` is older than the SYNC_TOMBSTONE_DAYS of deletions kept.
+
+A full list served from the payload cache may predate rows written since
+it was built (another worker's cache, or the moment between a commit and
+the invalidation), so its ``synced_at`` is the build's start time, not the
+request's; ``since`` lists are always built fresh.
+
+Rows are matched to ``deleted`` by ``id``, so a ``?fields=`` list should
+keep it. Queryset ``update()`` bypasses ``auto_now``; code that uses it on
+these models sets ``updated_at`` itself.
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import (
+    Advertisement, ContactMessage, Congregation, Contribution, Donation, Event, Expense, GalleryItem, Sale,
+    TeamMember, Testimonial, Tombstone,
+)
+
+SYNCED_MODELS = (
+    Event, TeamMember, Donation, ContactMessage, Testimonial, GalleryItem, Advertisement,
+    Sale, Expense, Contribution, Congregation,
+)
+
+
+def parse_since(raw):
+    """``?since=`` as an aware datetime (ISO 8601 or Unix seconds); None when absent."""
+    if not raw:
+        return None
+    try:
+        return datetime.fromtimestamp(float(raw), tz=dt_timezone.utc)
+    except (ValueError, OverflowError, OSError):
+        pass
+    try:
+        value = parse_datetime(raw)
+    except ValueError:
+        value = None
+    if value is None:
+        raise ValueError('since must be an ISO datetime or Unix timestamp')
+    return value if timezone.is_aware(value) else timezone.make_aware(value)
+
+
+def format_timestamp(value):
+    # UTC with a 'Z' suffix: a '+00:00' offset would come back as a space
+    # from a client that forgets to URL-encode it
+    return value.astimezone(dt_timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+class ChangeFeed:
+    """The ``?since=`` side of one list request for ``model``.
+
+    Create it before querying, so ``synced_at`` never skips a row written
+    while the list was being built (``since`` is inclusive; a row may be
+    sent twice, never missed).
+    """
+
+    def __init__(self, model, since=None):
+        self.model = model
+        self.synced_at = timezone.now()
+        oldest = self.synced_at - timedelta(days=settings.SYNC_TOMBSTONE_DAYS)
+        self.since = since if since is not None and since >= oldest else None
+
+    @classmethod
+    def from_request(cls, request, model):
+        """Raises ValueError for a malformed ``?since=``."""
+        return cls(model, parse_since(request.GET.get('since')))
+
+    @property
+    def full(self):
+        return self.since is None
+
+    def filter(self, queryset):
+        return queryset if self.full else queryset.filter(updated_at__gte=self.since)
+
+    def deleted(self, rows):
+        """Ids that changed or were deleted since ``since`` and are not among ``rows``."""
+        listed = {row['id'] for row in rows if 'id' in row}
+        changed = self.model._default_manager.filter(updated_at__gte=self.since).values_list('pk', flat=True)
+        removed = Tombstone.objects.filter(
+            model=self.model._meta.label_lower, deleted_at__gte=self.since,
+        ).values_list('object_id', flat=True)
+        return sorted({*changed, *removed} - listed)
+
+    def meta(self, rows, built_at=None):
+        """The sync keys for a response listing ``rows``.
+
+        ``built_at`` (a Unix timestamp, from core.payloads) is when a cached
+        list was built: a row written since may be missing from it, so the
+        client must sync from then rather than from this request.
+        """
+        synced_at = self.synced_at
+        if built_at is not None:
+            synced_at = min(synced_at, datetime.fromtimestamp(built_at, tz=dt_timezone.utc))
+        meta = {'synced_at': format_timestamp(synced_at), 'full': self.full}
+        if not self.full:
+            meta['deleted'] = self.deleted(rows)
+        return meta
+
+    async def ameta(self, rows, built_at=None):
+        if self.full:
+            return self.meta(rows, built_at)
+        return await sync_to_async(self.meta)(rows, built_at)
+
+
+def record_deletion(sender, instance, **kwargs):
+    """post_delete receiver for SYNCED_MODELS."""
+    Tombstone.objects.create(model=sender._meta.label_lower, object_id=instance.pk)
+
+
+def prune_tombstones(now=None):
+    """Drop tombstones no client can still ask for. Returns how many."""
+    cutoff = (now or timezone.now()) - timedelta(days=settings.SYNC_TOMBSTONE_DAYS)
+    deleted, _ = Tombstone.objects.filter(deleted_at__lt=cutoff).delete()
+    return deleted
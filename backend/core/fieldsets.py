@@ -0,0 +1,34 @@
+"""
+Sparse fieldsets for the read endpoints: ``?fields=a,b,c`` and ``?exclude=x,y``.
+
+Field sets are normalized to sorted tuples so they can go straight into
+cache keys (core.payloads binds them like any other builder parameter).
+Serializers narrow themselves and their querysets through
+core.serializers.SparseModelSerializer, .values() projections through
+Projection.narrow(), and hand-built dict rows through ``trim()``.
+Unknown names are ignored.
+"""
+
+
+def _names(raw):
+    if not raw:
+        return ()
+    return tuple(sorted({name.strip() for name in raw.split(',') if name.strip()}))
+
+
+def requested_fieldset(request):
+    """Return ``(fields, exclude)``; ``fields`` is None when not restricted."""
+    return _names(request.GET.get('fields')) or None, _names(request.GET.get('exclude'))
+
+
+def wanted(name, fields=None, exclude=()):
+    return (fields is None or name in fields) and name not in exclude
+
+
+def trim(rows, fields=None, exclude=()):
+    """Apply a fieldset to a list of dicts (or a single dict)."""
+    if fields is None and not exclude:
+        return rows
+    if isinstance(rows, dict):
+        return {k: v for k, v in rows.items() if wanted(k, fields, exclude)}
+    return [{k: v for k, v in row.items() if wanted(k, fields, exclude)} for row in rows]
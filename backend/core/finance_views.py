@@ -4,9 +4,9 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from django.views.decorators.csrf import csrf_exempt
 from django.shortcuts import get_object_or_404
+from .changes import ChangeFeed
 from .models import Sale, Expense, Contribution
 from .serializers import SaleSerializer, ExpenseSerializer, ContributionSerializer
-import json
 
 # Sales API endpoints
 @csrf_exempt
@@ -15,11 +15,16 @@ import json
 def api_sales(request):
     """Get all sales"""
     try:
-        sales = Sale.objects.all().order_by('-created_at')
-        serializer = SaleSerializer(sales, many=True)
+        try:
+            feed = ChangeFeed.from_request(request, Sale)
+        except ValueError as e:
+            return Response({'success': False, 'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        sales = feed.filter(Sale.objects.all().order_by('-created_at'))
+        rows = SaleSerializer.list_data(request, sales)
         return Response({
             'success': True,
-            'sales': serializer.data
+            'sales': rows,
+            **feed.meta(rows),
         })
     except Exception as e:
         return Response({
@@ -33,7 +38,7 @@ def api_sales(request):
 def api_create_sale(request):
     """Create a new sale"""
     try:
-        data = json.loads(request.body)
+        data = request.data
         serializer = SaleSerializer(data=data)
         if serializer.is_valid():
             sale = serializer.save()
@@ -59,7 +64,7 @@ def api_update_sale(request, sale_id):
     """Update a sale"""
     try:
         sale = get_object_or_404(Sale, id=sale_id)
-        data = json.loads(request.body)
+        data = request.data
         serializer = SaleSerializer(sale, data=data, partial=True)
         if serializer.is_valid():
             updated_sale = serializer.save()
@@ -103,11 +108,16 @@ def api_delete_sale(request, sale_id):
 def api_expenses(request):
     """Get all expenses"""
     try:
-        expenses = Expense.objects.all().order_by('-created_at')
-        serializer = ExpenseSerializer(expenses, many=True)
+        try:
+            feed = ChangeFeed.from_request(request, Expense)
+        except ValueError as e:
+            return Response({'success': False, 'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        expenses = feed.filter(Expense.objects.all().order_by('-created_at'))
+        rows = ExpenseSerializer.list_data(request, expenses)
         return Response({
             'success': True,
-            'expenses': serializer.data
+            'expenses': rows,
+            **feed.meta(rows),
         })
     except Exception as e:
         return Response({
@@ -121,7 +131,7 @@ def api_expenses(request):
 def api_create_expense(request):
     """Create a new expense"""
     try:
-        data = json.loads(request.body)
+        data = request.data
         serializer = ExpenseSerializer(data=data)
         if serializer.is_valid():
             expense = serializer.save()
@@ -147,7 +157,7 @@ def api_update_expense(request, expense_id):
     """Update an expense"""
     try:
         expense = get_object_or_404(Expense, id=expense_id)
-        data = json.loads(request.body)
+        data = request.data
         serializer = ExpenseSerializer(expense, data=data, partial=True)
         if serializer.is_valid():
             updated_expense = serializer.save()
@@ -191,11 +201,16 @@ def api_delete_expense(request, expense_id):
 def api_contributions(request):
     """Get all contributions"""
     try:
-        contributions = Contribution.objects.all().order_by('-created_at')
-        serializer = ContributionSerializer(contributions, many=True)
+        try:
+            feed = ChangeFeed.from_request(request, Contribution)
+        except ValueError as e:
+            return Response({'success': False, 'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        contributions = feed.filter(Contribution.objects.all().order_by('-created_at'))
+        rows = ContributionSerializer.list_data(request, contributions)
         return Response({
             'success': True,
-            'contributions': serializer.data
+            'contributions': rows,
+            **feed.meta(rows),
         })
     except Exception as e:
         return Response({
@@ -209,7 +224,7 @@ def api_contributions(request):
 def api_create_contribution(request):
     """Create a new contribution"""
     try:
-        data = json.loads(request.body)
+        data = request.data
         serializer = ContributionSerializer(data=data)
         if serializer.is_valid():
             contribution = serializer.save()
@@ -235,7 +250,7 @@ def api_update_contribution(request, contribution_id):
     """Update a contribution"""
     try:
         contribution = get_object_or_404(Contribution, id=contribution_id)
-        data = json.loads(request.body)
+        data = request.data
         serializer = ContributionSerializer(contribution, data=data, partial=True)
         if serializer.is_valid():
             updated_contribution = serializer.save()
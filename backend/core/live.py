@@ -0,0 +1,200 @@
+"""
+Change notifications for the admin dashboard, streamed as Server-Sent Events.
+
+Create/update views call ``publish()`` with a compact ``{type, action, id}``
+record; the dashboard refetches just that item (and the pending counts)
+instead of re-polling every list. Events go into a short log in the shared
+cache under an increasing sequence number. The SSE event id is
+``<epoch>-<sequence>``, so a reconnecting EventSource resumes from its
+Last-Event-ID; the epoch is a random token stored next to the counter and
+replaced whenever the counter starts over, so an id from another numbering
+(a flushed cache, a restart) gets a ``reset`` instead of the wrong events.
+
+Streams notice new events by polling the sequence number or, when
+REDIS_URL is set, by waking up on a Redis pub/sub message. The log only
+works when every worker shares the cache: with per-process memory caches
+and several workers (settings.SHARED_CACHE is False) a stream would miss
+the other workers' events, so the endpoint refuses to stream and the
+dashboard keeps polling. A single worker (development) is fine.
+"""
+import asyncio
+import json
+import logging
+import secrets
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+SEQUENCE_KEY = 'live_events_sequence'
+EPOCH_KEY = 'live_events_epoch'
+CHANNEL = 'ypg:live-events'
+RETRY_MS = 3000
+
+_redis_client = None
+
+
+def _event_key(sequence):
+    return f'live_event_{sequence}'
+
+
+def _new_epoch():
+    return secrets.token_hex(4)
+
+
+def event_id(epoch, sequence):
+    return f'{epoch}-{sequence}'
+
+
+def parse_event_id(raw, epoch):
+    """The sequence number in a Last-Event-ID of ``epoch``; None for any other id."""
+    prefix, _, sequence = (raw or '').rpartition('-')
+    if prefix != epoch or not sequence.isdigit():
+        return None
+    return int(sequence)
+
+
+async def current_epoch():
+    if await cache.aadd(SEQUENCE_KEY, 0, None):
+        # The numbering starts over: ids handed out before mean nothing now
+        await cache.aset(EPOCH_KEY, _new_epoch(), None)
+    epoch = await cache.aget(EPOCH_KEY)
+    if epoch is None:
+        await cache.aadd(EPOCH_KEY, _new_epoch(), None)
+        epoch = await cache.aget(EPOCH_KEY)
+    return epoch
+
+
+def _redis():
+    global _redis_client
+    if _redis_client is None:
+        import redis
+        _redis_client = redis.Redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
+def publish(type, action, id=None):
+    """Record that a ``type`` object was created/updated/deleted. Never raises."""
+    try:
+        if cache.add(SEQUENCE_KEY, 0, None):
+            # The numbering starts over: ids handed out before mean nothing now
+            cache.set(EPOCH_KEY, _new_epoch(), None)
+        sequence = cache.incr(SEQUENCE_KEY)
+        event = {'type': type, 'action': action, 'id': id, 'at': timezone.now().isoformat()}
+        cache.set(_event_key(sequence), event, settings.LIVE_EVENTS_TTL)
+        if settings.REDIS_URL:
+            _redis().publish(CHANNEL, sequence)
+        return sequence
+    except Exception:
+        logger.exception('Could not publish live event %s %s', type, action)
+        return None
+
+
+async def latest_sequence():
+    return await cache.aget(SEQUENCE_KEY, 0)
+
+
+async def read_since(last_id):
+    """Return ``(latest, events, complete)`` for the events after ``last_id``.
+
+    ``complete`` is False when some of them are gone (expired, past the
+    backlog, or the cache was cleared) and the client should refetch.
+    """
+    latest = await latest_sequence()
+    if latest <= last_id:
+        return latest, [], latest == last_id
+    start = max(last_id + 1, latest - settings.LIVE_EVENTS_BACKLOG + 1)
+    found = await cache.aget_many([_event_key(sequence) for sequence in range(start, latest + 1)])
+    events = [
+        (sequence, found[_event_key(sequence)])
+        for sequence in range(start, latest + 1) if _event_key(sequence) in found
+    ]
+    return latest, events, len(events) == latest - last_id
+
+
+def format_event(sequence, name, data):
+    return f'id: {sequence}\nevent: {name}\ndata: {json.dumps(data, separators=(",", ":"))}\n\n'
+
+
+async def _subscribe():
+    if not settings.REDIS_URL:
+        return None
+    try:
+        from redis import asyncio as aioredis
+        client = aioredis.from_url(settings.REDIS_URL)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(CHANNEL)
+        return client, pubsub
+    except Exception:
+        logger.exception('Redis subscription failed; live events fall back to polling')
+        return None
+
+
+async def _unsubscribe(subscription):
+    client, pubsub = subscription
+    await pubsub.aclose()
+    await client.aclose()
+
+
+async def _wait(subscription, timeout):
+    if subscription is None:
+        await asyncio.sleep(timeout)
+        return
+    try:
+        await subscription[1].get_message(ignore_subscribe_messages=True, timeout=timeout)
+    except Exception:
+        await asyncio.sleep(timeout)
+
+
+async def stream(last_event_id=None, duration=None):
+    """SSE chunks: events after ``last_event_id`` (None: from now), with heartbeats.
+
+    Ends after ``duration`` seconds (LIVE_EVENTS_STREAM_SECONDS by default);
+    with ``duration=0`` it sends what is pending and stops.
+    """
+    loop = asyncio.get_running_loop()
+    duration = settings.LIVE_EVENTS_STREAM_SECONDS if duration is None else duration
+    deadline = loop.time() + duration
+    subscription = await _subscribe() if duration > 0 else None
+    try:
+        epoch = await current_epoch()
+        if last_event_id is None:
+            last_id = await latest_sequence()
+            yield f'retry: {RETRY_MS}\n' + format_event(event_id(epoch, last_id), 'ready', {})
+        else:
+            last_id = parse_event_id(last_event_id, epoch)
+            if last_id is None:
+                # Another numbering: nothing can be replayed, the client reloads
+                last_id = await latest_sequence()
+                yield f'retry: {RETRY_MS}\n' + format_event(event_id(epoch, last_id), 'reset', {})
+            else:
+                yield f'retry: {RETRY_MS}\n\n'
+        heartbeat_at = loop.time() + settings.LIVE_EVENTS_HEARTBEAT_SECONDS
+        while True:
+            latest, events, complete = await read_since(last_id)
+            if await current_epoch() != epoch:
+                # The counter started over while the stream was open
+                epoch = await current_epoch()
+                yield format_event(event_id(epoch, latest), 'reset', {})
+            elif not complete:
+                # Something was missed: the client reloads its lists
+                yield format_event(event_id(epoch, latest), 'reset', {})
+            else:
+                for sequence, event in events:
+                    yield format_event(event_id(epoch, sequence), 'change', event)
+            last_id = latest
+
+            now = loop.time()
+            if now >= deadline:
+                return
+            if now >= heartbeat_at:
+                yield ': keepalive\n\n'
+                heartbeat_at = now + settings.LIVE_EVENTS_HEARTBEAT_SECONDS
+            # Pub/sub wakes us on publish; polling has to look more often
+            interval = settings.LIVE_EVENTS_HEARTBEAT_SECONDS if subscription else settings.LIVE_EVENTS_POLL_SECONDS
+            await _wait(subscription, min(interval, deadline - now, heartbeat_at - now))
+    finally:
+        if subscription is not None:
+            await _unsubscribe(subscription)
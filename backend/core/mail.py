@@ -0,0 +1,11 @@
+from django.core.mail.backends.smtp import EmailBackend
+
+from .metrics import timed
+
+
+class InstrumentedSMTPBackend(EmailBackend):
+    """SMTP backend that records send latency in the metrics registry."""
+
+    def send_messages(self, email_messages):
+        with timed('smtp', 'send'):
+            return super().send_messages(email_messages)
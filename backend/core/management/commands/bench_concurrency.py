@@ -0,0 +1,133 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from statistics import median
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+DEFAULT_PATHS = '/api/gallery/,/api/events/,/api/announcements/,/api/testimonials/,/api/ministries/'
+
+
+class Command(BaseCommand):
+    help = 'Compare throughput of the public read endpoints under sync WSGI workers and ASGI'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--paths', default=DEFAULT_PATHS, help='Comma-separated endpoints to cycle through')
+        parser.add_argument('--requests', type=int, default=500, help='Total requests per mode')
+        parser.add_argument('--concurrency', type=int, default=50, help='Simultaneous clients')
+        parser.add_argument('--workers', type=int, default=2,
+                            help='Sync workers in WSGI mode (gunicorn --workers)')
+        parser.add_argument('--db-latency-ms', type=float, default=0.0,
+                            help='Extra delay per query, to emulate a remote database')
+
+    def handle(self, *args, **options):
+        paths = [p.strip() for p in options['paths'].split(',') if p.strip()]
+        host = next((h for h in settings.ALLOWED_HOSTS if h and '*' not in h and not h.startswith('.')), 'localhost')
+        latency = options['db_latency_ms'] / 1000
+        plan = [paths[i % len(paths)] for i in range(options['requests'])]
+
+        def delay_query(execute, sql, params, many, context):
+            time.sleep(latency)
+            return execute(sql, params, many, context)
+
+        def add_latency(sender, connection, **kwargs):
+            if latency and delay_query not in connection.execute_wrappers:
+                connection.execute_wrappers.append(delay_query)
+
+        self.stdout.write(
+            f'{len(plan)} requests, {options["concurrency"]} clients, '
+            f'{options["db_latency_ms"]} ms added per query'
+        )
+        connections.close_all()
+        connection_created.connect(add_latency)
+        try:
+            results = {
+                f'WSGI ({options["workers"]} sync workers)': self._run_wsgi(plan, host, options['workers']),
+                'ASGI (1 event loop)': asyncio.run(self._run_asgi(plan, host, options['concurrency'])),
+            }
+        finally:
+            connection_created.disconnect(add_latency)
+
+        for label, (elapsed, timings, failures) in results.items():
+            timings.sort()
+            p95 = timings[int(len(timings) * 0.95) - 1] if timings else 0
+            self.stdout.write(
+                f'  {label:<26} {len(timings) / elapsed:8.1f} req/s  '
+                f'p50 {median(timings) * 1000:7.1f} ms  p95 {p95 * 1000:7.1f} ms  errors {failures}'
+            )
+
+    def _run_wsgi(self, plan, host, workers):
+        # Each sync worker serves one request at a time; queued clients wait,
+        # so latency here includes time spent waiting for a free worker.
+        handler = WSGIHandler()
+
+        def request(path):
+            environ = {'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'HTTP_HOST': host}
+            setup_testing_defaults(environ)
+            status = []
+            response = handler(environ, lambda s, headers, exc_info=None: status.append(s))
+            for _chunk in response:
+                pass
+            response.close()
+            return status[0].startswith('200')
+
+        def worker(path, queued_at):
+            try:
+                ok = request(path)
+            finally:
+                connections.close_all()
+            return ok, time.perf_counter() - queued_at
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(worker, path, time.perf_counter()) for path in plan]
+            outcomes = [f.result() for f in futures]
+        elapsed = time.perf_counter() - start
+        return elapsed, [t for _, t in outcomes], sum(1 for ok, _ in outcomes if not ok)
+
+    async def _run_asgi(self, plan, host, concurrency):
+        handler = ASGIHandler()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def request(path):
+            scope = {
+                'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1',
+                'method': 'GET', 'scheme': 'http', 'path': path, 'raw_path': path.encode(),
+                'root_path': '', 'query_string': b'', 'headers': [(b'host', host.encode())],
+                'client': ('127.0.0.1', 0), 'server': (host, 80),
+            }
+            done = asyncio.Event()
+            messages = [{'type': 'http.request', 'body': b'', 'more_body': False}]
+            status = []
+
+            async def receive():
+                if messages:
+                    return messages.pop()
+                await done.wait()
+                return {'type': 'http.disconnect'}
+
+            async def send(message):
+                if message['type'] == 'http.response.start':
+                    status.append(message['status'])
+                elif not message.get('more_body'):
+                    done.set()
+
+            await handler(scope, receive, send)
+            return status[0] == 200
+
+        async def client(path):
+            queued_at = time.perf_counter()
+            async with semaphore:
+                ok = await request(path)
+            return ok, time.perf_counter() - queued_at
+
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(*(client(path) for path in plan))
+        elapsed = time.perf_counter() - start
+        return elapsed, [t for _, t in outcomes], sum(1 for ok, _ in outcomes if not ok)
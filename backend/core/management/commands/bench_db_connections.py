@@ -0,0 +1,74 @@
+import time
+from statistics import median
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.db.backends.signals import connection_created
+
+
+class Command(BaseCommand):
+    help = 'Measure per-request database connection overhead with and without persistent connections'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default='/api/events/', help='Endpoint to request')
+        parser.add_argument('--requests', type=int, default=200, help='Requests per mode')
+        parser.add_argument('--max-age', type=int, default=None,
+                            help='CONN_MAX_AGE for the persistent run (defaults to the configured value, or 600)')
+
+    def handle(self, *args, **options):
+        handler = WSGIHandler()
+        host = next((h for h in settings.ALLOWED_HOSTS if h and '*' not in h and not h.startswith('.')), 'localhost')
+        persistent_age = options['max_age']
+        if persistent_age is None:
+            persistent_age = settings.DATABASES['default'].get('CONN_MAX_AGE') or 600
+
+        self.stdout.write(f'{options["requests"]} x GET {options["path"]} on {connection.vendor}')
+        results = {}
+        for label, max_age in (('per-request', 0), ('persistent', persistent_age)):
+            results[label] = self._run(handler, host, options['path'], options['requests'], max_age)
+            timings, opened = results[label]
+            self.stdout.write(
+                f'  {label:<12} CONN_MAX_AGE={max_age!s:<5} '
+                f'median {median(timings) * 1000:7.2f} ms  '
+                f'mean {sum(timings) / len(timings) * 1000:7.2f} ms  '
+                f'connections opened {opened}'
+            )
+
+        before = median(results['per-request'][0])
+        after = median(results['persistent'][0])
+        self.stdout.write(self.style.SUCCESS(
+            f'Connection overhead saved per request: {(before - after) * 1000:.2f} ms (median)'
+        ))
+
+    def _run(self, handler, host, path, count, max_age):
+        # Django reads CONN_MAX_AGE when it opens a connection, so start clean
+        connection.close()
+        original_age = connection.settings_dict.get('CONN_MAX_AGE', 0)
+        connection.settings_dict['CONN_MAX_AGE'] = max_age
+        opened = []
+
+        def on_connect(sender, connection, **kwargs):
+            opened.append(connection.alias)
+
+        connection_created.connect(on_connect)
+        timings = []
+        try:
+            for _ in range(count):
+                environ = {'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'HTTP_HOST': host}
+                setup_testing_defaults(environ)
+                start = time.perf_counter()
+                response = handler(environ, lambda status, headers, exc_info=None: None)
+                for _chunk in response:
+                    pass
+                # Closing the response fires request_finished, which is where
+                # Django drops connections that have outlived CONN_MAX_AGE
+                response.close()
+                timings.append(time.perf_counter() - start)
+        finally:
+            connection_created.disconnect(on_connect)
+            connection.close()
+            connection.settings_dict['CONN_MAX_AGE'] = original_age
+        return timings, len(opened)
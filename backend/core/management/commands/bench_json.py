@@ -0,0 +1,93 @@
+import time
+from datetime import timedelta
+from decimal import Decimal
+from io import BytesIO
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.models import Donation
+from core.parsers import ORJSONParser
+from core.renderers import ORJSONRenderer
+from core.serializers import DonationSerializer
+
+
+def sample_donations(count):
+    """Unsaved Donation rows with realistic amounts, dates and text."""
+    now = timezone.now()
+    methods = [code for code, _ in Donation.PAYMENT_METHOD_CHOICES]
+    purposes = [code for code, _ in Donation.PURPOSE_CHOICES]
+    return [
+        Donation(
+            id=i + 1,
+            donor_name=f'Donor {i} Kwabena Asante',
+            email=f'donor{i}@example.com',
+            phone=f'024{i:07d}',
+            amount=Decimal(f'{(i * 37) % 5000}.{i % 100:02d}'),
+            payment_method=methods[i % len(methods)],
+            payment_status='verified' if i % 3 else 'pending',
+            purpose=purposes[i % len(purposes)],
+            message='God bless YPG — Ahinsan district' if i % 4 == 0 else None,
+            transaction_id=f'TXN{i:010d}',
+            receipt_code=f'YPG{i:08d}',
+            verified_at=now - timedelta(hours=i) if i % 3 else None,
+            verified_by='finance' if i % 3 else None,
+            created_at=now - timedelta(hours=i, microseconds=i * 7),
+            updated_at=now - timedelta(minutes=i),
+        )
+        for i in range(count)
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Compare the stdlib and orjson DRF renderers/parsers over donation rows'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000, help='Donation rows to serialize')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per variant; the best is reported')
+
+    def _best(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start)
+        return min(timings), result
+
+    def handle(self, *args, **options):
+        donations = sample_donations(options['rows'])
+        repeat = options['repeat']
+        # Serializer output (strings for Decimal/datetime) and hand-built rows
+        # with raw Decimal/datetime values, like the values() aggregations
+        payloads = {
+            'DonationSerializer': {'success': True, 'donations': DonationSerializer(donations, many=True).data},
+            'raw values': {'success': True, 'donations': [
+                {'id': d.id, 'amount': d.amount, 'created_at': d.created_at, 'verified_at': d.verified_at,
+                 'purpose': d.purpose, 'message': d.message}
+                for d in donations
+            ]},
+        }
+
+        stdlib, fast = JSONRenderer(), ORJSONRenderer()
+        for label, data in payloads.items():
+            slow_time, expected = self._best(lambda: stdlib.render(data), repeat)
+            fast_time, body = self._best(lambda: fast.render(data), repeat)
+            if body != expected:
+                raise CommandError(f'{label}: orjson output differs from JSONRenderer')
+            self.stdout.write(
+                f'  render {label:<20} json {slow_time * 1000:8.1f} ms   '
+                f'orjson {fast_time * 1000:8.1f} ms   x{slow_time / fast_time:5.1f}   {len(body) / 1024:.0f} KiB'
+            )
+
+        body = stdlib.render(payloads['DonationSerializer'])
+        slow_time, expected = self._best(lambda: JSONParser().parse(BytesIO(body)), repeat)
+        fast_time, parsed = self._best(lambda: ORJSONParser().parse(BytesIO(body)), repeat)
+        if parsed != expected:
+            raise CommandError('orjson parser output differs from JSONParser')
+        self.stdout.write(
+            f'  parse  {"DonationSerializer":<20} json {slow_time * 1000:8.1f} ms   '
+            f'orjson {fast_time * 1000:8.1f} ms   x{slow_time / fast_time:5.1f}'
+        )
+        self.stdout.write(self.style.SUCCESS(f'{options["rows"]} rows: output identical to the stdlib renderer'))
@@ -0,0 +1,80 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import BlogPost, Event, GalleryItem, Testimonial
+from core.projections import BLOG_CARD, BLOG_LIST, EVENT_LIST, GALLERY_LIST, TESTIMONIAL_CARD, TESTIMONIAL_LIST
+from core.serializers import BlogPostSerializer, EventSerializer, GalleryItemSerializer, TestimonialSerializer
+
+
+def seed(rows):
+    now = timezone.now()
+    Event.objects.bulk_create(
+        Event(title=f'Event {i}', description='Youth rally and worship. ' * 20, event_type='rally',
+              start_date=now + timedelta(days=i), end_date=now + timedelta(days=i, hours=3),
+              location='Ahinsan', image=f'events/event{i}.jpg' if i % 2 else '')
+        for i in range(rows)
+    )
+    GalleryItem.objects.bulk_create(
+        GalleryItem(title=f'Photo {i}', description='Camp meeting', category='camp',
+                    image=f'gallery/photo{i}.jpg', video='gallery/videos/clip.mp4' if i % 10 == 0 else '',
+                    congregation='Ahinsan', date=now.date())
+        for i in range(rows)
+    )
+    Testimonial.objects.bulk_create(
+        Testimonial(name=f'Member {i}', phone='0240000000', congregation='Ahinsan', position='Member',
+                    content='YPG has shaped my faith. ' * 10, status='approved', admin_notes='')
+        for i in range(rows)
+    )
+    BlogPost.objects.bulk_create(
+        BlogPost(title=f'Post {i}', slug=f'bench-post-{i}', content='<p>Sermon notes.</p>' * 200,
+                 excerpt='Sermon notes', is_published=True, date=now.date())
+        for i in range(rows)
+    )
+
+
+class Command(BaseCommand):
+    help = 'Compare ModelSerializer and .values() projections for the large public listings (rows are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=2000, help='Rows seeded per model')
+        parser.add_argument('--repeat', type=int, default=5, help='Runs per variant; the best is reported')
+
+    def _best(self, func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = func()
+            timings.append(time.perf_counter() - start)
+        return min(timings), result
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        listings = [
+            ('events', EventSerializer, Event.objects.order_by('-start_date'), EVENT_LIST),
+            ('gallery', GalleryItemSerializer, GalleryItem.objects.order_by('-created_at'), GALLERY_LIST),
+            ('testimonials', TestimonialSerializer, Testimonial.objects.order_by('-created_at'), TESTIMONIAL_LIST),
+            ('testimonials (website)', TestimonialSerializer, Testimonial.objects.order_by('-created_at'), TESTIMONIAL_CARD),
+            ('blog', BlogPostSerializer, BlogPost.objects.order_by('-created_at'), BLOG_LIST),
+            ('blog (website)', BlogPostSerializer, BlogPost.objects.order_by('-created_at'), BLOG_CARD),
+        ]
+
+        with transaction.atomic():
+            seed(options['rows'])
+            for label, serializer_class, queryset, projection in listings:
+                slow, expected = self._best(lambda: serializer_class(queryset.all(), many=True).data, repeat)
+                fast, rows = self._best(lambda: projection.rows(queryset.all()), repeat)
+                # Full projections must match the serializer; cards a subset of it
+                expected = [{name: row[name] for name in projection.fields} for row in expected]
+                if rows != expected:
+                    raise CommandError(f'{label}: projection output differs from {serializer_class.__name__}')
+                self.stdout.write(
+                    f'  {label:<24} serializer {slow * 1000:8.1f} ms   projection {fast * 1000:8.1f} ms   '
+                    f'x{slow / fast:5.1f}   {len(projection.fields)} columns'
+                )
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS(f'{options["rows"]} rows per listing, seeded rows rolled back'))
@@ -0,0 +1,85 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import BlogPost, RelatedPost
+from core.related import (
+    RELATED_COUNT, densify, load_documents, nearest, refresh_related, store, store_index, vectorize,
+)
+
+TOPICS = {
+    'Worship': 'praise worship hymn choir singing thanksgiving altar spirit glory',
+    'Youth': 'youth camp rally leadership mentoring talents career students guild',
+    'Bible Study': 'scripture gospel parable apostle covenant prophecy psalms epistle',
+    'Outreach': 'evangelism community charity hospital visit donation widows orphans',
+    'Prayer': 'prayer fasting intercession vigil revival healing deliverance faith',
+}
+
+
+def seed(posts, words, rng):
+    """Published posts drawn mostly from one topic each, plus shared filler."""
+    # Letters only: the tokenizer ignores digits
+    filler = [''.join(rng.choices('abcdefghijklmnopqrstuvwxyz', k=7)) for _ in range(20000)]
+    topics = {name: vocabulary.split() for name, vocabulary in TOPICS.items()}
+    today = timezone.now().date()
+    BlogPost.objects.bulk_create(
+        BlogPost(
+            title=f'{category} {" ".join(rng.choices(topics[category], k=3))}',
+            slug=f'bench-related-{i}',
+            category=category,
+            content=' '.join(
+                rng.choice(topics[category]) if rng.random() < 0.3 else rng.choice(filler) for _ in range(words)
+            ),
+            is_published=True,
+            date=today,
+        )
+        for i, category in ((i, rng.choice(list(topics))) for i in range(posts))
+    )
+
+
+class Command(BaseCommand):
+    help = 'Time a full related-posts rebuild and an incremental refresh (seeded posts are rolled back)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', type=int, default=10000, help='Published posts to seed')
+        parser.add_argument('--words', type=int, default=300, help='Words of content per post')
+        parser.add_argument('--count', type=int, default=RELATED_COUNT, help='Related posts kept per post')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        if RelatedPost.objects.exists() or BlogPost.objects.exists():
+            raise CommandError('Run against an empty database: the timings assume only the seeded posts')
+
+        timings = {}
+
+        def timed(label, func, *args):
+            start = time.perf_counter()
+            result = func(*args)
+            timings[label] = time.perf_counter() - start
+            return result
+
+        with transaction.atomic():
+            seed(options['posts'], options['words'], random.Random(options['seed']))
+            ids, documents = timed('load + tokenize', load_documents)
+            vocabulary, idf, vectors = timed('vectorize', vectorize, documents)
+            timed('store index', store_index, ids, vocabulary, idf, vectors)
+            matrix = densify(vectors, len(vocabulary))
+            neighbours = timed('nearest neighbours', nearest, matrix, range(len(ids)), options['count'])
+            lists = {ids[row]: [(ids[other], score) for other, score in entries] for row, entries in neighbours.items()}
+            timed('store lists', store, lists)
+            post = BlogPost.objects.get(pk=ids[len(ids) // 2])
+            post.content += ' revival revival healing'
+            post.save()
+            recomputed = timed('refresh one post', refresh_related, [post.pk], options['count'])
+            transaction.set_rollback(True)
+
+        for label, seconds in timings.items():
+            self.stdout.write(f'  {label:<20} {seconds * 1000:10.1f} ms')
+        rebuild = sum(seconds for label, seconds in timings.items() if label != 'refresh one post')
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(ids)} posts, {len(vocabulary)} terms: full rebuild {rebuild:.2f} s, '
+            f'refresh recomputed {recomputed} list(s); seeded posts rolled back'
+        ))
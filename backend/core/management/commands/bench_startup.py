@@ -0,0 +1,106 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# What a fresh worker does before it can serve the first request
+STARTUP_SCRIPT = 'import django; django.setup(); import ypg_backend.urls'
+
+# Then the first health check (render.yaml healthCheckPath) and URL reversal,
+# which populates the resolver; prints the modules loaded by then
+HEALTH_CHECK_SCRIPT = (
+    'import json, sys, django; django.setup(); '
+    'from django.test import Client; from django.urls import reverse; '
+    "reverse('api_team_members'); Client(HTTP_HOST='localhost').get('/admin/'); "
+    'print(json.dumps(sorted(sys.modules)))'
+)
+
+# Modules that should only load when an endpoint actually needs them
+DEFERRED_MODULES = ('requests', 'PIL', 'boto3', 'botocore', 'storages.backends.s3boto3', 'core.serializers', 'numpy')
+
+
+def _startup_env():
+    return {**os.environ, 'DJANGO_SETTINGS_MODULE': os.environ.get('DJANGO_SETTINGS_MODULE', 'ypg_backend.settings')}
+
+
+def measure_startup():
+    """Run the startup in a fresh interpreter with ``-X importtime``.
+
+    Returns ``(seconds, {module: cumulative_us})`` for the top-level imports.
+    """
+    env = _startup_env()
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP_SCRIPT],
+        cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise CommandError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'startup failed')
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        # "import time:   self [us] |  cumulative | imported package"
+        if not line.startswith('import time:'):
+            continue
+        _self_us, cumulative, name = line[len('import time:'):].split('|')
+        if not cumulative.strip().isdigit():
+            continue
+        # One separator space, then two more per nesting level
+        modules[name[1:].rstrip()] = int(cumulative)
+    return elapsed, modules
+
+
+def modules_after_health_check():
+    """Modules a fresh interpreter has loaded after reverse() and GET /admin/."""
+    result = subprocess.run(
+        [sys.executable, '-c', HEALTH_CHECK_SCRIPT],
+        cwd=settings.BASE_DIR, env=_startup_env(), capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise CommandError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else 'health check failed')
+    return set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+def deferred_loaded(modules):
+    """The DEFERRED_MODULES and sync view modules among ``modules``."""
+    return sorted(
+        name for name in modules
+        if name in DEFERRED_MODULES or name == 'core.views' or name.startswith('core.views.')
+    )
+
+
+class Command(BaseCommand):
+    help = 'Measure cold-start import time of the Django app (python -X importtime)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=3, help='Fresh interpreters to start; the best run is reported')
+        parser.add_argument('--top', type=int, default=15, help='Slowest top-level imports to list')
+        parser.add_argument('--budget-ms', type=float, default=None,
+                            help=f'Fail when startup exceeds this (default STARTUP_BUDGET_MS={settings.STARTUP_BUDGET_MS})')
+
+    def handle(self, *args, **options):
+        budget = options['budget_ms'] if options['budget_ms'] is not None else settings.STARTUP_BUDGET_MS
+        runs = [measure_startup() for _ in range(max(1, options['runs']))]
+        elapsed, modules = min(runs, key=lambda run: run[0])
+
+        # Top-level entries carry no indentation in the importtime tree
+        top_level = [(name, us) for name, us in modules.items() if not name.startswith(' ')]
+        top_level.sort(key=lambda item: item[1], reverse=True)
+        for name, us in top_level[:options['top']]:
+            self.stdout.write(f'  {name.strip():<45} {us / 1000:8.1f} ms')
+
+        loaded = [name for name in DEFERRED_MODULES if name in {m.strip() for m in modules}]
+        self.stdout.write(f'{len(modules)} modules imported, deferred modules loaded at startup: {", ".join(loaded) or "none"}')
+
+        after_health_check = deferred_loaded(modules_after_health_check())
+        self.stdout.write(f'Deferred modules loaded by the first health check: {", ".join(after_health_check) or "none"}')
+
+        summary = f'Startup {elapsed * 1000:.0f} ms (budget {budget:.0f} ms, best of {len(runs)})'
+        if elapsed * 1000 > budget:
+            raise CommandError(summary)
+        self.stdout.write(self.style.SUCCESS(summary))
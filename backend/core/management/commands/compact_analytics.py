@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.rollups import compact
+
+
+class Command(BaseCommand):
+    help = 'Roll daily analytics into week and month buckets and prune old hourly buckets'
+
+    def handle(self, *args, **options):
+        result = compact()
+        self.stdout.write(self.style.SUCCESS(
+            f"Compacted {result['week']} week(s) and {result['month']} month(s), "
+            f"pruned {result['pruned']} hourly bucket(s)"
+        ))
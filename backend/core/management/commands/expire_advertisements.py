@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models import Advertisement
+
+
+class Command(BaseCommand):
+    help = 'Mark approved advertisements past their expiry date as expired'
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        expired = Advertisement.objects.lapsed(now).update(status='expired', updated_at=now)
+        self.stdout.write(self.style.SUCCESS(f'Expired {expired} advertisement(s)'))
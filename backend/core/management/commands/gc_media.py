@@ -0,0 +1,153 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.apps import apps
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import models
+from django.utils import timezone
+
+from core.models import Advertisement
+
+QUARANTINE_PREFIX = '_quarantine'
+
+
+def referenced_media_paths():
+    """Collect every storage path still referenced by the database.
+
+    Covers every FileField/ImageField on every installed model plus the
+    image metadata stored inside ``Advertisement.images``.
+    """
+    referenced = set()
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if not isinstance(field, models.FileField):
+                continue
+            names = (
+                model._default_manager
+                .exclude(**{field.attname: ''})
+                .exclude(**{f'{field.attname}__isnull': True})
+                .values_list(field.attname, flat=True)
+                .iterator()
+            )
+            referenced.update(names)
+
+    for images in Advertisement.objects.values_list('images', flat=True).iterator():
+        for image in images or []:
+            if not isinstance(image, dict):
+                continue
+            path = image.get('path') or _path_from_url(image.get('url'))
+            if path:
+                referenced.add(path)
+    return referenced
+
+
+def _path_from_url(url):
+    if not url:
+        return None
+    media_url = settings.MEDIA_URL or ''
+    if media_url and url.startswith(media_url):
+        return url[len(media_url):]
+    return None
+
+
+def iter_storage_files(storage=default_storage):
+    """Yield ``(name, modified_time)`` for every file in ``storage``.
+
+    S3 buckets are listed page by page through the boto3 collection so a
+    large bucket never has to be held in memory; the local filesystem is
+    walked directly.
+    """
+    bucket = getattr(storage, 'bucket', None)
+    if bucket is not None:
+        location = (getattr(storage, 'location', '') or '').strip('/')
+        prefix = f'{location}/' if location else ''
+        for obj in bucket.objects.filter(Prefix=prefix).page_size(1000):
+            name = obj.key[len(prefix):]
+            if name and not name.endswith('/'):
+                yield name, obj.last_modified
+        return
+
+    root = getattr(storage, 'location', None)
+    if root and os.path.isdir(root):
+        for dirpath, _dirnames, filenames in os.walk(root):
+            for filename in filenames:
+                full_path = os.path.join(dirpath, filename)
+                name = os.path.relpath(full_path, root).replace(os.sep, '/')
+                modified = datetime.fromtimestamp(os.path.getmtime(full_path), tz=dt_timezone.utc)
+                yield name, modified
+        return
+
+    yield from _walk_listdir(storage, '')
+
+
+def _walk_listdir(storage, path):
+    directories, files = storage.listdir(path)
+    for filename in files:
+        name = f'{path}/{filename}' if path else filename
+        yield name, storage.get_modified_time(name)
+    for directory in directories:
+        yield from _walk_listdir(storage, f'{path}/{directory}' if path else directory)
+
+
+class Command(BaseCommand):
+    help = 'Delete or quarantine media files that no database row references'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='List orphaned files without touching them')
+        parser.add_argument('--min-age-hours', type=float, default=24,
+                            help='Only collect files older than this, so in-flight uploads are never removed')
+        parser.add_argument('--quarantine', action='store_true',
+                            help=f'Move orphans under {QUARANTINE_PREFIX}/ instead of deleting them')
+        parser.add_argument('--workers', type=int, default=8, help='Parallel delete/move workers')
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+        quarantine = options['quarantine']
+        cutoff = timezone.now() - timedelta(hours=options['min_age_hours'])
+        stamp = timezone.now().strftime('%Y%m%d%H%M%S')
+
+        referenced = referenced_media_paths()
+        self.stdout.write(f'{len(referenced)} referenced media paths')
+
+        orphans = []
+        scanned = 0
+        for name, modified in iter_storage_files(default_storage):
+            scanned += 1
+            if name.startswith(f'{QUARANTINE_PREFIX}/') or name in referenced:
+                continue
+            if modified is not None and timezone.is_naive(modified):
+                modified = timezone.make_aware(modified, dt_timezone.utc)
+            if modified is not None and modified > cutoff:
+                continue
+            orphans.append(name)
+
+        self.stdout.write(f'Scanned {scanned} files, {len(orphans)} orphaned')
+        if dry_run:
+            for name in orphans:
+                self.stdout.write(f'  would {"quarantine" if quarantine else "delete"}: {name}')
+            self.stdout.write(self.style.WARNING('Dry run: no files were changed'))
+            return
+
+        def collect(name):
+            try:
+                if quarantine:
+                    target = f'{QUARANTINE_PREFIX}/{stamp}/{name}'
+                    with default_storage.open(name, 'rb') as source:
+                        default_storage.save(target, source)
+                default_storage.delete(name)
+                return name, None
+            except Exception as e:
+                return name, e
+
+        failed = 0
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as pool:
+            for name, error in pool.map(collect, orphans):
+                if error is not None:
+                    failed += 1
+                    self.stdout.write(self.style.ERROR(f'  failed: {name}: {error}'))
+
+        action = 'Quarantined' if quarantine else 'Deleted'
+        self.stdout.write(self.style.SUCCESS(f'{action} {len(orphans) - failed} orphaned files'))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.related import RELATED_COUNT, rebuild_related
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the precomputed related-posts lists for every published blog post'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=RELATED_COUNT, help='Related posts kept per post')
+
+    def handle(self, *args, **options):
+        posts, rewritten = rebuild_related(options['count'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {posts} post(s), {rewritten} list(s) rewritten'))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from core.stats import reconcile_site_stats
+
+
+class Command(BaseCommand):
+    help = 'Recompute the SiteStats totals exactly and report any drift'
+
+    def handle(self, *args, **options):
+        stats, drift = reconcile_site_stats()
+        for field, (stored, exact) in sorted(drift.items()):
+            self.stdout.write(f'  {field}: {stored} -> {exact}')
+        self.stdout.write(self.style.SUCCESS(f'Site stats reconciled, {len(drift)} counter(s) corrected'))
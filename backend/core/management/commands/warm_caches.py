@@ -0,0 +1,33 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.warmup import warm_caches
+
+
+class Command(BaseCommand):
+    help = 'Pre-build cached public listings, settings and dashboard summaries'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--budget', type=float, default=None,
+                            help='Seconds to wait before leaving unfinished entries to the background '
+                                 f'(default WARM_CACHES_BUDGET_SECONDS={settings.WARM_CACHES_BUDGET_SECONDS})')
+        parser.add_argument('--workers', type=int, default=4, help='Entries built in parallel (0 builds them one by one in-process)')
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        results = warm_caches(budget=options['budget'], workers=options['workers'])
+
+        warmed = 0
+        for label, seconds, error in results:
+            if error is not None:
+                self.stdout.write(self.style.ERROR(f'  {label:<45} failed: {error}'))
+            elif seconds is None:
+                self.stdout.write(self.style.WARNING(f'  {label:<45} still building (over budget)'))
+            else:
+                warmed += 1
+                self.stdout.write(f'  {label:<45} {seconds * 1000:8.1f} ms')
+
+        elapsed = time.perf_counter() - start
+        self.stdout.write(self.style.SUCCESS(f'Warmed {warmed}/{len(results)} cache entries in {elapsed:.2f}s'))
@@ -0,0 +1,179 @@
+"""
+Serve uploaded media from MEDIA_ROOT when S3 isn't configured.
+
+Replaces django.views.static.serve for /media/: single byte ranges (206) so
+gallery videos can seek, strong ETags and long-lived immutable caching
+(uploads get unique names, so a URL never changes content), and conditional
+304s. With MEDIA_ACCEL set the bytes are handed to the front proxy
+(nginx X-Accel-Redirect or Apache/lighttpd X-Sendfile); otherwise a
+FileResponse lets gunicorn's file wrapper use sendfile().
+"""
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+from django.views.decorators.http import require_safe
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+CHUNK_SIZE = 64 * 1024
+
+
+def make_etag(stat):
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+def parse_range(header, size):
+    """Return ``(start, end)`` (inclusive) for a single byte range.
+
+    Returns None when the header should be ignored (absent, malformed or
+    several ranges, which we answer with the whole file), and ``(None, None)``
+    when the range cannot be satisfied.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            return None, None
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        return None, None
+    return start, end
+
+
+def _if_range_passes(request, etag, last_modified):
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+class FileRange:
+    """File object limited to ``length`` bytes from ``start``.
+
+    ``fileno()`` exposes the real descriptor, positioned at ``start``, so a
+    WSGI file wrapper can sendfile() the range bounded by Content-Length.
+    """
+
+    def __init__(self, file, start, length):
+        self.file = file
+        self.remaining = length
+        file.seek(start)
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+async def _aiter_file(filelike):
+    read = sync_to_async(filelike.read, thread_sensitive=False)
+    try:
+        while chunk := await read(CHUNK_SIZE):
+            yield chunk
+    finally:
+        filelike.close()
+
+
+def _accel_headers(path, fullpath):
+    mode = getattr(settings, 'MEDIA_ACCEL', '')
+    if mode == 'x-accel-redirect':
+        return {'X-Accel-Redirect': quote(settings.MEDIA_ACCEL_PREFIX.rstrip('/') + '/' + path)}
+    if mode == 'x-sendfile':
+        return {'X-Sendfile': fullpath}
+    return None
+
+
+@require_safe
+def serve_media(request, path):
+    # safe_join raises SuspiciousFileOperation (400) for paths escaping MEDIA_ROOT
+    fullpath = safe_join(settings.MEDIA_ROOT, path)
+    try:
+        stat = os.stat(fullpath)
+    except (FileNotFoundError, NotADirectoryError):
+        raise Http404('Not found')
+    if not os.path.isfile(fullpath):
+        raise Http404('Not found')
+
+    etag = make_etag(stat)
+    last_modified = int(stat.st_mtime)
+    content_type, encoding = mimetypes.guess_type(fullpath)
+    if encoding:
+        content_type = 'application/octet-stream'
+    headers = {
+        'ETag': etag,
+        'Last-Modified': http_date(last_modified),
+        'Cache-Control': f'public, max-age={settings.MEDIA_CACHE_MAX_AGE}, immutable',
+        'Accept-Ranges': 'bytes',
+    }
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        for name, value in headers.items():
+            not_modified[name] = value
+        return not_modified
+
+    accel = _accel_headers(path, fullpath)
+    if accel is not None:
+        # The proxy handles Range and sends the bytes itself
+        response = HttpResponse(content_type=content_type or 'application/octet-stream')
+        for name, value in {**headers, **accel}.items():
+            response[name] = value
+        return response
+
+    size = stat.st_size
+    byte_range = None
+    if _if_range_passes(request, etag, last_modified):
+        byte_range = parse_range(request.META.get('HTTP_RANGE'), size)
+    if byte_range == (None, None):
+        response = HttpResponse(status=416)
+        response['Content-Range'] = f'bytes */{size}'
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+    start, end = byte_range or (0, size - 1)
+    length = end - start + 1 if size else 0
+    if request.method == 'HEAD':
+        response = HttpResponse()
+    else:
+        filelike = FileRange(open(fullpath, 'rb'), start, length)
+        if isinstance(request, ASGIRequest):
+            response = StreamingHttpResponse(_aiter_file(filelike))
+        else:
+            response = FileResponse(filelike)
+    if byte_range is not None:
+        response.status_code = 206
+        response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    response['Content-Type'] = content_type or 'application/octet-stream'
+    response['Content-Length'] = str(length)
+    for name, value in headers.items():
+        response[name] = value
+    return response
@@ -0,0 +1,317 @@
+"""
+In-process metrics registry exposed in Prometheus text format.
+
+``MetricsMiddleware`` records per-route request counts, latency histograms
+and DB query counts/time; ``timed('smtp')`` style blocks record the
+duration of outbound SMTP, SMS and storage calls.
+
+Each gunicorn worker keeps its own registry. ``METRICS_MODE`` controls how
+``/api/metrics/`` sees all of them:
+
+* ``local`` (default): only the worker that served the scrape.
+* ``directory``: every worker snapshots its registry to
+  ``METRICS_DIR/<host>-<pid>.json`` and the endpoint sums all snapshots.
+* ``cache``: same, but snapshots live in the shared Django cache.
+"""
+import hmac
+import json
+import os
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRIC_HELP = {
+    'ypg_http_requests_total': ('counter', 'HTTP requests by route, method and status'),
+    'ypg_http_request_duration_seconds': ('histogram', 'HTTP request latency by route'),
+    'ypg_db_queries_total': ('counter', 'Database queries executed, by route'),
+    'ypg_db_query_duration_seconds_total': ('counter', 'Time spent in database queries, by route'),
+    'ypg_external_call_duration_seconds': ('histogram', 'Outbound SMTP/SMS/storage call latency'),
+    'ypg_external_call_errors_total': ('counter', 'Outbound SMTP/SMS/storage calls that raised'),
+}
+
+CACHE_INDEX_KEY = 'metrics_snapshot_index'
+
+
+class MetricsRegistry:
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+        self._last_flush = 0.0
+
+    def inc(self, name, labels, amount=1):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, labels, value):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = {
+                    'buckets': [0] * len(self.buckets), 'sum': 0.0, 'count': 0,
+                }
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram['buckets'][i] += 1
+                    break
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'buckets': list(self.buckets),
+                'counters': [[name, list(map(list, labels)), value]
+                             for (name, labels), value in self.counters.items()],
+                'histograms': [[name, list(map(list, labels)), dict(h, buckets=list(h['buckets']))]
+                               for (name, labels), h in self.histograms.items()],
+            }
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    # Multi-process aggregation
+
+    def maybe_flush(self, force=False):
+        mode = getattr(settings, 'METRICS_MODE', 'local')
+        if mode == 'local':
+            return
+        interval = getattr(settings, 'METRICS_FLUSH_SECONDS', 5)
+        now = time.monotonic()
+        if not force and now - self._last_flush < interval:
+            return
+        self._last_flush = now
+        data = self.snapshot()
+        if mode == 'directory':
+            directory = settings.METRICS_DIR
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f'{_process_id()}.json')
+            temp_path = f'{path}.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(temp_path, path)
+        elif mode == 'cache':
+            key = f'metrics_snapshot_{_process_id()}'
+            cache.set(key, data, None)
+            index = cache.get(CACHE_INDEX_KEY) or []
+            if key not in index:
+                cache.set(CACHE_INDEX_KEY, index + [key], None)
+
+    def collect_snapshots(self):
+        """Snapshots of every worker that should appear in a scrape."""
+        mode = getattr(settings, 'METRICS_MODE', 'local')
+        if mode == 'local':
+            return [self.snapshot()]
+        self.maybe_flush(force=True)
+        snapshots = []
+        if mode == 'directory':
+            directory = settings.METRICS_DIR
+            for filename in sorted(os.listdir(directory)):
+                if filename.endswith('.json'):
+                    try:
+                        with open(os.path.join(directory, filename), encoding='utf-8') as f:
+                            snapshots.append(json.load(f))
+                    except (OSError, ValueError):
+                        continue
+        elif mode == 'cache':
+            keys = cache.get(CACHE_INDEX_KEY) or []
+            snapshots.extend(v for v in cache.get_many(keys).values() if v)
+        return snapshots
+
+
+def _process_id():
+    return f'{socket.gethostname()}-{os.getpid()}'
+
+
+def merge_snapshots(snapshots):
+    counters = {}
+    histograms = {}
+    buckets = list(DEFAULT_BUCKETS)
+    for snapshot in snapshots:
+        buckets = snapshot.get('buckets', buckets)
+        for name, labels, value in snapshot['counters']:
+            key = (name, tuple(map(tuple, labels)))
+            counters[key] = counters.get(key, 0) + value
+        for name, labels, histogram in snapshot['histograms']:
+            key = (name, tuple(map(tuple, labels)))
+            merged = histograms.setdefault(key, {'buckets': [0] * len(buckets), 'sum': 0.0, 'count': 0})
+            merged['buckets'] = [a + b for a, b in zip(merged['buckets'], histogram['buckets'])]
+            merged['sum'] += histogram['sum']
+            merged['count'] += histogram['count']
+    return buckets, counters, histograms
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+
+def _format_number(value):
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+def render_prometheus(snapshots):
+    buckets, counters, histograms = merge_snapshots(snapshots)
+    lines = []
+    names = sorted({name for name, _ in counters} | {name for name, _ in histograms})
+    for name in names:
+        kind, help_text = METRIC_HELP.get(name, ('untyped', name))
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        for (metric, labels), value in sorted(counters.items()):
+            if metric == name:
+                lines.append(f'{name}{_format_labels(labels)} {_format_number(value)}')
+        for (metric, labels), histogram in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0
+            for bound, count in zip(buckets, histogram['buckets']):
+                cumulative += count
+                lines.append(f'{name}_bucket{_format_labels(labels, [("le", repr(float(bound)))])} {cumulative}')
+            lines.append(f'{name}_bucket{_format_labels(labels, [("le", "+Inf")])} {histogram["count"]}')
+            lines.append(f'{name}_sum{_format_labels(labels)} {_format_number(histogram["sum"])}')
+            lines.append(f'{name}_count{_format_labels(labels)} {histogram["count"]}')
+    return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()
+
+
+@contextmanager
+def timed(service, operation=''):
+    """Record how long an outbound call to ``service`` takes."""
+    labels = {'service': service, 'operation': operation}
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        registry.inc('ypg_external_call_errors_total', labels)
+        raise
+    finally:
+        registry.observe('ypg_external_call_duration_seconds', labels, time.perf_counter() - start)
+
+
+# Query capture. A wrapper installed on every connection (see
+# CoreConfig.ready) reports each statement to the listeners of the current
+# context. Context variables follow a request from an async view into the
+# sync_to_async thread its ORM calls run in, so capture works under both
+# WSGI and ASGI, unlike a per-connection execute_wrapper() block.
+_query_listeners = ContextVar('ypg_query_listeners', default=())
+
+
+def record_query(execute, sql, params, many, context):
+    listeners = _query_listeners.get()
+    if not listeners:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - start
+        for listener in listeners:
+            listener(sql, elapsed, many)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_query)
+
+
+@contextmanager
+def capture_queries(listener):
+    """Call ``listener(sql, seconds, many)`` for every query in this block."""
+    token = _query_listeners.set(_query_listeners.get() + (listener,))
+    try:
+        yield
+    finally:
+        _query_listeners.reset(token)
+
+
+class MetricsMiddleware:
+    """Times each request and counts the SQL it runs, labelled by URL route."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        queries = {'count': 0, 'seconds': 0.0}
+        start = time.perf_counter()
+        with capture_queries(self._counter(queries)):
+            response = self.get_response(request)
+        self._record(request, response, time.perf_counter() - start, queries)
+        return response
+
+    async def __acall__(self, request):
+        queries = {'count': 0, 'seconds': 0.0}
+        start = time.perf_counter()
+        with capture_queries(self._counter(queries)):
+            response = await self.get_response(request)
+        self._record(request, response, time.perf_counter() - start, queries)
+        return response
+
+    @staticmethod
+    def _counter(queries):
+        def count_query(sql, seconds, many):
+            queries['count'] += 1
+            queries['seconds'] += seconds
+        return count_query
+
+    def _record(self, request, response, elapsed, queries):
+        match = getattr(request, 'resolver_match', None)
+        route = match.route if match is not None and match.route else 'unmatched'
+        registry.inc('ypg_http_requests_total', {
+            'route': route, 'method': request.method, 'status': str(response.status_code),
+        })
+        registry.observe('ypg_http_request_duration_seconds', {'route': route, 'method': request.method}, elapsed)
+        registry.inc('ypg_db_queries_total', {'route': route}, queries['count'])
+        registry.inc('ypg_db_query_duration_seconds_total', {'route': route}, queries['seconds'])
+        registry.maybe_flush()
+
+
+def _metrics_authorized(request):
+    token = getattr(settings, 'METRICS_TOKEN', '')
+    auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+    # Bytes: compare_digest rejects non-ASCII str, and the header is client input
+    if token and hmac.compare_digest(auth_header.encode('utf-8'), f'Bearer {token}'.encode('utf-8')):
+        return True
+    if request.user.is_authenticated:
+        from .models import Supervisor
+        return Supervisor.objects.filter(user=request.user).exists()
+    return False
+
+
+def api_metrics(request):
+    """Prometheus scrape endpoint (supervisor session or METRICS_TOKEN bearer)."""
+    if not _metrics_authorized(request):
+        return HttpResponse('Authentication required\n', status=401, content_type='text/plain')
+    body = render_prometheus(registry.collect_snapshots())
+    return HttpResponse(body, content_type='text/plain; version=0.0.4; charset=utf-8')
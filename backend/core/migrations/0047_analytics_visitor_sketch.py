@@ -0,0 +1,43 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:17
+
+from django.db import migrations, models
+
+
+def compact_daily_visits(apps, schema_editor):
+    """Fold every DailyVisit row into its day's HyperLogLog sketch."""
+    from core.hll import HyperLogLog
+
+    Analytics = apps.get_model('core', 'Analytics')
+    DailyVisit = apps.get_model('core', 'DailyVisit')
+
+    dates = DailyVisit.objects.values_list('date', flat=True).distinct()
+    for date in dates.iterator():
+        sketch = HyperLogLog()
+        device_ids = DailyVisit.objects.filter(date=date).values_list('device_id', flat=True)
+        for device_id in device_ids.iterator():
+            sketch.add(device_id)
+        analytics, created = Analytics.objects.get_or_create(date=date)
+        analytics.visitor_sketch = sketch.to_bytes()
+        # Keep the exact historical count when one was already recorded
+        if not analytics.unique_visitors:
+            analytics.unique_visitors = sketch.count()
+        analytics.save(update_fields=['visitor_sketch', 'unique_visitors'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0046_advertisement_expiry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='analytics',
+            name='visitor_sketch',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.RunPython(compact_daily_visits, migrations.RunPython.noop),
+        migrations.DeleteModel(
+            name='DailyVisit',
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0047_analytics_visitor_sketch'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='galleryitem',
+            index=models.Index(fields=['category', '-created_at'], name='core_gallery_category_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryitem',
+            index=models.Index(fields=['congregation', '-created_at'], name='core_gallery_congregation_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryitem',
+            index=models.Index(fields=['date'], name='core_gallery_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='galleryitem',
+            index=models.Index(fields=['is_featured', '-created_at'], name='core_gallery_featured_idx'),
+        ),
+    ]
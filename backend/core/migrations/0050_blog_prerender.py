@@ -0,0 +1,46 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:47
+
+from django.db import migrations, models
+
+
+def render_existing_posts(apps, schema_editor):
+    """Fill the rendered columns for posts written before they existed."""
+    from core.blog_content import summarize
+
+    BlogPost = apps.get_model('core', 'BlogPost')
+    posts = BlogPost.objects.only('pk', 'content', 'excerpt')
+    for post in posts.iterator():
+        for name, value in summarize(post.content, post.excerpt).items():
+            setattr(post, name, value)
+        post.save(update_fields=['content_html', 'summary', 'word_count', 'reading_time'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0049_event_range_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blogpost',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='reading_time',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='summary',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.AddField(
+            model_name='blogpost',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(render_existing_posts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0051_related_posts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SiteStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('events', models.IntegerField(default=0)),
+                ('active_events', models.IntegerField(default=0)),
+                ('team_members', models.IntegerField(default=0)),
+                ('active_team_members', models.IntegerField(default=0)),
+                ('published_blog_posts', models.IntegerField(default=0)),
+                ('active_testimonials', models.IntegerField(default=0)),
+                ('ministry_registrations', models.IntegerField(default=0)),
+                ('contact_messages', models.IntegerField(default=0)),
+                ('verified_donations', models.IntegerField(default=0)),
+                ('verified_donation_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Site Stats',
+                'verbose_name_plural': 'Site Stats',
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.5 on 2026-10-19 18:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0052_site_stats'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='advertisement',
+            index=models.Index(condition=models.Q(('status', 'pending')), fields=['-created_at'], name='core_ad_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('is_read', False)), fields=['-created_at'], name='core_contact_unread_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='donation',
+            index=models.Index(condition=models.Q(('payment_status', 'pending')), fields=['-created_at'], name='core_donation_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ministryregistration',
+            index=models.Index(condition=models.Q(('is_approved', False)), fields=['-created_at'], name='core_registration_pending_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(condition=models.Q(('is_deleted', False), ('status', 'pending')), fields=['-created_at'], name='core_testimonial_pending_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0054_dashboard_sync'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('hour', 'Hour'), ('week', 'Week'), ('month', 'Month')], max_length=5)),
+                ('period_start', models.DateTimeField()),
+                ('page_views', models.IntegerField(default=0)),
+                ('unique_visitors', models.IntegerField(default=0)),
+                ('donations_received', models.IntegerField(default=0)),
+                ('contact_submissions', models.IntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('granularity', 'period_start'), name='core_rollup_period_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.5 on 2026-10-19 19:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0055_analytics_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlogPostVector',
+            fields=[
+                ('post', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='tfidf_vector', serialize=False, to='core.blogpost')),
+                ('columns', models.BinaryField()),
+                ('weights', models.BinaryField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RelatedTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100, unique=True)),
+                ('column', models.PositiveIntegerField(unique=True)),
+                ('idf', models.FloatField()),
+            ],
+        ),
+    ]
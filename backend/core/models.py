@@ -34,6 +34,16 @@ class Supervisor(models.Model):
         verbose_name = "Supervisor"
         verbose_name_plural = "Supervisors"
 
+class EventQuerySet(models.QuerySet):
+    def overlapping(self, start=None, end=None):
+        """Events running at any time in [start, end); either bound may be None."""
+        events = self
+        if start is not None:
+            events = events.filter(end_date__gte=start)
+        if end is not None:
+            events = events.filter(start_date__lt=end)
+        return events
+
 class Event(models.Model):
     title = models.CharField(max_length=200)
     description = models.TextField()
@@ -48,6 +58,18 @@ class Event(models.Model):
     is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = EventQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Range queries (?from=&to=, calendar months) and upcoming/past
+            models.Index(fields=['start_date', 'end_date'], name='core_event_range_idx'),
+            models.Index(fields=['end_date'], name='core_event_end_idx'),
+            # Dashboard ?since= sync (core.changes)
+            models.Index(fields=['updated_at'], name='core_event_updated_idx'),
+        ]
 
 class TeamMember(models.Model):
     name = models.CharField(max_length=100)
@@ -64,6 +86,12 @@ class TeamMember(models.Model):
     is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at'], name='core_team_updated_idx'),
+        ]
 
 class Donation(models.Model):
     PAYMENT_STATUS_CHOICES = [
@@ -120,6 +148,16 @@ class Donation(models.Model):
     def __str__(self):
         return f"{self.donor_name} - {self.amount} {self.currency}"
 
+    class Meta:
+        indexes = [
+            # Pending-counts badge (core.payloads.PENDING_ITEMS)
+            models.Index(
+                fields=['-created_at'], name='core_donation_pending_idx',
+                condition=models.Q(payment_status='pending'),
+            ),
+            models.Index(fields=['updated_at'], name='core_donation_updated_idx'),
+        ]
+
 class ContactMessage(models.Model):
     name = models.CharField(max_length=100)
     email = models.EmailField()
@@ -129,6 +167,17 @@ class ContactMessage(models.Model):
     is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Pending-counts badge (core.payloads.PENDING_ITEMS)
+            models.Index(
+                fields=['-created_at'], name='core_contact_unread_idx',
+                condition=models.Q(is_read=False, is_deleted=False),
+            ),
+            models.Index(fields=['updated_at'], name='core_contact_updated_idx'),
+        ]
 
 class MinistryRegistration(models.Model):
     name = models.CharField(max_length=100)
@@ -139,6 +188,15 @@ class MinistryRegistration(models.Model):
     is_approved = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Pending-counts badge (core.payloads.PENDING_ITEMS)
+            models.Index(
+                fields=['-created_at'], name='core_registration_pending_idx',
+                condition=models.Q(is_approved=False),
+            ),
+        ]
+
 class Ministry(models.Model):
     name = models.CharField(max_length=200)
     description = models.TextField()
@@ -154,6 +212,11 @@ class BlogPost(models.Model):
     slug = models.SlugField(unique=True, blank=True)
     content = models.TextField()
     excerpt = models.TextField(blank=True)
+    # Rendered from content on save (see core.blog_content)
+    content_html = models.TextField(blank=True, editable=False)
+    summary = models.TextField(blank=True, editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveIntegerField(default=0, editable=False)  # minutes
     author = models.CharField(max_length=100, default="YPG Leadership")
     category = models.CharField(max_length=50, default="General")
     date = models.DateField(blank=True, null=True)
@@ -166,18 +229,62 @@ class BlogPost(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    RENDERED_FIELDS = ('content_html', 'summary', 'word_count', 'reading_time')
+
+    def unique_slug(self, base):
+        """``base``, or ``base-N`` with the lowest free N, in one query."""
+        taken = set(
+            BlogPost.objects.filter(slug__startswith=base).exclude(pk=self.pk).values_list('slug', flat=True)
+        )
+        slug = base
+        counter = 1
+        while slug in taken:
+            slug = f"{base}-{counter}"
+            counter += 1
+        return slug
+
+    def render(self):
+        from .blog_content import summarize
+        for name, value in summarize(self.content, self.excerpt).items():
+            setattr(self, name, value)
+
     def save(self, *args, **kwargs):
         if not self.slug:
             from django.utils.text import slugify
-            self.slug = slugify(self.title)
-            # Ensure uniqueness
-            original_slug = self.slug
-            counter = 1
-            while BlogPost.objects.filter(slug=self.slug).exists():
-                self.slug = f"{original_slug}-{counter}"
-                counter += 1
+            self.slug = self.unique_slug(slugify(self.title))
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            self.render()
+        elif {'content', 'excerpt'} & set(update_fields):
+            self.render()
+            kwargs['update_fields'] = set(update_fields) | set(self.RENDERED_FIELDS)
         super().save(*args, **kwargs)
 
+class RelatedPost(models.Model):
+    """A precomputed nearest neighbour of a blog post (see core.related)."""
+    post = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='related_links')
+    related = models.ForeignKey(BlogPost, on_delete=models.CASCADE, related_name='related_from')
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        ordering = ['post', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['post', 'rank'], name='core_relatedpost_rank_uniq'),
+        ]
+
+class RelatedTerm(models.Model):
+    """A term of the related-posts vocabulary and its IDF (see core.related)."""
+    term = models.CharField(max_length=100, unique=True)
+    column = models.PositiveIntegerField(unique=True)
+    idf = models.FloatField()
+
+class BlogPostVector(models.Model):
+    """A published post's sparse TF-IDF vector over the RelatedTerm columns."""
+    post = models.OneToOneField(BlogPost, on_delete=models.CASCADE, primary_key=True, related_name='tfidf_vector')
+    columns = models.BinaryField()  # int32
+    weights = models.BinaryField()  # float32, L2-normalised
+
 class Testimonial(models.Model):
     STATUS_CHOICES = [
         ('pending', 'Pending'),
@@ -201,7 +308,48 @@ class Testimonial(models.Model):
     is_deleted = models.BooleanField(default=False)
     deleted_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Pending-counts badge (core.payloads.PENDING_ITEMS)
+            models.Index(
+                fields=['-created_at'], name='core_testimonial_pending_idx',
+                condition=models.Q(status='pending', is_deleted=False),
+            ),
+            models.Index(fields=['updated_at'], name='core_testimonial_updated_idx'),
+        ]
+
+class GalleryItemQuerySet(models.QuerySet):
+    def with_media_type(self):
+        """Annotate ``media_type``: an uploaded video wins over embeds, then the image."""
+        return self.annotate(media_type=models.Case(
+            models.When(~models.Q(video='') & models.Q(video__isnull=False), then=models.Value('video')),
+            models.When(~models.Q(youtube_url=''), then=models.Value('youtube')),
+            models.When(~models.Q(tiktok_url=''), then=models.Value('tiktok')),
+            default=models.Value('image'),
+            output_field=models.CharField(),
+        ))
+
+    def matching(self, category=None, congregation=None, date_from=None, date_to=None,
+                 featured=None, media_type=None):
+        """Items matching the gallery page filters; None means no filter."""
+        items = self
+        if category:
+            items = items.filter(category=category)
+        if congregation:
+            items = items.filter(congregation=congregation)
+        if date_from:
+            items = items.filter(date__gte=date_from)
+        if date_to:
+            items = items.filter(date__lte=date_to)
+        if featured is not None:
+            items = items.filter(is_featured=featured)
+        if media_type:
+            items = items.with_media_type().filter(media_type=media_type)
+        return items
+
 class GalleryItem(models.Model):
+    MEDIA_TYPES = ('image', 'video', 'youtube', 'tiktok')  # see GalleryItemQuerySet.with_media_type
+
     title = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     category = models.CharField(max_length=50)
@@ -213,6 +361,18 @@ class GalleryItem(models.Model):
     tiktok_url = models.URLField(blank=True)
     is_featured = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = GalleryItemQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['category', '-created_at'], name='core_gallery_category_idx'),
+            models.Index(fields=['congregation', '-created_at'], name='core_gallery_congregation_idx'),
+            models.Index(fields=['date'], name='core_gallery_date_idx'),
+            models.Index(fields=['is_featured', '-created_at'], name='core_gallery_featured_idx'),
+            models.Index(fields=['updated_at'], name='core_gallery_updated_idx'),
+        ]
 
 class Congregation(models.Model):
     name = models.CharField(max_length=200)
@@ -222,6 +382,12 @@ class Congregation(models.Model):
     email = models.EmailField(blank=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at'], name='core_congregation_updated_idx'),
+        ]
 
 class Analytics(models.Model):
     date = models.DateField(unique=True)
@@ -229,21 +395,110 @@ class Analytics(models.Model):
     unique_visitors = models.IntegerField(default=0)
     donations_received = models.IntegerField(default=0)
     contact_submissions = models.IntegerField(default=0)
+    # HyperLogLog sketch of the day's device ids (see core.hll)
+    visitor_sketch = models.BinaryField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         verbose_name_plural = "Analytics"
 
+    @staticmethod
+    def _sketch_cache_key(date):
+        return f"analytics_visitor_sketch_{date.isoformat()}"
 
-class DailyVisit(models.Model):
-    """Track daily visits per device to prevent duplicate counting"""
-    device_id = models.CharField(max_length=255)
-    date = models.DateField()
-    visited_at = models.DateTimeField(auto_now_add=True)
+    @classmethod
+    def record_visitor(cls, device_id, date):
+        """Add a device to the day's visitor sketch and refresh unique_visitors.
+
+        The sketch is kept in the shared cache so repeat visits are rejected
+        without touching the database; only visits that change a register
+        are merged into the persisted blob under a row lock. Returns how much
+        unique_visitors grew (usually 0 or 1), so the amounts returned over a
+        day add up to its count.
+        """
+        from django.core.cache import cache
+        from django.db import transaction
+        from .hll import HyperLogLog
+
+        cache_key = cls._sketch_cache_key(date)
+        cached = cache.get(cache_key)
+        if cached is not None and not HyperLogLog.from_bytes(cached).add(device_id):
+            return 0
+
+        with transaction.atomic():
+            analytics, created = cls.objects.select_for_update().get_or_create(date=date)
+            sketch = HyperLogLog.from_bytes(analytics.visitor_sketch)
+            if cached is not None:
+                sketch.merge(HyperLogLog.from_bytes(cached))
+            changed = sketch.add(device_id)
+            blob = sketch.to_bytes()
+            added = 0
+            if changed:
+                # A changed register is not always one more visitor once the
+                # day fills up; the growth of the estimate is
+                count = sketch.count()
+                added = count - analytics.unique_visitors
+                analytics.visitor_sketch = blob
+                analytics.unique_visitors = count
+                analytics.save(update_fields=['visitor_sketch', 'unique_visitors'])
+        cache.set(cache_key, blob, 60 * 60 * 48)
+        return added
+
+    @classmethod
+    def unique_visitors_between(cls, start, end):
+        """Estimated distinct visitors across every day in [start, end]."""
+        from .hll import HyperLogLog
+
+        blobs = cls.objects.filter(date__gte=start, date__lte=end).values_list('visitor_sketch', flat=True)
+        return HyperLogLog.union(blobs).count()
+
+class AnalyticsRollup(models.Model):
+    """Analytics counters per hour, week or month (see core.rollups; days are Analytics rows)"""
+    HOUR = 'hour'
+    WEEK = 'week'
+    MONTH = 'month'
+    GRANULARITY_CHOICES = [(HOUR, 'Hour'), (WEEK, 'Week'), (MONTH, 'Month')]
+
+    granularity = models.CharField(max_length=5, choices=GRANULARITY_CHOICES)
+    period_start = models.DateTimeField()
+    page_views = models.IntegerField(default=0)
+    unique_visitors = models.IntegerField(default=0)
+    donations_received = models.IntegerField(default=0)
+    contact_submissions = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['granularity', 'period_start'], name='core_rollup_period_uniq'),
+        ]
+
+class SiteStats(models.Model):
+    """Running totals for the dashboard and impact statistics (a single row, see core.stats)"""
+    events = models.IntegerField(default=0)
+    active_events = models.IntegerField(default=0)
+    team_members = models.IntegerField(default=0)
+    active_team_members = models.IntegerField(default=0)
+    published_blog_posts = models.IntegerField(default=0)
+    active_testimonials = models.IntegerField(default=0)
+    ministry_registrations = models.IntegerField(default=0)
+    contact_messages = models.IntegerField(default=0)
+    verified_donations = models.IntegerField(default=0)
+    verified_donation_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ('device_id', 'date')
-        verbose_name_plural = "Daily Visits"
+        verbose_name = "Site Stats"
+        verbose_name_plural = "Site Stats"
+
+class Tombstone(models.Model):
+    """A hard-deleted dashboard row, reported to ?since= list requests (see core.changes)"""
+    model = models.CharField(max_length=100)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['model', 'deleted_at'], name='core_tombstone_model_idx'),
+        ]
 
 class BranchPresident(models.Model):
     """
@@ -299,11 +554,21 @@ class PastExecutive(models.Model):
         verbose_name = "Past Executive"
         verbose_name_plural = "Past Executives"
 
+class AdvertisementQuerySet(models.QuerySet):
+    def public(self, now=None):
+        """Approved ads that have not reached their expiry date yet."""
+        return self.filter(status='approved', expires_at__gt=now or timezone.now())
+
+    def lapsed(self, now=None):
+        """Approved ads whose expiry date has passed but are still marked approved."""
+        return self.filter(status='approved', expires_at__lte=now or timezone.now())
+
 class Advertisement(models.Model):
     STATUS_CHOICES = [
         ('pending', 'Pending'),
         ('approved', 'Approved'),
         ('rejected', 'Rejected'),
+        ('expired', 'Expired'),
     ]
     
     CATEGORY_CHOICES = [
@@ -337,6 +602,8 @@ class Advertisement(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     expires_at = models.DateTimeField()
+
+    objects = AdvertisementQuerySet.as_manager()
     
     def __str__(self):
         return f"{self.title} - {self.advertiser_name}"
@@ -344,6 +611,14 @@ class Advertisement(models.Model):
     class Meta:
         verbose_name = "Advertisement"
         verbose_name_plural = "Advertisements"
+        indexes = [
+            models.Index(fields=['status', 'expires_at'], name='core_ad_status_expires_idx'),
+            models.Index(
+                fields=['-created_at'], name='core_ad_pending_idx',
+                condition=models.Q(status='pending'),
+            ),
+            models.Index(fields=['updated_at'], name='core_ad_updated_idx'),
+        ]
 
 class YStoreItem(models.Model):
     CATEGORY_CHOICES = [
@@ -399,6 +674,9 @@ class Sale(models.Model):
     class Meta:
         verbose_name = "Sale"
         verbose_name_plural = "Sales"
+        indexes = [
+            models.Index(fields=['updated_at'], name='core_sale_updated_idx'),
+        ]
 
 class Expense(models.Model):
     STATUS_CHOICES = [
@@ -432,6 +710,9 @@ class Expense(models.Model):
     class Meta:
         verbose_name = "Expense"
         verbose_name_plural = "Expenses"
+        indexes = [
+            models.Index(fields=['updated_at'], name='core_expense_updated_idx'),
+        ]
 
 class Contribution(models.Model):
     TYPE_CHOICES = [
@@ -485,6 +766,9 @@ class Contribution(models.Model):
     class Meta:
         verbose_name = "Contribution"
         verbose_name_plural = "Contributions"
+        indexes = [
+            models.Index(fields=['updated_at'], name='core_contribution_updated_idx'),
+        ]
 
 
 class Announcement(models.Model):
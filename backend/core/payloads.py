@@ -0,0 +1,650 @@
+"""
+Cached JSON payloads for the public read endpoints and dashboard summaries.
+
+Each payload is registered under a name with the models it is built from.
+Views read through ``get_payload()`` / ``aget_payload()``, keyed by the
+(normalized) query parameters. Saving or deleting any of those models bumps
+the payload's generation, so every cached variant is dropped at once, and
+``manage.py warm_caches`` rebuilds the common variants before the first
+visitor arrives. Listings take a ``fields``/``exclude`` fieldset (see
+core.fieldsets), which is part of the key like any other parameter.
+Dashboard lists also take ``since`` (core.changes); those variants are
+built fresh every time, as each is asked for once. Entries keep the time
+their build started, which ``get_stamped_payload()`` returns with the data
+so a cached list's ``synced_at`` never postdates it.
+
+Entries are protected against stampedes when they expire under load. Each
+is stored with a soft expiry (the payload timeout, minus up to
+PAYLOAD_TTL_JITTER of it so entries built together don't expire together)
+and kept PAYLOAD_STALE_SECONDS longer. Past the soft expiry one request
+takes a lock in the cache and rebuilds while the others keep getting the
+stale copy; on a miss the others wait for the lock holder's result (up to
+PAYLOAD_LOCK_WAIT_SECONDS) instead of running the same queries. With Redis
+the lock is shared by every worker; the memory cache only spans a process.
+
+Invalidation only reaches the workers that share the cache. With several
+workers on per-process memory caches (settings.SHARED_CACHE is False)
+entries are kept LOCAL_PAYLOAD_CACHE_SECONDS at most and never served
+stale, which bounds how long another worker's edit goes unseen.
+
+Payloads built with serializers take their rows from the per-row fragment
+cache (core.fragments), so a rebuild after one edit serializes one row.
+Serializers are imported inside the builders: they pull in DRF, which the
+async endpoints otherwise never need at startup.
+"""
+import asyncio
+import hashlib
+import inspect
+import math
+import random
+from datetime import datetime, time, timedelta
+from time import monotonic, sleep
+
+from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Sum, Value
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import (
+    Advertisement, Announcement, ContactMessage, Donation, Event, GalleryItem, Ministry,
+    MinistryRegistration, SocialMediaLink, TeamMember, Testimonial, WebsiteSettings,
+)
+from .fragments import serialize_list
+from .projections import EVENT_CALENDAR, EVENT_LIST, GALLERY_LIST, TESTIMONIAL_CARD, TESTIMONIAL_LIST
+from .stats import get_site_stats
+
+_registry = {}
+
+# Variants the website and dashboard actually request; warm_caches builds these.
+WARM_VARIANTS = [
+    ('events', {}),
+    ('events', {'type': 'upcoming', 'exclude_deleted': True}),
+    ('events', {'type': 'past', 'exclude_deleted': True}),
+    ('gallery', {}),
+    ('gallery_facets', {}),
+    ('announcements', {}),
+    ('testimonials', {}),
+    ('testimonials', {'for_website': True}),
+    ('ministries', {}),
+    ('team', {}),
+    ('council', {}),
+    ('social_media_links', {}),
+    ('website_settings', {}),
+    ('impact_statistics', {}),
+    ('donation_analytics', {}),
+]
+
+
+_timeouts = {}
+
+# name -> callable returning the output field names a fieldset can select
+_fieldsets = {}
+_fieldset_names = {}
+
+def payload(name, *models, timeout=None, fieldset=None):
+    """Register ``builder(**params)`` as the source of payload ``name``.
+
+    ``timeout`` overrides PAYLOAD_CACHE_SECONDS for payloads that should
+    also expire on their own. ``fieldset`` is a callable returning the
+    field names the builder's ``fields``/``exclude`` params can select.
+    """
+    def decorator(builder):
+        _registry[name] = (builder, models)
+        if timeout is not None:
+            _timeouts[name] = timeout
+        if fieldset is not None:
+            _fieldsets[name] = fieldset
+        return builder
+    return decorator
+
+
+def _serializer_fieldset(serializer_name):
+    def names():
+        # Imported lazily to keep DRF off the startup path of the async endpoints
+        from . import serializers
+        return getattr(serializers, serializer_name)().fields.keys()
+    return names
+
+
+def _known_fieldset(name, params):
+    """``params`` with fieldset names the payload doesn't have dropped.
+
+    Unknown names don't change the output; kept, every ``?fields=junk``
+    would get its own build and cache entry. A fieldset with no known
+    names becomes ``()``, so all of those share one key.
+    """
+    if name not in _fieldsets or not (params.get('fields') or params.get('exclude')):
+        return params
+    if name not in _fieldset_names:
+        _fieldset_names[name] = frozenset(_fieldsets[name]())
+    known = _fieldset_names[name]
+    params = dict(params)
+    if params.get('fields') is not None:
+        params['fields'] = tuple(n for n in params['fields'] if n in known)
+    if params.get('exclude'):
+        params['exclude'] = tuple(n for n in params['exclude'] if n in known)
+    return params
+
+
+def _generation_key(name):
+    return f'payload_generation_{name}'
+
+
+def _payload_key(name, generation, params):
+    # Bind against the builder's defaults so {} and {'deleted': False} share a key
+    bound = inspect.signature(_registry[name][0]).bind(**params)
+    bound.apply_defaults()
+    variant = '&'.join(f'{k}={v}' for k, v in sorted(bound.arguments.items()))
+    digest = hashlib.md5(variant.encode('utf-8')).hexdigest()[:12]
+    return f'payload_{name}_{generation}_{digest}'
+
+
+def _timeout(name):
+    timeout = _timeouts.get(name, getattr(settings, 'PAYLOAD_CACHE_SECONDS', 300))
+    if not settings.SHARED_CACHE:
+        return min(timeout, settings.LOCAL_PAYLOAD_CACHE_SECONDS)
+    return timeout
+
+
+def _stale_seconds():
+    return settings.PAYLOAD_STALE_SECONDS if settings.SHARED_CACHE else 0
+
+
+def _build(name, **params):
+    builder, _models = _registry[name]
+    if iscoroutinefunction(builder):
+        return async_to_sync(builder)(**params)
+    return builder(**params)
+
+
+async def _abuild(name, **params):
+    builder, _models = _registry[name]
+    if iscoroutinefunction(builder):
+        return await builder(**params)
+    return await sync_to_async(builder)(**params)
+
+
+def _cached(params):
+    return params.get('since') is None
+
+
+LOCK_POLL_SECONDS = 0.05
+
+
+def _lock_key(key):
+    return f'{key}_lock'
+
+
+def _now():
+    return timezone.now().timestamp()
+
+
+def _entry(name, data, built_at):
+    """``(entry, cache timeout)``: ``data`` with its jittered soft expiry and build start time."""
+    fresh_for = _timeout(name) * random.uniform(1 - settings.PAYLOAD_TTL_JITTER, 1)
+    entry = (_now() + fresh_for, data, built_at)
+    return entry, math.ceil(fresh_for + _stale_seconds())
+
+
+def _is_fresh(entry):
+    return _now() < entry[0]
+
+
+def _stamped(entry):
+    # Entries written before build times were kept count as built at the epoch
+    return entry[1], entry[2] if len(entry) > 2 else 0
+
+
+def _build_and_store(key, name, params):
+    built_at = _now()
+    data = _build(name, **params)
+    cache.set(key, *_entry(name, data, built_at))
+    return data, built_at
+
+
+def _rebuild(key, name, params):
+    """Build and store the entry; the caller holds the lock, which this releases."""
+    try:
+        return _build_and_store(key, name, params)
+    finally:
+        cache.delete(_lock_key(key))
+
+
+def build_payload(name, **params):
+    """Build payload ``name`` from the database and store it."""
+    generation = cache.get(_generation_key(name), 0)
+    return _build_and_store(_payload_key(name, generation, params), name, params)[0]
+
+
+def get_stamped_payload(name, **params):
+    """``(data, built_at)``: the payload and when the build that produced it started.
+
+    ``built_at`` is a Unix timestamp; rows written after it may be missing
+    from ``data`` (see core.changes).
+    """
+    if not _cached(params):
+        built_at = _now()
+        return _build(name, **params), built_at
+    generation = cache.get(_generation_key(name), 0)
+    key = _payload_key(name, generation, params)
+    lock = _lock_key(key)
+    entry = cache.get(key)
+    if entry is not None:
+        if _is_fresh(entry) or not cache.add(lock, 1, settings.PAYLOAD_LOCK_SECONDS):
+            # Fresh, or stale while another request rebuilds it
+            return _stamped(entry)
+        return _rebuild(key, name, params)
+
+    deadline = monotonic() + settings.PAYLOAD_LOCK_WAIT_SECONDS
+    while not cache.add(lock, 1, settings.PAYLOAD_LOCK_SECONDS):
+        if monotonic() >= deadline:
+            # The lock holder is stuck or gone; don't keep the request waiting
+            return _build_and_store(key, name, params)
+        sleep(LOCK_POLL_SECONDS)
+        entry = cache.get(key)
+        if entry is not None:
+            return _stamped(entry)
+    # Stored between our miss and taking the lock
+    entry = cache.get(key)
+    if entry is not None:
+        cache.delete(lock)
+        return _stamped(entry)
+    return _rebuild(key, name, params)
+
+
+def get_payload(name, **params):
+    return get_stamped_payload(name, **params)[0]
+
+
+async def _abuild_and_store(key, name, params):
+    built_at = _now()
+    data = await _abuild(name, **params)
+    await cache.aset(key, *_entry(name, data, built_at))
+    return data, built_at
+
+
+async def _arebuild(key, name, params):
+    try:
+        return await _abuild_and_store(key, name, params)
+    finally:
+        await cache.adelete(_lock_key(key))
+
+
+async def aget_stamped_payload(name, **params):
+    """``get_stamped_payload()`` for async views: waiting for a lock doesn't block the event loop."""
+    params = _known_fieldset(name, params)
+    if not _cached(params):
+        built_at = _now()
+        return await _abuild(name, **params), built_at
+    generation = await cache.aget(_generation_key(name), 0)
+    key = _payload_key(name, generation, params)
+    lock = _lock_key(key)
+    entry = await cache.aget(key)
+    if entry is not None:
+        if _is_fresh(entry) or not await cache.aadd(lock, 1, settings.PAYLOAD_LOCK_SECONDS):
+            return _stamped(entry)
+        return await _arebuild(key, name, params)
+
+    deadline = monotonic() + settings.PAYLOAD_LOCK_WAIT_SECONDS
+    while not await cache.aadd(lock, 1, settings.PAYLOAD_LOCK_SECONDS):
+        if monotonic() >= deadline:
+            return await _abuild_and_store(key, name, params)
+        await asyncio.sleep(LOCK_POLL_SECONDS)
+        entry = await cache.aget(key)
+        if entry is not None:
+            return _stamped(entry)
+    entry = await cache.aget(key)
+    if entry is not None:
+        await cache.adelete(lock)
+        return _stamped(entry)
+    return await _arebuild(key, name, params)
+
+
+async def aget_payload(name, **params):
+    return (await aget_stamped_payload(name, **params))[0]
+
+
+def invalidate_payloads(sender, **kwargs):
+    """post_save/post_delete receiver: drop payloads built from ``sender``."""
+    for name, (_builder, models) in _registry.items():
+        if sender in models:
+            key = _generation_key(name)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, 1, None)
+
+
+# Public listings
+
+@payload('events', Event, fieldset=lambda: EVENT_LIST.fields)
+async def build_events(type=None, exclude_deleted=False, start=None, end=None, fields=None, exclude=(), since=None):
+    # start/end: only events running at some point in [start, end)
+    events = Event.objects.overlapping(start, end)
+    if since is not None:
+        events = events.filter(updated_at__gte=since)
+    # Use end_date to determine if an event is past; events remain upcoming until they end
+    now = timezone.now()
+    if type == 'upcoming':
+        events = events.filter(end_date__gte=now)
+    elif type == 'past':
+        events = events.filter(end_date__lt=now)
+    if exclude_deleted:
+        events = events.filter(is_deleted=False)
+    return await EVENT_LIST.narrow(fields, exclude).arows(events.order_by('-start_date'))
+
+
+@payload('events_calendar', Event)
+async def build_events_calendar(month):
+    """Events of ``month`` (a date on its first day) grouped by day.
+
+    Days are computed in SQL; an event spanning several days is listed
+    on each of them within the month.
+    """
+    next_month = (month + timedelta(days=32)).replace(day=1)
+    tz = timezone.get_current_timezone()
+    rows = (
+        Event.objects.filter(is_deleted=False)
+        .overlapping(datetime.combine(month, time.min, tz), datetime.combine(next_month, time.min, tz))
+        .annotate(start_day=TruncDate('start_date'), end_day=TruncDate('end_date'))
+        .values(*EVENT_CALENDAR.fields, 'start_day', 'end_day')
+        .order_by('start_date')
+    )
+    days = {}
+    async for row in rows:
+        day = max(row.pop('start_day'), month)
+        last = min(row.pop('end_day'), next_month - timedelta(days=1))
+        event = EVENT_CALENDAR.convert(row)
+        while day <= last:
+            days.setdefault(day, []).append(event)
+            day += timedelta(days=1)
+    return {
+        'month': month.strftime('%Y-%m'),
+        'days': [{'date': day.isoformat(), 'events': events} for day, events in sorted(days.items())],
+    }
+
+
+@payload('gallery', GalleryItem, fieldset=lambda: GALLERY_LIST.fields)
+async def build_gallery(category=None, congregation=None, date_from=None, date_to=None, featured=None,
+                        media_type=None, fields=None, exclude=(), since=None):
+    items = GalleryItem.objects.matching(
+        category=category, congregation=congregation, date_from=date_from, date_to=date_to,
+        featured=featured, media_type=media_type,
+    )
+    if since is not None:
+        items = items.filter(updated_at__gte=since)
+    return await GALLERY_LIST.narrow(fields, exclude).arows(items.order_by('-created_at'))
+
+
+@payload('gallery_facets', GalleryItem)
+async def build_gallery_facets(category=None, congregation=None, date_from=None, date_to=None, featured=None,
+                               media_type=None):
+    """Counts per category, congregation and media type from one grouped query.
+
+    Each facet counts the items matching every *other* selected filter, so
+    picking a category still shows how many items the other categories have.
+    """
+    groups = (
+        GalleryItem.objects.matching(date_from=date_from, date_to=date_to, featured=featured)
+        .with_media_type()
+        .values('category', 'congregation', 'media_type')
+        .annotate(count=Count('id'))
+        .order_by()
+    )
+    selected = {'category': category, 'congregation': congregation, 'media_type': media_type}
+    facets = {name: {} for name in selected}
+    total = 0
+    async for group in groups:
+        misses = {name for name, value in selected.items() if value and group[name] != value}
+        if not misses:
+            total += group['count']
+        for name, counts in facets.items():
+            if not misses - {name}:
+                counts[group[name]] = counts.get(group[name], 0) + group['count']
+    return {'total': total, **facets}
+
+
+@payload('announcements', Announcement, fieldset=_serializer_fieldset('AnnouncementSerializer'))
+async def build_announcements(fields=None, exclude=()):
+    from .serializers import AnnouncementSerializer
+    announcements = Announcement.objects.all().order_by('-date')
+    return await sync_to_async(serialize_list)(AnnouncementSerializer, announcements, fields, exclude)
+
+
+@payload('testimonials', Testimonial, fieldset=lambda: TESTIMONIAL_LIST.fields)
+async def build_testimonials(for_website=False, deleted=False, fields=None, exclude=(), since=None):
+    projection = TESTIMONIAL_LIST
+    if for_website:
+        # Website cards: no phone numbers or admin notes
+        testimonials = Testimonial.objects.filter(status='approved', is_active=True, is_deleted=False).order_by('-created_at')
+        projection = TESTIMONIAL_CARD
+    elif deleted:
+        testimonials = Testimonial.objects.filter(is_deleted=True).order_by('-deleted_at')
+    else:
+        # For dashboard, show all non-deleted testimonials
+        testimonials = Testimonial.objects.filter(is_deleted=False).order_by('-created_at')
+    if since is not None:
+        testimonials = testimonials.filter(updated_at__gte=since)
+    return await projection.narrow(fields, exclude).arows(testimonials)
+
+
+@payload('ministries', Ministry, fieldset=_serializer_fieldset('MinistrySerializer'))
+async def build_ministries(deleted=False, fields=None, exclude=()):
+    from .serializers import MinistrySerializer
+    items = Ministry.objects.filter(dashboard_deleted=deleted).order_by('-created_at')
+    return await sync_to_async(serialize_list)(MinistrySerializer, items, fields, exclude)
+
+
+# Fixed hierarchy order for the executive team
+TEAM_HIERARCHY = [
+    'president',
+    "president's rep",
+    'secretary',
+    'assistant secretary',
+    'financial secretary',
+    'treasurer',
+    'evangelism coordinator',
+    'organizer',
+    'others',
+]
+
+# Synonyms mapping to normalize positions into the hierarchy labels
+TEAM_POSITION_SYNONYMS = {
+    "president's representative": "president's rep",
+    'president rep': "president's rep",
+    'assistant sec': 'assistant secretary',
+    'fin sec': 'financial secretary',
+    'financial sec': 'financial secretary',
+    'evangelism sec': 'evangelism secretary',
+    'evangelism coordinator': 'evangelism coordinator',
+    'protocol': 'protocol officer',
+    'protocol sec': 'protocol officer',
+    'protocol secretary': 'protocol officer',
+}
+
+
+def normalize_position(raw_position):
+    if not raw_position:
+        return ''
+    pos = raw_position.strip().lower()
+    # normalize unicode quotes/backticks to ASCII apostrophe
+    pos = pos.replace('\u2019', "'").replace('\u2018', "'").replace('`', "'")
+    # collapse multiple spaces
+    pos = ' '.join(pos.split())
+    # reduce longer words to mapped short forms when applicable
+    if 'representative' in pos and "president" in pos:
+        pos = "president's rep"
+    return TEAM_POSITION_SYNONYMS.get(pos, pos)
+
+
+@payload('team', TeamMember, fieldset=_serializer_fieldset('TeamMemberSerializer'))
+def build_team(deleted=False, fields=None, exclude=(), since=None):
+    from .serializers import TeamMemberSerializer
+    if deleted:
+        team_members = TeamMember.objects.filter(is_deleted=True, is_council=False)
+    else:
+        # Default: non-deleted active members for dashboard
+        team_members = TeamMember.objects.filter(is_deleted=False, is_council=False, is_active=True)
+    if since is not None:
+        team_members = team_members.filter(updated_at__gte=since)
+
+    def get_position_order(position):
+        try:
+            return TEAM_HIERARCHY.index(normalize_position(position))
+        except ValueError:
+            # If position not in hierarchy, put it after listed roles
+            return len(TEAM_HIERARCHY)
+
+    # If position_order present, prefer it; else compute from mapping
+    def sort_key(position_order, position, name):
+        return (position_order if position_order != 999 else get_position_order(position), name)
+
+    if fields is None and not exclude:
+        # Full listing: rows come from the fragment cache
+        members = serialize_list(TeamMemberSerializer, team_members)
+        return sorted(members, key=lambda m: sort_key(m['position_order'], m['position'], m['name']))
+
+    # The sort below reads these whatever the fieldset
+    team_members = TeamMemberSerializer.sparse_queryset(
+        team_members, fields, exclude, keep=('name', 'position', 'position_order'),
+    )
+    sorted_members = sorted(team_members, key=lambda m: sort_key(m.position_order, m.position, m.name))
+    return TeamMemberSerializer(sorted_members, many=True, fields=fields, exclude=exclude).data
+
+
+@payload('council', TeamMember, fieldset=_serializer_fieldset('TeamMemberSerializer'))
+def build_council(fields=None, exclude=()):
+    from .serializers import TeamMemberSerializer
+    team_members = TeamMember.objects.filter(is_active=True, is_council=True).order_by('order', 'name')
+    return serialize_list(TeamMemberSerializer, team_members, fields, exclude)
+
+
+@payload('social_media_links', SocialMediaLink)
+def build_social_media_links():
+    links = SocialMediaLink.objects.filter(is_active=True).order_by('display_order', 'id')
+    return [{
+        'id': link.id,
+        'platform_name': link.platform_name,
+        'custom_platform_name': link.custom_platform_name,
+        'display_name': link.get_display_name(),
+        'url': link.url,
+        'icon_name': link.icon_name,
+        'icon_file': link.icon_file.url if link.icon_file else None,
+        'display_order': link.display_order,
+        'is_active': link.is_active,
+    } for link in links]
+
+
+# Settings singletons
+
+@payload('website_settings', WebsiteSettings)
+def build_website_settings():
+    from settings_views import load_settings
+    return load_settings()
+
+
+# Dashboard summaries
+
+# Items waiting for an admin, matched by the partial indexes on each model
+PENDING_ITEMS = [
+    ('testimonials', Testimonial, {'status': 'pending', 'is_deleted': False}),
+    ('contact_messages', ContactMessage, {'is_read': False, 'is_deleted': False}),
+    ('advertisements', Advertisement, {'status': 'pending'}),
+    ('donations', Donation, {'payment_status': 'pending'}),
+    ('ministry_registrations', MinistryRegistration, {'is_approved': False}),
+]
+
+
+@payload('pending_counts', *(model for _key, model, _conditions in PENDING_ITEMS), timeout=30)
+def build_pending_counts():
+    # One UNION ALL of COUNT(*)s; grouping on a constant adds no GROUP BY,
+    # so every branch returns exactly one row
+    branches = [
+        model.objects.filter(**conditions).annotate(kind=Value(key)).values('kind').annotate(count=Count('pk'))
+        for key, model, conditions in PENDING_ITEMS
+    ]
+    counts = dict(branches[0].union(*branches[1:], all=True).values_list('kind', 'count'))
+    counts = {key: counts.get(key, 0) for key, _model, _conditions in PENDING_ITEMS}
+    counts['total'] = sum(counts.values())
+    return counts
+
+
+@payload('impact_statistics', TeamMember, Event, Donation)
+def build_impact_statistics():
+    stats = get_site_stats()
+    total_youth_reached = stats.team_members + 450  # Team members + estimated reach
+    total_events = stats.active_events
+    total_donations = stats.verified_donations
+    total_donation_amount = stats.verified_donation_amount
+
+    # Calculate community impact percentage based on verified donations
+    community_impact = min(100, (total_donations * 2))  # 2% per verified donation, max 100%
+    return {
+        'youth_reached': total_youth_reached,
+        'events_organized': total_events,
+        'community_impact': community_impact,
+        'total_donations': total_donations,
+        'total_amount': float(total_donation_amount)
+    }
+
+
+@payload('donation_analytics', Donation)
+def build_donation_analytics():
+    # Basic stats
+    total_donations = Donation.objects.count()
+    total_amount = Donation.objects.aggregate(total=Sum('amount'))['total'] or 0
+    verified_amount = Donation.objects.filter(payment_status='verified').aggregate(total=Sum('amount'))['total'] or 0
+
+    # Status counts
+    pending_count = Donation.objects.filter(payment_status='pending').count()
+    verified_count = Donation.objects.filter(payment_status='verified').count()
+    failed_count = Donation.objects.filter(payment_status='failed').count()
+
+    # Payment method breakdown
+    payment_methods = Donation.objects.filter(payment_status='verified').values('payment_method').annotate(
+        total_amount=Sum('amount'),
+        count=Count('id')
+    )
+
+    # Purpose breakdown
+    purposes = Donation.objects.filter(payment_status='verified').values('purpose').annotate(
+        total_amount=Sum('amount'),
+        count=Count('id')
+    )
+
+    # Monthly trends (last 6 months)
+    monthly_trends = []
+    for i in range(5, -1, -1):
+        date = datetime.now() - timedelta(days=30*i)
+        month_start = date.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        if i == 0:
+            month_end = datetime.now()
+        else:
+            next_month = month_start + timedelta(days=32)
+            month_end = next_month.replace(day=1) - timedelta(days=1)
+
+        month_amount = Donation.objects.filter(
+            payment_status='verified',
+            created_at__gte=month_start,
+            created_at__lte=month_end
+        ).aggregate(total=Sum('amount'))['total'] or 0
+
+        monthly_trends.append({
+            'month': month_start.strftime('%b'),
+            'year': month_start.year,
+            'amount': float(month_amount)
+        })
+
+    return {
+        'total_donations': total_donations,
+        'total_amount': float(total_amount),
+        'verified_amount': float(verified_amount),
+        'pending_count': pending_count,
+        'verified_count': verified_count,
+        'failed_count': failed_count,
+        'payment_methods': list(payment_methods),
+        'purposes': list(purposes),
+        'monthly_trends': monthly_trends
+    }
@@ -0,0 +1,170 @@
+"""
+Opt-in request profiler.
+
+A logged-in supervisor can send ``X-Profile: 1`` with any request to have
+the view run under cProfile with every SQL statement captured. The
+response carries a short summary in ``X-Profile-*`` headers and the full
+report is kept for a few minutes at ``/api/profiler/<id>/``.
+
+With ``PROFILER_SAMPLE_RATE`` > 0 a random share of all requests is also
+profiled, and any that take longer than ``PROFILER_SLOW_MS`` are written
+to ``PROFILER_DIR`` as ``<id>.prof`` (load with pstats/snakeviz) plus an
+``<id>.json`` summary.
+
+Under ASGI, cProfile only sees the event-loop thread; ORM work that async
+views hand to worker threads still shows up in the captured SQL.
+"""
+import cProfile
+import json
+import os
+import pstats
+import random
+import time
+import uuid
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import JsonResponse
+
+from .metrics import capture_queries
+
+PROFILE_HEADER = 'HTTP_X_PROFILE'
+REPORT_TTL_SECONDS = 600
+TOP_FUNCTIONS = 30
+
+
+def _is_supervisor(user):
+    if not user.is_authenticated:
+        return False
+    from .models import Supervisor
+    return Supervisor.objects.filter(user=user).exists()
+
+
+async def _ais_supervisor(user):
+    if not user.is_authenticated:
+        return False
+    from .models import Supervisor
+    return await Supervisor.objects.filter(user=user).aexists()
+
+
+def _report_cache_key(profile_id):
+    return f'profile_report_{profile_id}'
+
+
+def _top_functions(profiler, limit=TOP_FUNCTIONS):
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, function), (cc, nc, tottime, cumtime, callers) in stats.stats.items():
+        rows.append({
+            'function': f'{os.path.basename(filename)}:{line}({function})',
+            'calls': nc,
+            'tottime_ms': round(tottime * 1000, 3),
+            'cumtime_ms': round(cumtime * 1000, 3),
+        })
+    rows.sort(key=lambda row: row['cumtime_ms'], reverse=True)
+    return rows[:limit]
+
+
+class ProfilerMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        requested = request.META.get(PROFILE_HEADER) == '1' and _is_supervisor(request.user)
+        if not (requested or self._sampled()):
+            return self.get_response(request)
+
+        queries, profiler = [], cProfile.Profile()
+        start = time.perf_counter()
+        with capture_queries(self._collector(queries)):
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        self._finish(request, response, requested, profiler, queries, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        requested = False
+        if request.META.get(PROFILE_HEADER) == '1':
+            requested = await _ais_supervisor(await request.auser())
+        if not (requested or self._sampled()):
+            return await self.get_response(request)
+
+        queries, profiler = [], cProfile.Profile()
+        start = time.perf_counter()
+        with capture_queries(self._collector(queries)):
+            profiler.enable()
+            try:
+                response = await self.get_response(request)
+            finally:
+                profiler.disable()
+        await sync_to_async(self._finish, thread_sensitive=False)(
+            request, response, requested, profiler, queries, time.perf_counter() - start,
+        )
+        return response
+
+    @staticmethod
+    def _sampled():
+        sample_rate = getattr(settings, 'PROFILER_SAMPLE_RATE', 0.0)
+        return sample_rate > 0 and random.random() < sample_rate
+
+    @staticmethod
+    def _collector(queries):
+        def collect(sql, seconds, many):
+            queries.append({'sql': sql, 'ms': round(seconds * 1000, 3), 'many': many})
+        return collect
+
+    def _finish(self, request, response, requested, profiler, queries, elapsed):
+        total_ms = elapsed * 1000
+        profile_id = uuid.uuid4().hex
+        sql_ms = sum(q['ms'] for q in queries)
+        report = {
+            'id': profile_id,
+            'path': request.path,
+            'method': request.method,
+            'status': response.status_code,
+            'total_ms': round(total_ms, 3),
+            'sql_count': len(queries),
+            'sql_ms': round(sql_ms, 3),
+            'python_ms': round(total_ms - sql_ms, 3),
+            'functions': _top_functions(profiler),
+            'queries': queries,
+        }
+
+        if requested:
+            cache.set(_report_cache_key(profile_id), report, REPORT_TTL_SECONDS)
+            response['X-Profile-Id'] = profile_id
+            response['X-Profile-Total-Ms'] = f'{total_ms:.1f}'
+            response['X-Profile-SQL-Count'] = str(len(queries))
+            response['X-Profile-SQL-Ms'] = f'{sql_ms:.1f}'
+            if report['functions']:
+                response['X-Profile-Top'] = report['functions'][0]['function']
+        elif total_ms >= getattr(settings, 'PROFILER_SLOW_MS', 1000):
+            self._write_to_disk(profile_id, profiler, report)
+
+    def _write_to_disk(self, profile_id, profiler, report):
+        directory = settings.PROFILER_DIR
+        os.makedirs(directory, exist_ok=True)
+        profiler.dump_stats(os.path.join(directory, f'{profile_id}.prof'))
+        with open(os.path.join(directory, f'{profile_id}.json'), 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+def api_profile_report(request, profile_id):
+    """Full report for a profile captured via the X-Profile header."""
+    if not _is_supervisor(request.user):
+        return JsonResponse({'success': False, 'error': 'Supervisor access required'}, status=401)
+    report = cache.get(_report_cache_key(profile_id))
+    if report is None:
+        return JsonResponse({'success': False, 'error': 'Profile not found or expired'}, status=404)
+    return JsonResponse({'success': True, 'profile': report})
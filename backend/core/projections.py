@@ -0,0 +1,103 @@
+"""
+Lean read-path projections for the large public listings.
+
+A ModelSerializer builds a tree of field objects and a model instance per
+row. A Projection instead fetches a fixed column list with ``.values()`` and
+converts only the columns that need it: file names become storage URLs and
+dates/datetimes get DRF's formatting, so a projection over the same columns
+produces exactly what the ``fields = '__all__'`` serializer did. Card
+projections leave out what list pages never show (full blog content, admin
+notes, phone numbers); detail endpoints keep the full serializers.
+"""
+from django.db import models
+from django.utils.functional import cached_property
+
+from .fieldsets import wanted
+from .models import BlogPost, Event, GalleryItem, Testimonial
+
+
+class Projection:
+    def __init__(self, model, fields=None, exclude=()):
+        self.model = model
+        self._fields = fields
+        self.exclude = set(exclude)
+        self._narrowed = {}
+
+    @cached_property
+    def fields(self):
+        """Column names in serializer order (``id`` first, then model order)."""
+        if self._fields is not None:
+            return tuple(self._fields)
+        return tuple(f.attname for f in self.model._meta.concrete_fields if f.attname not in self.exclude)
+
+    @cached_property
+    def converters(self):
+        # DRF is imported here rather than at module level to keep it off the
+        # startup path of the async endpoints
+        from rest_framework import serializers
+
+        converters = {}
+        for name in self.fields:
+            field = self.model._meta.get_field(name)
+            if isinstance(field, models.FileField):
+                converters[name] = field.storage.url
+            elif isinstance(field, models.DateTimeField):
+                converters[name] = serializers.DateTimeField().to_representation
+            elif isinstance(field, models.DateField):
+                converters[name] = serializers.DateField().to_representation
+            elif isinstance(field, models.TimeField):
+                converters[name] = serializers.TimeField().to_representation
+        return converters
+
+    def narrow(self, fields=None, exclude=()):
+        """This projection limited to a fieldset (see core.fieldsets)."""
+        if fields is None and not exclude:
+            return self
+        # Keyed by the resulting columns, so unknown names can't grow this
+        columns = tuple(name for name in self.fields if wanted(name, fields, exclude))
+        if columns not in self._narrowed:
+            self._narrowed[columns] = Projection(self.model, columns)
+        return self._narrowed[columns]
+
+    def convert(self, row):
+        """Convert a ``.values()`` row in place; other keys pass through."""
+        for name, converter in self.converters.items():
+            value = row[name]
+            # Empty file fields are stored as '' and serialize to None
+            row[name] = converter(value) if value else None
+        return row
+
+    def rows(self, queryset):
+        if not self.fields:
+            # values() with no names would select every column
+            return [{} for _ in queryset.values_list('pk', flat=True)]
+        return [self.convert(row) for row in queryset.values(*self.fields)]
+
+    async def arows(self, queryset):
+        if not self.fields:
+            return [{} async for _ in queryset.values_list('pk', flat=True)]
+        return [self.convert(row) async for row in queryset.values(*self.fields)]
+
+
+# Same columns as the '__all__' serializers; used by the website and dashboard
+EVENT_LIST = Projection(Event)
+GALLERY_LIST = Projection(GalleryItem)
+TESTIMONIAL_LIST = Projection(Testimonial)
+# The dashboard edits the raw content; the rendered HTML is for the detail page
+BLOG_LIST = Projection(BlogPost, exclude=('content_html',))
+
+# Calendar month view
+EVENT_CALENDAR = Projection(Event, fields=(
+    'id', 'title', 'event_type', 'location', 'start_date', 'end_date', 'is_featured',
+))
+
+# Website cards
+TESTIMONIAL_CARD = Projection(Testimonial, fields=(
+    'id', 'name', 'congregation', 'position', 'content', 'image', 'rating', 'is_featured', 'created_at',
+))
+# Precomputed summary, word count and reading time instead of the content
+BLOG_CARD = Projection(BlogPost, exclude=('content', 'content_html', 'excerpt', 'is_deleted', 'deleted_at'))
+# Related-posts sidebar
+BLOG_RELATED = Projection(BlogPost, fields=(
+    'id', 'title', 'slug', 'summary', 'image', 'category', 'date', 'reading_time',
+))
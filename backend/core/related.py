@@ -0,0 +1,365 @@
+"""
+Related blog posts from TF-IDF similarity, computed ahead of time.
+
+Every published post becomes an L2-normalised TF-IDF vector over its title,
+category and content (title and category terms count extra), and its
+RELATED_COUNT nearest neighbours by cosine similarity are stored as
+RelatedPost rows, so the related-posts endpoint is one indexed join.
+
+``manage.py index_related_posts`` (nightly) rebuilds everything: the
+vocabulary and IDF weights (RelatedTerm), each post's sparse vector
+(BlogPostVector) and every list. Saving or deleting a post queues
+``refresh_related()`` after the commit, on the background pool. It weighs
+only the changed posts, against the stored vocabulary, and scores them
+against the stored vectors in one pass over their non-zero entries; it
+recomputes the changed posts' lists and the lists that pointed at them,
+merges the changed posts into lists whose weakest entry they now beat, and
+only rewrites lists whose order changed. Terms new since the rebuild are
+ignored and scores drift slightly as document frequencies move until the
+next rebuild resets them.
+
+NumPy is imported inside the functions that use it to keep it off the
+startup path.
+"""
+import re
+import threading
+from collections import Counter
+
+from django.db import transaction
+
+from .background import run_in_background
+from .models import BlogPost, BlogPostVector, RelatedPost, RelatedTerm
+
+RELATED_COUNT = 5
+MAX_FEATURES = 4096  # vocabulary cap, most widespread terms first
+BLOCK_ROWS = 512  # similarity rows computed per matrix product
+TITLE_WEIGHT = 3
+CATEGORY_WEIGHT = 2
+MAX_TERM_LENGTH = 100  # RelatedTerm.term
+
+# Words of three or more letters
+TOKEN_RE = re.compile(r'[^\W\d_]{3,}')
+STOP_WORDS = frozenset('''
+    about after again all also and any are because been before being but can could did does doing down during
+    each few for from further had has have having her here hers herself him himself his how into its itself just
+    more most not now off once only other our ours ourselves out over own same she should some such than that
+    the their theirs them themselves then there these they this those through too under until very was were
+    what when where which while who whom why will with would you your yours yourself yourselves
+'''.split())
+
+INDEXED_FIELDS = {'title', 'category', 'content', 'is_published', 'is_deleted'}
+
+
+def tokenize(text):
+    return [token for token in TOKEN_RE.findall((text or '').lower()) if token not in STOP_WORDS]
+
+
+def term_counts(title, category, content):
+    counts = Counter(tokenize(content))
+    for token in tokenize(title):
+        counts[token] += TITLE_WEIGHT
+    for token in tokenize(category):
+        counts[token] += CATEGORY_WEIGHT
+    return counts
+
+
+def load_documents():
+    """``(post_ids, [term Counter, ...])`` for the published posts, by id."""
+    posts = (
+        BlogPost.objects.filter(is_published=True, is_deleted=False)
+        .order_by('pk').values_list('pk', 'title', 'category', 'content')
+    )
+    ids, documents = [], []
+    for pk, title, category, content in posts.iterator():
+        ids.append(pk)
+        documents.append(term_counts(title, category, content))
+    return ids, documents
+
+
+def vectorize(documents, max_features=MAX_FEATURES):
+    """``(vocabulary, idf, vectors)`` for ``documents`` (sublinear tf, smoothed idf).
+
+    ``vocabulary`` maps terms to columns and ``idf`` holds their weights;
+    ``vectors`` has one ``weigh()`` result per document. Terms found in a
+    single document can't make two posts similar, so the vocabulary only
+    keeps terms shared by at least two.
+    """
+    import numpy as np
+
+    doc_freq = Counter()
+    for counts in documents:
+        doc_freq.update(counts.keys())
+    shared = [
+        (term, df) for term, df in doc_freq.most_common(max_features)
+        if df > 1 and len(term) <= MAX_TERM_LENGTH
+    ]
+    vocabulary = {term: col for col, (term, _df) in enumerate(shared)}
+    df = np.fromiter((df for _term, df in shared), dtype=np.float32, count=len(shared))
+    idf = np.log((1 + len(documents)) / (1 + df)) + 1
+    return vocabulary, idf, [weigh(counts, vocabulary, idf) for counts in documents]
+
+
+def weigh(counts, vocabulary, idf):
+    """A document's L2-normalised TF-IDF vector as ``(columns, weights)`` arrays."""
+    import numpy as np
+
+    terms = [(vocabulary[term], count) for term, count in counts.items() if term in vocabulary]
+    columns = np.fromiter((col for col, _count in terms), dtype=np.int32, count=len(terms))
+    weights = 1 + np.log(np.fromiter((count for _col, count in terms), dtype=np.float32, count=len(terms)))
+    weights *= idf[columns]
+    norm = np.linalg.norm(weights)
+    if norm > 0:
+        weights /= norm
+    return columns, weights.astype(np.float32)
+
+
+def densify(vectors, width):
+    """The ``vectors`` as rows of a dense float32 matrix (for the full rebuild)."""
+    import numpy as np
+
+    matrix = np.zeros((len(vectors), width), dtype=np.float32)
+    for row, (columns, weights) in enumerate(vectors):
+        matrix[row, columns] = weights
+    return matrix
+
+
+def nearest(matrix, rows, k=RELATED_COUNT):
+    """``{row: [(other_row, score), ...]}``, best first, for each of ``rows``.
+
+    Only positive similarities count, so a post sharing no terms with any
+    other gets an empty list.
+    """
+    import numpy as np
+
+    rows = list(rows)
+    result = {row: [] for row in rows}
+    top = min(k, matrix.shape[0] - 1)
+    if top <= 0 or not matrix.shape[1]:
+        return result
+    for start in range(0, len(rows), BLOCK_ROWS):
+        block = rows[start:start + BLOCK_ROWS]
+        scores = matrix[block] @ matrix.T
+        scores[np.arange(len(block)), block] = -1  # never related to itself
+        best = np.argpartition(scores, -top, axis=1)[:, -top:]
+        best_scores = np.take_along_axis(scores, best, axis=1)
+        order = np.argsort(-best_scores, axis=1, kind='stable')
+        best = np.take_along_axis(best, order, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        for row, others, values in zip(block, best.tolist(), best_scores.tolist()):
+            result[row] = [(other, score) for other, score in zip(others, values) if score > 0]
+    return result
+
+
+def store(lists):
+    """Write ``{post_id: [(related_id, score), ...]}``.
+
+    Lists whose order is unchanged keep their rows. Returns the number of
+    posts whose list was rewritten.
+    """
+    current = {}
+    for post_id, related_id in (
+        RelatedPost.objects.filter(post_id__in=lists).order_by('post_id', 'rank').values_list('post_id', 'related_id')
+    ):
+        current.setdefault(post_id, []).append(related_id)
+    changed = sorted(
+        post_id for post_id, entries in lists.items()
+        if current.get(post_id, []) != [related_id for related_id, _score in entries]
+    )
+    with transaction.atomic():
+        # A refresh in another process rewriting the same lists waits here
+        # instead of colliding on (post, rank)
+        list(BlogPost.objects.select_for_update().filter(pk__in=changed).order_by('pk').values_list('pk', flat=True))
+        RelatedPost.objects.filter(post_id__in=changed).delete()
+        RelatedPost.objects.bulk_create(
+            RelatedPost(post_id=post_id, related_id=related_id, rank=rank, score=score)
+            for post_id in changed
+            for rank, (related_id, score) in enumerate(lists[post_id])
+        )
+    return len(changed)
+
+
+def _drop_unlisted():
+    """Remove the lists of posts that are no longer published."""
+    RelatedPost.objects.exclude(post__is_published=True, post__is_deleted=False).delete()
+
+
+def _vector_row(post_id, vector):
+    columns, weights = vector
+    return BlogPostVector(post_id=post_id, columns=columns.tobytes(), weights=weights.tobytes())
+
+
+def store_index(ids, vocabulary, idf, vectors):
+    """Replace the stored vocabulary and post vectors."""
+    with transaction.atomic():
+        RelatedTerm.objects.all().delete()
+        RelatedTerm.objects.bulk_create(
+            RelatedTerm(term=term, column=col, idf=float(idf[col])) for term, col in vocabulary.items()
+        )
+        BlogPostVector.objects.all().delete()
+        BlogPostVector.objects.bulk_create(
+            (_vector_row(pk, vector) for pk, vector in zip(ids, vectors)), batch_size=1000,
+        )
+
+
+def rebuild_related(k=RELATED_COUNT):
+    """Recompute the index and every published post's list. Returns ``(posts, rewritten)``."""
+    ids, documents = load_documents()
+    vocabulary, idf, vectors = vectorize(documents)
+    store_index(ids, vocabulary, idf, vectors)
+    neighbours = nearest(densify(vectors, len(vocabulary)), range(len(ids)), k)
+    rewritten = store({
+        ids[row]: [(ids[other], score) for other, score in entries] for row, entries in neighbours.items()
+    })
+    _drop_unlisted()
+    return len(ids), rewritten
+
+
+class _StoredVectors:
+    """Every stored post vector, flattened so one query vector scores them all at once."""
+
+    def __init__(self, width):
+        import numpy as np
+
+        self.width = width
+        self.ids, columns, weights = [], [], []
+        for post_id, cols, values in (
+            BlogPostVector.objects.filter(post__is_published=True, post__is_deleted=False)
+            .order_by('post_id').values_list('post_id', 'columns', 'weights').iterator()
+        ):
+            self.ids.append(post_id)
+            columns.append(np.frombuffer(cols, dtype=np.int32))
+            weights.append(np.frombuffer(values, dtype=np.float32))
+        self.position = {pk: row for row, pk in enumerate(self.ids)}
+        self.vectors = dict(zip(self.ids, zip(columns, weights)))
+        self.columns = np.concatenate(columns) if columns else np.zeros(0, dtype=np.int32)
+        self.weights = np.concatenate(weights) if weights else np.zeros(0, dtype=np.float32)
+        self.owners = np.repeat(np.arange(len(self.ids)), [len(cols) for cols in columns])
+
+    def scores(self, post_id):
+        """Cosine similarity of ``post_id`` to every stored post, by position."""
+        import numpy as np
+
+        columns, weights = self.vectors[post_id]
+        query = np.zeros(self.width, dtype=np.float32)
+        query[columns] = weights
+        scores = np.bincount(self.owners, weights=query[self.columns] * self.weights, minlength=len(self.ids))
+        scores[self.position[post_id]] = -1  # never related to itself
+        return scores
+
+    def nearest(self, post_id, k):
+        import numpy as np
+
+        scores = self.scores(post_id)
+        top = min(k, len(self.ids) - 1)
+        if top <= 0:
+            return []
+        best = np.argpartition(scores, -top)[-top:]
+        best = best[np.argsort(-scores[best], kind='stable')]
+        return [(self.ids[row], float(scores[row])) for row in best.tolist() if scores[row] > 0]
+
+
+def _merge(entries, post_id, score, k):
+    entries = [(related_id, s) for related_id, s in entries if related_id != post_id] + [(post_id, score)]
+    return sorted(entries, key=lambda entry: -entry[1])[:k]
+
+
+def refresh_related(post_ids, k=RELATED_COUNT):
+    """Update the index and the lists affected by changes to ``post_ids``. Returns the lists recomputed.
+
+    The changed posts are weighed with the stored vocabulary and IDF and
+    scored against the stored vectors: their own lists and the lists that
+    pointed at them are recomputed, and the changed posts are merged into
+    the lists whose weakest entry they now beat.
+    """
+    post_ids = set(post_ids)
+    terms = list(RelatedTerm.objects.order_by('column').values_list('term', 'idf'))
+    if not terms:
+        # Nothing indexed yet (or no shared terms): build it all
+        return rebuild_related(k)[0]
+
+    import numpy as np
+
+    vocabulary = {term: col for col, (term, _idf) in enumerate(terms)}
+    idf = np.array([value for _term, value in terms], dtype=np.float32)
+    posts = BlogPost.objects.filter(pk__in=post_ids, is_published=True, is_deleted=False)
+    with transaction.atomic():
+        BlogPostVector.objects.filter(post_id__in=post_ids).delete()
+        BlogPostVector.objects.bulk_create(
+            _vector_row(pk, weigh(term_counts(title, category, content), vocabulary, idf))
+            for pk, title, category, content in posts.values_list('pk', 'title', 'category', 'content')
+        )
+
+    index = _StoredVectors(len(vocabulary))
+    stored = {}
+    for post_id, related_id, score in RelatedPost.objects.order_by('post_id', 'rank').values_list(
+        'post_id', 'related_id', 'score',
+    ):
+        stored.setdefault(post_id, []).append((related_id, score))
+
+    full = min(k, len(index.ids) - 1)
+    # Lists that lost or may have lowered an entry are recomputed from scratch
+    rescan = {pk for pk in post_ids if pk in index.position}
+    rescan.update(
+        post_id for post_id, entries in stored.items()
+        if post_id in index.position and any(related_id in post_ids for related_id, _ in entries)
+    )
+    lists = {post_id: index.nearest(post_id, k) for post_id in rescan}
+
+    # Other lists only gain the changed posts that beat their weakest entry
+    weakest = np.array([
+        stored[pk][-1][1] if len(stored.get(pk, ())) >= full else 0 for pk in index.ids
+    ], dtype=np.float32)
+    for changed in sorted(post_ids & set(index.position)):
+        scores = index.scores(changed)
+        for row in np.flatnonzero(scores > weakest).tolist():
+            post_id = index.ids[row]
+            if post_id not in rescan:
+                entries = lists.get(post_id, stored.get(post_id, []))
+                lists[post_id] = _merge(entries, changed, float(scores[row]), k)
+
+    store(lists)
+    _drop_unlisted()
+    return len(lists)
+
+
+# Changes are batched per process: saves that arrive while a refresh runs
+# are folded into the next one instead of starting another.
+_pending = set()
+_pending_lock = threading.Lock()
+_draining = False
+
+
+def _drain():
+    global _draining
+    while True:
+        with _pending_lock:
+            if not _pending:
+                _draining = False
+                return
+            batch = set(_pending)
+            _pending.clear()
+        try:
+            refresh_related(batch)
+        except Exception:
+            with _pending_lock:
+                _draining = False
+            raise
+
+
+def _queue_refresh(post_id):
+    global _draining
+    with _pending_lock:
+        _pending.add(post_id)
+        if _draining:
+            return
+        _draining = True
+    run_in_background(_drain)
+
+
+def schedule_refresh(sender, instance, **kwargs):
+    """post_save/post_delete receiver for BlogPost."""
+    update_fields = kwargs.get('update_fields')
+    if update_fields and not INDEXED_FIELDS & set(update_fields):
+        return
+    post_id = instance.pk
+    transaction.on_commit(lambda: _queue_refresh(post_id))
@@ -0,0 +1,35 @@
+"""
+orjson-backed JSON renderer for DRF.
+
+Produces the same bytes as rest_framework.renderers.JSONRenderer with the
+default settings (compact, unescaped UTF-8, U+2028/U+2029 escaped): values
+orjson doesn't handle natively -- Decimal, lazy strings, querysets -- and
+dates/times (passed through so 'Z' replaces '+00:00' like DRF does) go to
+DRF's own JSONEncoder.default. Pretty-printed output (?indent, the
+browsable API) and non-default COMPACT_JSON/UNICODE_JSON still go through
+the stdlib renderer.
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+_default = JSONEncoder().default
+
+
+def dumps(data):
+    """Serialize ``data`` exactly as DRF's default JSONRenderer would."""
+    ret = orjson.dumps(data, default=_default, option=OPTIONS)
+    # Same strict-javascript-subset escaping as DRF
+    return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        renderer_context = renderer_context or {}
+        if self.ensure_ascii or not self.compact or self.get_indent(accepted_media_type, renderer_context) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
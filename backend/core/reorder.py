@@ -0,0 +1,52 @@
+"""
+Drag-and-drop reordering for the dashboard lists.
+
+The dashboard sends the ids of a list in their new order; ``apply_order()``
+numbers them 1, 2, 3... in an order column and writes the rows whose
+number changed with one ``bulk_update()`` inside a transaction.
+``bulk_update()`` sends no signals, so ``updated_at`` is set here (for the
+?since= feeds and the fragment cache) and the model's payloads are
+invalidated once afterwards.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from .payloads import invalidate_payloads
+
+
+def parse_ids(data):
+    """The ``ids`` list of a reorder request body; ValueError when malformed."""
+    ids = data.get('ids') if hasattr(data, 'get') else None
+    if not isinstance(ids, list) or not ids or not all(type(pk) is int for pk in ids):
+        raise ValueError('ids must be a non-empty list of integer ids')
+    if len(set(ids)) != len(ids):
+        raise ValueError('ids must not contain duplicates')
+    return ids
+
+
+def apply_order(queryset, ids, field):
+    """Set ``field`` to each row's 1-based position in ``ids``. Returns the rows changed.
+
+    Every id must belong to ``queryset``; rows of it that are not listed
+    keep their number.
+    """
+    model = queryset.model
+    stamped = any(f.name == 'updated_at' for f in model._meta.concrete_fields)
+    now = timezone.now()
+    with transaction.atomic():
+        rows = {obj.pk: obj for obj in queryset.select_for_update().filter(pk__in=ids).only('pk', field)}
+        unknown = [pk for pk in ids if pk not in rows]
+        if unknown:
+            raise ValueError(f'Unknown ids: {", ".join(map(str, unknown))}')
+        changed = []
+        for position, pk in enumerate(ids, start=1):
+            obj = rows[pk]
+            if getattr(obj, field) != position:
+                setattr(obj, field, position)
+                if stamped:
+                    obj.updated_at = now
+                changed.append(obj)
+        model.objects.bulk_update(changed, [field, 'updated_at'] if stamped else [field])
+    if changed:
+        invalidate_payloads(model)
+    return len(changed)
@@ -0,0 +1,215 @@
+"""
+Analytics history at several resolutions.
+
+Each tracked hit is also added to its hour's AnalyticsRollup bucket (one
+UPDATE; the hour's first hit inserts the row). Days are the existing
+Analytics rows. ``manage.py compact_analytics`` (nightly) rolls the days
+up into week and month buckets, with unique visitors counted from the
+union of the days' HyperLogLog sketches, and drops hourly buckets older
+than ANALYTICS_HOURLY_DAYS. An hour's unique visitors are how much the
+day's estimate grew during it, so a day's hours add up to its count.
+
+``history()`` backs /api/analytics/history/. It reads one bucket per point:
+hours and weeks/months from their rollups, days from Analytics. Week and
+month periods the compaction hasn't finished (normally just the current
+one) are summed from their daily rows. The granularity is picked, or
+checked, so that no response has more than HISTORY_MAX_POINTS points.
+"""
+import re
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .hll import HyperLogLog
+from .models import Analytics, AnalyticsRollup
+
+HOUR, DAY, WEEK, MONTH = 'hour', 'day', 'week', 'month'
+GRANULARITIES = (HOUR, DAY, WEEK, MONTH)
+COUNTERS = ('page_views', 'unique_visitors', 'donations_received', 'contact_submissions')
+HISTORY_MAX_POINTS = 400
+DEFAULT_RANGE = '30d'
+
+# ?range=: a count and a unit (hours, days, weeks, months, years)
+RANGE_RE = re.compile(r'^([1-9]\d{0,3})([hdwmy])$')
+RANGE_UNITS = {'h': HOUR, 'd': DAY, 'w': WEEK, 'm': MONTH}
+
+
+def _midnight(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def floor(moment, granularity):
+    """Start of the bucket containing the aware datetime ``moment``."""
+    moment = timezone.localtime(moment)
+    if granularity == HOUR:
+        return moment.replace(minute=0, second=0, microsecond=0)
+    day = moment.date()
+    if granularity == WEEK:
+        day -= timedelta(days=day.weekday())
+    elif granularity == MONTH:
+        day = day.replace(day=1)
+    return _midnight(day)
+
+
+def shift(start, granularity, steps=1):
+    """``start`` (a bucket start) moved by ``steps`` buckets."""
+    if granularity == HOUR:
+        return start + timedelta(hours=steps)
+    day = timezone.localtime(start).date()
+    if granularity == MONTH:
+        months = day.year * 12 + day.month - 1 + steps
+        return _midnight(day.replace(year=months // 12, month=months % 12 + 1, day=1))
+    return _midnight(day + timedelta(days=steps * (7 if granularity == WEEK else 1)))
+
+
+def _points(start, end, granularity):
+    """Buckets from ``start`` to ``end`` (both bucket starts), inclusive."""
+    if granularity == MONTH:
+        start, end = timezone.localtime(start), timezone.localtime(end)
+        return (end.year - start.year) * 12 + end.month - start.month + 1
+    size = {HOUR: timedelta(hours=1), DAY: timedelta(days=1), WEEK: timedelta(weeks=1)}[granularity]
+    return (end - start) // size + 1
+
+
+def parse_range(raw, now):
+    """First bucket start of ``?range=`` ending at ``now`` (e.g. '30d': today and the 29 days before)."""
+    match = RANGE_RE.match(raw or DEFAULT_RANGE)
+    if not match:
+        raise ValueError('range must be a count and a unit: h, d, w, m or y (e.g. 48h, 30d, 12m)')
+    count, unit = int(match.group(1)), match.group(2)
+    if unit == 'y':
+        count, unit = count * 12, 'm'
+    granularity = RANGE_UNITS[unit]
+    return shift(floor(now, granularity), granularity, -(count - 1))
+
+
+def _hourly_cutoff(now):
+    return floor(now, HOUR) - timedelta(days=settings.ANALYTICS_HOURLY_DAYS)
+
+
+def choose_granularity(start, now, granularity=None):
+    """The requested granularity if it fits, else the finest one that does."""
+    if granularity is not None:
+        if granularity not in GRANULARITIES:
+            raise ValueError(f'granularity must be one of {", ".join(GRANULARITIES)}')
+        if granularity == HOUR and start < _hourly_cutoff(now):
+            raise ValueError(f'Hourly history covers the last {settings.ANALYTICS_HOURLY_DAYS} days')
+        if _points(floor(start, granularity), floor(now, granularity), granularity) > HISTORY_MAX_POINTS:
+            raise ValueError(f'More than {HISTORY_MAX_POINTS} points; use a coarser granularity or a shorter range')
+        return granularity
+    for candidate in GRANULARITIES:
+        if candidate == HOUR and start < _hourly_cutoff(now):
+            continue
+        if _points(floor(start, candidate), floor(now, candidate), candidate) <= HISTORY_MAX_POINTS:
+            return candidate
+    raise ValueError('range is too long')
+
+
+def record_hit(field, moment=None, amount=1):
+    """Add ``amount`` to ``field`` of the hourly bucket containing ``moment`` (default now)."""
+    hour = floor(moment or timezone.now(), HOUR)
+    bucket = AnalyticsRollup.objects.filter(granularity=AnalyticsRollup.HOUR, period_start=hour)
+    if bucket.update(**{field: F(field) + amount}):
+        return
+    try:
+        with transaction.atomic():
+            AnalyticsRollup.objects.create(granularity=AnalyticsRollup.HOUR, period_start=hour, **{field: amount})
+    except IntegrityError:
+        # Another request inserted the hour first
+        bucket.update(**{field: F(field) + amount})
+
+
+def _daily_rows(queryset):
+    return queryset.order_by('date').values('date', 'visitor_sketch', *(c for c in COUNTERS if c != 'unique_visitors'))
+
+
+def sum_days(rows, granularity):
+    """``{bucket start: counters}`` for Analytics ``rows`` grouped by week or month."""
+    totals, sketches = {}, {}
+    for row in rows:
+        start = floor(_midnight(row['date']), granularity)
+        bucket = totals.setdefault(start, dict.fromkeys(COUNTERS, 0))
+        for counter in COUNTERS:
+            if counter != 'unique_visitors':
+                bucket[counter] += row[counter]
+        sketches.setdefault(start, []).append(row['visitor_sketch'])
+    for start, blobs in sketches.items():
+        totals[start]['unique_visitors'] = HyperLogLog.union(blobs).count()
+    return totals
+
+
+def _latest_rollup(granularity):
+    return (
+        AnalyticsRollup.objects.filter(granularity=granularity)
+        .order_by('-period_start').values_list('period_start', flat=True).first()
+    )
+
+
+def compact(now=None):
+    """Roll days into weeks and months and prune old hours. Returns ``{'week': n, 'month': n, 'pruned': n}``.
+
+    Each run recomputes from the latest stored period on (it was probably
+    still open last time); the first run backfills every day.
+    """
+    now = now or timezone.now()
+    result = {}
+    for granularity in (WEEK, MONTH):
+        days = Analytics.objects.all()
+        latest = _latest_rollup(granularity)
+        if latest is not None:
+            days = days.filter(date__gte=timezone.localtime(latest).date())
+        periods = sum_days(_daily_rows(days).iterator(), granularity)
+        with transaction.atomic():
+            AnalyticsRollup.objects.filter(granularity=granularity, period_start__in=list(periods)).delete()
+            AnalyticsRollup.objects.bulk_create(
+                AnalyticsRollup(granularity=granularity, period_start=start, **counters)
+                for start, counters in periods.items()
+            )
+        result[granularity] = len(periods)
+    result['pruned'], _ = AnalyticsRollup.objects.filter(
+        granularity=HOUR, period_start__lt=_hourly_cutoff(now),
+    ).delete()
+    return result
+
+
+def _buckets(granularity, start):
+    """``{bucket start: counters}`` stored for ``granularity`` from ``start`` on."""
+    if granularity == DAY:
+        rows = Analytics.objects.filter(date__gte=timezone.localtime(start).date()).values('date', *COUNTERS)
+        return {_midnight(row.pop('date')): row for row in rows}
+    rows = AnalyticsRollup.objects.filter(granularity=granularity, period_start__gte=start).values('period_start', *COUNTERS)
+    buckets = {timezone.localtime(row.pop('period_start')): row for row in rows}
+    if granularity in (WEEK, MONTH):
+        # Periods the compaction hasn't closed yet come from their days
+        latest = _latest_rollup(granularity)
+        open_from = max(start, timezone.localtime(latest)) if latest is not None else start
+        days = Analytics.objects.filter(date__gte=timezone.localtime(open_from).date())
+        buckets.update(sum_days(_daily_rows(days), granularity))
+    return buckets
+
+
+def history(raw_range=None, granularity=None, now=None):
+    """Counters per bucket over ``raw_range``, oldest first, gaps filled with zeros.
+
+    Raises ValueError for a bad range or granularity.
+    """
+    now = now or timezone.now()
+    start = parse_range(raw_range, now)
+    granularity = choose_granularity(start, now, granularity)
+    start, end = floor(start, granularity), floor(now, granularity)
+    buckets = _buckets(granularity, start)
+
+    points = []
+    for step in range(_points(start, end, granularity)):
+        period = shift(start, granularity, step)
+        counters = buckets.get(period) or dict.fromkeys(COUNTERS, 0)
+        label = period.isoformat() if granularity == HOUR else period.date().isoformat()
+        points.append({'period': label, **{counter: counters[counter] for counter in COUNTERS}})
+    return {
+        'range': raw_range or DEFAULT_RANGE,
+        'granularity': granularity,
+        'history': points,
+    }
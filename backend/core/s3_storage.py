@@ -0,0 +1,7 @@
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from .storage import InstrumentedStorageMixin
+
+
+class InstrumentedS3Storage(InstrumentedStorageMixin, S3Boto3Storage):
+    pass
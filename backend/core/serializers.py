@@ -1,3 +1,4 @@
+from django.core.exceptions import FieldDoesNotExist
 from rest_framework import serializers
 from .models import (
     Event, TeamMember, Donation,
@@ -5,13 +6,84 @@ from .models import (
     Testimonial, GalleryItem, Congregation, Analytics, Advertisement, YStoreItem,
     Ministry, Sale, Expense, Contribution, VisionMission, Announcement
 )
-
-class EventSerializer(serializers.ModelSerializer):
+from .fieldsets import requested_fieldset, wanted
+
+
+class SparseModelSerializer(serializers.ModelSerializer):
+    """ModelSerializer that can be limited to a fieldset.
+
+    ``fields``/``exclude`` are the normalized tuples from
+    core.fieldsets.requested_fieldset(); ``sparse_queryset()`` narrows the
+    SQL to the model columns those fields read.
+    """
+
+    # Part of the core.fragments cache key; bump when the output changes
+    fragment_version = 1
+
+    def __init__(self, *args, fields=None, exclude=(), **kwargs):
+        self.sparse_fields = fields
+        self.sparse_exclude = exclude
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        return {
+            name: field for name, field in fields.items()
+            if wanted(name, self.sparse_fields, self.sparse_exclude)
+        }
+
+    @classmethod
+    def only_columns(cls, fields=None, exclude=(), keep=()):
+        """Model columns needed to render the fieldset, or None if unknown."""
+        opts = cls.Meta.model._meta
+        columns = {opts.pk.name, *keep}
+        for field in cls(fields=fields, exclude=exclude).fields.values():
+            source = field.source.split('.')[0]
+            if source.startswith('get_') and source.endswith('_display'):
+                source = source[len('get_'):-len('_display')]
+            try:
+                model_field = opts.get_field(source)
+            except FieldDoesNotExist:
+                # '*' (method fields), properties and methods may read anything
+                return None
+            if not model_field.concrete:
+                return None
+            columns.add(model_field.name)
+        return sorted(columns)
+
+    @classmethod
+    def sparse_queryset(cls, queryset, fields=None, exclude=(), keep=()):
+        """Defer the columns the fieldset doesn't render.
+
+        ``keep`` lists columns the view itself reads (e.g. to sort in Python)
+        so they are not loaded one query per row.
+        """
+        if fields is None and not exclude:
+            return queryset
+        columns = cls.only_columns(fields, exclude, keep)
+        return queryset.only(*columns) if columns else queryset
+
+    @classmethod
+    def for_list(cls, request, queryset, keep=()):
+        """``cls(queryset, many=True)`` honouring the request's fieldset."""
+        fields, exclude = requested_fieldset(request)
+        queryset = cls.sparse_queryset(queryset, fields, exclude, keep)
+        return cls(queryset, many=True, fields=fields, exclude=exclude)
+
+    @classmethod
+    def list_data(cls, request, queryset):
+        """``for_list(request, queryset).data``, reusing cached rows (core.fragments)."""
+        from .fragments import serialize_list
+        fields, exclude = requested_fieldset(request)
+        return serialize_list(cls, queryset, fields, exclude)
+
+
+class EventSerializer(SparseModelSerializer):
     class Meta:
         model = Event
         fields = '__all__'
 
-class TeamMemberSerializer(serializers.ModelSerializer):
+class TeamMemberSerializer(SparseModelSerializer):
     # Expose 'description' as a read-only alias of 'quote' for frontend compatibility
     description = serializers.CharField(source='quote', read_only=True)
 
@@ -19,7 +91,7 @@ class TeamMemberSerializer(serializers.ModelSerializer):
         model = TeamMember
         fields = '__all__'
 
-class DonationSerializer(serializers.ModelSerializer):
+class DonationSerializer(SparseModelSerializer):
     payment_status_display = serializers.CharField(source='get_payment_status_display', read_only=True)
     payment_method_display = serializers.CharField(source='get_payment_method_display', read_only=True)
     purpose_display = serializers.CharField(source='get_purpose_display', read_only=True)
@@ -29,68 +101,68 @@ class DonationSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ('receipt_code', 'created_at', 'updated_at', 'verified_at')
 
-class ContactMessageSerializer(serializers.ModelSerializer):
+class ContactMessageSerializer(SparseModelSerializer):
     class Meta:
         model = ContactMessage
         fields = '__all__'
 
-class MinistryRegistrationSerializer(serializers.ModelSerializer):
+class MinistryRegistrationSerializer(SparseModelSerializer):
     class Meta:
         model = MinistryRegistration
         fields = '__all__'
 
-class MinistrySerializer(serializers.ModelSerializer):
+class MinistrySerializer(SparseModelSerializer):
     class Meta:
         model = Ministry
         fields = '__all__'
 
-class BlogPostSerializer(serializers.ModelSerializer):
+class BlogPostSerializer(SparseModelSerializer):
     class Meta:
         model = BlogPost
         fields = '__all__'
 
-class TestimonialSerializer(serializers.ModelSerializer):
+class TestimonialSerializer(SparseModelSerializer):
     class Meta:
         model = Testimonial
         fields = '__all__'
 
-class GalleryItemSerializer(serializers.ModelSerializer):
+class GalleryItemSerializer(SparseModelSerializer):
     class Meta:
         model = GalleryItem
         fields = '__all__'
 
-class CongregationSerializer(serializers.ModelSerializer):
+class CongregationSerializer(SparseModelSerializer):
     class Meta:
         model = Congregation
         fields = '__all__'
 
-class AnalyticsSerializer(serializers.ModelSerializer):
+class AnalyticsSerializer(SparseModelSerializer):
     class Meta:
         model = Analytics
-        fields = '__all__'
+        exclude = ['visitor_sketch']
 
-class AdvertisementSerializer(serializers.ModelSerializer):
+class AdvertisementSerializer(SparseModelSerializer):
     class Meta:
         model = Advertisement
         fields = '__all__'
 
-class YStoreItemSerializer(serializers.ModelSerializer):
+class YStoreItemSerializer(SparseModelSerializer):
     class Meta:
         model = YStoreItem
         fields = '__all__'
 
 # Finance Management Serializers
-class SaleSerializer(serializers.ModelSerializer):
+class SaleSerializer(SparseModelSerializer):
     class Meta:
         model = Sale
         fields = '__all__'
 
-class ExpenseSerializer(serializers.ModelSerializer):
+class ExpenseSerializer(SparseModelSerializer):
     class Meta:
         model = Expense
         fields = '__all__'
 
-class ContributionSerializer(serializers.ModelSerializer):
+class ContributionSerializer(SparseModelSerializer):
     amount_left = serializers.SerializerMethodField()
 
     def get_amount_left(self, obj):
@@ -100,7 +172,7 @@ class ContributionSerializer(serializers.ModelSerializer):
         model = Contribution
         fields = '__all__'
 
-class VisionMissionSerializer(serializers.ModelSerializer):
+class VisionMissionSerializer(SparseModelSerializer):
     mission_image_url = serializers.SerializerMethodField()
     vision_image_url = serializers.SerializerMethodField()
 
@@ -127,7 +199,7 @@ class VisionMissionSerializer(serializers.ModelSerializer):
         return None
 
 
-class AnnouncementSerializer(serializers.ModelSerializer):
+class AnnouncementSerializer(SparseModelSerializer):
     class Meta:
         model = Announcement
         fields = '__all__'
\ No newline at end of file
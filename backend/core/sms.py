@@ -1,7 +1,8 @@
-import requests
 from django.conf import settings
 import logging
 
+from .metrics import timed
+
 logger = logging.getLogger(__name__)
 
 def send_sms(recipient, message):
@@ -33,8 +34,12 @@ def send_sms(recipient, message):
         "message": message
     }
 
+    # requests is only needed when a message is actually sent
+    import requests
+
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=10)
+        with timed('sms', 'send'):
+            response = requests.post(url, json=payload, headers=headers, timeout=10)
         data = response.json()
 
         if response.status_code == 200 and data.get("status") == "success":
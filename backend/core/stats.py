@@ -0,0 +1,152 @@
+"""
+Running site totals kept in the single SiteStats row.
+
+Each counter is a model plus exact-match conditions (and optionally a field
+to sum instead of counting rows). Model signals apply the difference a save
+or delete makes: pre_save reads the row's tracked columns as they were,
+post_save/post_delete add ``after - before`` to the counters with an
+F() update. Inside ``transaction.atomic()`` the pre_save read locks the row
+(select_for_update), so two concurrent saves of the same change (two admins
+verifying one donation) are applied once: the second reads the first's
+result. Views that change a tracked status save inside a transaction for
+that reason; other saves autocommit each step and could, rarely, count a
+racing change twice. Queryset ``update()`` and ``bulk_create()`` bypass
+signals, so ``manage.py reconcile_site_stats`` recomputes every counter
+exactly; a missing row is rebuilt the same way.
+
+The receivers are connected before payload invalidation (core.apps), so
+``impact_statistics`` is never rebuilt from the old totals under the new
+generation.
+"""
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+
+from .models import BlogPost, ContactMessage, Donation, Event, MinistryRegistration, SiteStats, TeamMember, Testimonial
+
+SITE_STATS_PK = 1
+
+# (SiteStats field, model, conditions, summed field or None to count rows)
+COUNTERS = [
+    ('events', Event, {}, None),
+    ('active_events', Event, {'is_deleted': False}, None),
+    ('team_members', TeamMember, {}, None),
+    ('active_team_members', TeamMember, {'is_active': True}, None),
+    ('published_blog_posts', BlogPost, {'is_published': True}, None),
+    ('active_testimonials', Testimonial, {'is_active': True}, None),
+    ('ministry_registrations', MinistryRegistration, {}, None),
+    ('contact_messages', ContactMessage, {}, None),
+    ('verified_donations', Donation, {'payment_status': 'verified'}, None),
+    ('verified_donation_amount', Donation, {'payment_status': 'verified'}, 'amount'),
+]
+
+TRACKED_MODELS = tuple(dict.fromkeys(model for _field, model, _conditions, _summed in COUNTERS))
+
+
+def _tracked_fields(model):
+    fields = set()
+    for _field, counter_model, conditions, summed in COUNTERS:
+        if counter_model is model:
+            fields.update(conditions)
+            if summed:
+                fields.add(summed)
+    return sorted(fields)
+
+
+def _contribution(values, conditions, summed):
+    """What one row (a dict of its tracked columns, or None) adds to a counter."""
+    if values is None or any(values[name] != expected for name, expected in conditions.items()):
+        return 0
+    if summed is None:
+        return 1
+    value = values[summed]
+    return Decimal(str(value)) if value is not None else 0
+
+
+def compute_site_stats():
+    """Every counter computed from scratch: one aggregate query per model."""
+    totals = {}
+    for model in TRACKED_MODELS:
+        aggregates = {}
+        for field, counter_model, conditions, summed in COUNTERS:
+            if counter_model is not model:
+                continue
+            condition = Q(**conditions) if conditions else None
+            if summed is None:
+                aggregates[field] = Count('pk', filter=condition)
+            else:
+                aggregates[field] = Sum(summed, filter=condition, default=0)
+        totals.update(model.objects.aggregate(**aggregates))
+    return totals
+
+
+def reconcile_site_stats():
+    """Recompute the row exactly. Returns ``(stats, {field: (stored, exact)})`` for drifted counters."""
+    with transaction.atomic():
+        exact = compute_site_stats()
+        stats, created = SiteStats.objects.select_for_update().get_or_create(pk=SITE_STATS_PK, defaults=exact)
+        drift = {}
+        if not created:
+            drift = {
+                field: (getattr(stats, field), value)
+                for field, value in exact.items() if getattr(stats, field) != value
+            }
+            for field, value in exact.items():
+                setattr(stats, field, value)
+            stats.save()
+    return stats, drift
+
+
+def get_site_stats():
+    stats = SiteStats.objects.filter(pk=SITE_STATS_PK).first()
+    if stats is None:
+        stats, _drift = reconcile_site_stats()
+    return stats
+
+
+def _apply(model, before, after):
+    deltas = {}
+    for field, counter_model, conditions, summed in COUNTERS:
+        if counter_model is model:
+            delta = _contribution(after, conditions, summed) - _contribution(before, conditions, summed)
+            if delta:
+                deltas[field] = F(field) + delta
+    if not deltas:
+        return
+    if not SiteStats.objects.filter(pk=SITE_STATS_PK).update(**deltas):
+        # First change since the table was created: the exact totals already include it
+        reconcile_site_stats()
+
+
+def _values(instance):
+    return {name: getattr(instance, name) for name in _tracked_fields(type(instance))}
+
+
+def _skips(sender, raw, update_fields):
+    # Fixture loads and saves that don't touch a tracked column
+    return raw or (update_fields is not None and not set(update_fields) & set(_tracked_fields(sender)))
+
+
+def remember_stats_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    """pre_save receiver: the tracked columns as stored before this save."""
+    before = None
+    if not _skips(sender, raw, update_fields) and not instance._state.adding and instance.pk is not None:
+        fields = _tracked_fields(sender)
+        rows = sender.objects.filter(pk=instance.pk)
+        if transaction.get_connection().in_atomic_block:
+            # Held until commit, so a concurrent save of this row reads our result
+            rows = rows.select_for_update()
+        # Plain row counts only care that the row already exists
+        before = rows.values(*fields).first() if fields else {}
+    instance._site_stats_before = before
+
+
+def update_stats_on_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    if _skips(sender, raw, update_fields):
+        return
+    _apply(sender, getattr(instance, '_site_stats_before', None), _values(instance))
+
+
+def update_stats_on_delete(sender, instance, **kwargs):
+    _apply(sender, _values(instance), None)
@@ -0,0 +1,31 @@
+from django.core.files.storage import FileSystemStorage
+
+from .metrics import timed
+
+
+class InstrumentedStorageMixin:
+    """Times the storage operations that hit disk or the network."""
+
+    def _save(self, name, content):
+        with timed('storage', 'save'):
+            return super()._save(name, content)
+
+    def _open(self, name, mode='rb'):
+        with timed('storage', 'open'):
+            return super()._open(name, mode)
+
+    def delete(self, name):
+        with timed('storage', 'delete'):
+            return super().delete(name)
+
+    def exists(self, name):
+        with timed('storage', 'exists'):
+            return super().exists(name)
+
+    def listdir(self, path):
+        with timed('storage', 'listdir'):
+            return super().listdir(path)
+
+
+class InstrumentedFileSystemStorage(InstrumentedStorageMixin, FileSystemStorage):
+    pass
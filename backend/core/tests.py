@@ -1,10 +1,23 @@
+import asyncio
 import json
+import os
+import shutil
+import tempfile
+import time
+from datetime import timedelta
+from io import StringIO
 
+from django.conf import settings
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
 from rest_framework.test import APIClient
 
-from core.models import Announcement, WebsiteSettings
+from core import metrics
+from core.hll import HyperLogLog
+from core.models import Advertisement, Analytics, Announcement, ContactMessage, GalleryItem, Supervisor, WebsiteSettings
 
 
 class PublicEndpointsSmokeTests(TestCase):
@@ -135,3 +148,1187 @@ class AnnouncementVenueTests(TestCase):
             {'title': 'Keep'}, format='json')
         announcement.refresh_from_db()
         self.assertEqual(announcement.venue, 'Original')
+
+
+class MediaGarbageCollectorTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, True)
+        self.settings_override = self.settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+
+    def _write(self, name, age_hours=48):
+        path = os.path.join(self.media_root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(b'x')
+        stamp = time.time() - age_hours * 3600
+        os.utime(path, (stamp, stamp))
+        return path
+
+    def _run(self, *args):
+        out = StringIO()
+        call_command('gc_media', *args, stdout=out)
+        return out.getvalue()
+
+    def test_collects_only_unreferenced_old_files(self):
+        GalleryItem.objects.create(title='Kept', category='image', image='gallery/kept.jpg')
+        Advertisement.objects.create(
+            title='Ad', description='d', category='food', advertiser_name='A',
+            advertiser_contact='0240000000', location='Kumasi',
+            images=[{'path': 'advertisements/ad.jpg', 'url': '/media/advertisements/ad.jpg'}],
+            expires_at=timezone.now() + timedelta(days=30))
+        kept = self._write('gallery/kept.jpg')
+        ad = self._write('advertisements/ad.jpg')
+        orphan = self._write('gallery/orphan.jpg')
+        fresh = self._write('gallery/fresh.jpg', age_hours=0)
+
+        output = self._run('--dry-run')
+        self.assertIn('gallery/orphan.jpg', output)
+        self.assertTrue(os.path.exists(orphan))
+
+        self._run()
+        self.assertFalse(os.path.exists(orphan))
+        for path in (kept, ad, fresh):
+            self.assertTrue(os.path.exists(path), path)
+
+    def test_quarantine_moves_instead_of_deleting(self):
+        self._write('team/old.jpg')
+        self._run('--quarantine')
+        self.assertFalse(os.path.exists(os.path.join(self.media_root, 'team/old.jpg')))
+        quarantined = [
+            files for _, _, files in os.walk(os.path.join(self.media_root, '_quarantine'))
+        ]
+        self.assertIn(['old.jpg'], quarantined)
+
+
+class MediaServingTests(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, True)
+        self.settings_override = self.settings(MEDIA_ROOT=self.media_root, MEDIA_ACCEL='')
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+        os.makedirs(os.path.join(self.media_root, 'gallery/videos'))
+        self.data = bytes(range(256)) * 4
+        with open(os.path.join(self.media_root, 'gallery/videos/clip.mp4'), 'wb') as f:
+            f.write(self.data)
+        self.url = '/media/gallery/videos/clip.mp4'
+
+    def test_full_response_is_cacheable(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), self.data)
+        self.assertEqual(response['Content-Type'], 'video/mp4')
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertIn('immutable', response['Cache-Control'])
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_range_requests(self):
+        response = self.client.get(self.url, HTTP_RANGE='bytes=100-199')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response['Content-Range'], 'bytes 100-199/1024')
+        self.assertEqual(response['Content-Length'], '100')
+        self.assertEqual(b''.join(response.streaming_content), self.data[100:200])
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=-24')
+        self.assertEqual(b''.join(response.streaming_content), self.data[-24:])
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=5000-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], 'bytes */1024')
+
+        # A stale If-Range gets the whole (changed) file instead of a slice
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-9', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+
+    async def test_range_under_asgi(self):
+        response = await self.async_client.get(self.url, headers={'range': 'bytes=10-19'})
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join([chunk async for chunk in response.streaming_content]), self.data[10:20])
+
+    def test_offloads_to_front_proxy(self):
+        with self.settings(MEDIA_ACCEL='x-accel-redirect', MEDIA_ACCEL_PREFIX='/protected-media/'):
+            response = self.client.get(self.url)
+        self.assertEqual(response['X-Accel-Redirect'], '/protected-media/gallery/videos/clip.mp4')
+        self.assertEqual(response.content, b'')
+        self.assertIn('ETag', response)
+
+    def test_rejects_paths_outside_media_root(self):
+        self.assertEqual(self.client.get('/media/..%2F..%2Fmanage.py').status_code, 400)
+        self.assertEqual(self.client.get('/media/gallery/').status_code, 404)
+
+
+class AdvertisementExpiryTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+
+    def _ad(self, title, status='approved', days=30):
+        return Advertisement.objects.create(
+            title=title, description='d', category='food', advertiser_name='A',
+            advertiser_contact='0240000000', location='Kumasi', status=status,
+            expires_at=timezone.now() + timedelta(days=days))
+
+    def test_public_list_hides_lapsed_ads(self):
+        self._ad('Live')
+        self._ad('Stale', days=-1)
+        titles = [a['title'] for a in self.client.get('/api/advertisements/').json()['advertisements']]
+        self.assertEqual(titles, ['Live'])
+
+    def test_sweep_marks_lapsed_ads_expired(self):
+        live = self._ad('Live')
+        stale = self._ad('Stale', days=-1)
+        pending = self._ad('Pending', status='pending', days=-1)
+        call_command('expire_advertisements', stdout=StringIO())
+        for ad, expected in ((live, 'approved'), (stale, 'expired'), (pending, 'pending')):
+            ad.refresh_from_db()
+            self.assertEqual(ad.status, expected)
+
+    def test_reapproving_expired_ad_renews_same_listing(self):
+        ad = self._ad('Renew me', status='expired', days=-5)
+        self.client.force_login(User.objects.create_user(username='ads', password='pass12345'))
+        response = self.client.put(f'/api/advertisements/{ad.id}/update/',
+                                   {'status': 'approved'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        ad.refresh_from_db()
+        self.assertEqual(ad.status, 'approved')
+        self.assertGreater(ad.expires_at, timezone.now() + timedelta(days=29))
+        self.assertEqual(Advertisement.objects.count(), 1)
+
+
+class UniqueVisitorSketchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_sketch_estimate_and_merge(self):
+        monday, tuesday = HyperLogLog(), HyperLogLog()
+        for i in range(5000):
+            monday.add(f'device-{i}')
+            tuesday.add(f'device-{i + 2500}')
+        self.assertAlmostEqual(monday.count(), 5000, delta=250)
+        merged = HyperLogLog.from_bytes(monday.to_bytes()).merge(tuesday)
+        self.assertAlmostEqual(merged.count(), 7500, delta=375)
+
+    def test_repeat_device_counted_once_per_day(self):
+        client = APIClient()
+        for device in ('a', 'b', 'a', 'a', 'c'):
+            client.post('/api/analytics/track/', {
+                'event_type': 'unique_visitor', 'device_id': device}, format='json')
+        today = Analytics.objects.get(date=timezone.now().date())
+        self.assertEqual(today.unique_visitors, 3)
+        self.assertTrue(today.visitor_sketch)
+
+    def test_weekly_uniques_merge_daily_sketches(self):
+        today = timezone.now().date()
+        for offset, devices in ((0, ['a', 'b']), (1, ['b', 'c']), (2, ['c', 'd'])):
+            for device in devices:
+                Analytics.record_visitor(device, today - timedelta(days=offset))
+        self.assertEqual(Analytics.unique_visitors_between(today - timedelta(days=6), today), 4)
+
+
+class MetricsEndpointTests(TestCase):
+    def setUp(self):
+        metrics.registry.reset()
+        cache.clear()
+
+    def test_requires_supervisor_or_token(self):
+        self.assertEqual(self.client.get('/api/metrics/').status_code, 401)
+        with self.settings(METRICS_TOKEN='scrape-secret'):
+            response = self.client.get('/api/metrics/', HTTP_AUTHORIZATION='Bearer scrape-secret')
+            self.assertEqual(self.client.get('/api/metrics/', HTTP_AUTHORIZATION='Bearer wrong').status_code, 401)
+            self.assertEqual(self.client.get('/api/metrics/', HTTP_AUTHORIZATION='Bearer s\u00e9cret').status_code, 401)
+        self.assertEqual(response.status_code, 200)
+
+    def test_records_route_latency_and_queries(self):
+        self.client.get('/api/events/')
+        self.client.get('/api/events/')
+        user = User.objects.create_user(username='ops', password='pass12345')
+        Supervisor.objects.create(user=user)
+        self.client.force_login(user)
+        body = self.client.get('/api/metrics/').content.decode()
+        self.assertIn('ypg_http_requests_total{method="GET",route="api/events/",status="200"} 2', body)
+        self.assertIn('ypg_http_request_duration_seconds_count{method="GET",route="api/events/"} 2', body)
+        # The second request is served from the payload cache
+        self.assertIn('ypg_db_queries_total{route="api/events/"} 1', body)
+
+    def test_timed_records_external_calls(self):
+        with metrics.timed('smtp', 'send'):
+            pass
+        body = metrics.render_prometheus([metrics.registry.snapshot()])
+        self.assertIn('ypg_external_call_duration_seconds_count{operation="send",service="smtp"} 1', body)
+
+    def test_directory_mode_sums_worker_snapshots(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        other_worker = metrics.MetricsRegistry()
+        other_worker.inc('ypg_http_requests_total', {'route': 'api/team/', 'method': 'GET', 'status': '200'}, 5)
+        with open(os.path.join(directory, 'other-1.json'), 'w') as f:
+            json.dump(other_worker.snapshot(), f)
+        metrics.registry.inc('ypg_http_requests_total', {'route': 'api/team/', 'method': 'GET', 'status': '200'}, 2)
+        with self.settings(METRICS_MODE='directory', METRICS_DIR=directory):
+            body = metrics.render_prometheus(metrics.registry.collect_snapshots())
+        self.assertIn('ypg_http_requests_total{method="GET",route="api/team/",status="200"} 7', body)
+
+
+class RequestProfilerTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='ops', password='pass12345')
+        Supervisor.objects.create(user=self.user)
+
+    def test_header_ignored_for_anonymous_requests(self):
+        response = self.client.get('/api/events/', HTTP_X_PROFILE='1')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('X-Profile-Id', response)
+
+    def test_supervisor_gets_summary_headers_and_report(self):
+        self.client.force_login(self.user)
+        response = self.client.get('/api/events/', HTTP_X_PROFILE='1')
+        self.assertEqual(response['X-Profile-SQL-Count'], '1')
+        self.assertIn('X-Profile-Top', response)
+
+        report = self.client.get(f'/api/profiler/{response["X-Profile-Id"]}/').json()['profile']
+        self.assertEqual(report['path'], '/api/events/')
+        self.assertEqual(len(report['queries']), 1)
+        self.assertIn('core_event', report['queries'][0]['sql'])
+        self.assertTrue(report['functions'])
+
+        self.client.logout()
+        self.assertEqual(self.client.get(f'/api/profiler/{report["id"]}/').status_code, 401)
+
+    def test_sampling_writes_slow_profiles_to_disk(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, True)
+        with self.settings(PROFILER_SAMPLE_RATE=1.0, PROFILER_SLOW_MS=0, PROFILER_DIR=directory):
+            response = self.client.get('/api/events/')
+        self.assertNotIn('X-Profile-Id', response)
+        suffixes = sorted(os.path.splitext(name)[1] for name in os.listdir(directory))
+        self.assertEqual(suffixes, ['.json', '.prof'])
+
+
+class AsyncPublicEndpointTests(TestCase):
+    def setUp(self):
+        metrics.registry.reset()
+        cache.clear()
+        Announcement.objects.create(title='Rally', venue='Ahinsan')
+
+    async def test_async_views_serve_under_asgi(self):
+        response = await self.async_client.get('/api/announcements/')
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertTrue(body['success'])
+        self.assertEqual([a['title'] for a in body['announcements']], ['Rally'])
+        self.assertEqual((await self.async_client.post('/api/announcements/')).status_code, 405)
+
+    async def test_metrics_count_queries_from_async_views(self):
+        await self.async_client.get('/api/announcements/')
+        body = metrics.render_prometheus([metrics.registry.snapshot()])
+        # (pk, updated_at) for the list, then the rows not in the fragment cache
+        self.assertIn('ypg_db_queries_total{route="api/announcements/"} 2', body)
+
+    def test_async_views_still_serve_under_wsgi(self):
+        response = self.client.get('/api/gallery/')
+        self.assertEqual(response.json()['media'], [])
+        self.assertEqual(response.json()['facets']['total'], 0)
+
+
+class PayloadCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_listing_is_cached_until_model_changes(self):
+        Announcement.objects.create(title='Rally', venue='Ahinsan')
+        self.client.get('/api/announcements/')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/announcements/')
+        self.assertEqual(len(response.json()['announcements']), 1)
+
+        Announcement.objects.create(title='Camp', venue='Kumasi')
+        titles = [a['title'] for a in self.client.get('/api/announcements/').json()['announcements']]
+        self.assertCountEqual(titles, ['Rally', 'Camp'])
+
+    def test_warm_caches_primes_entries_and_reports_timings(self):
+        out = StringIO()
+        call_command('warm_caches', workers=0, stdout=out)
+        self.assertIn('Warmed 15/15 cache entries', out.getvalue())
+        self.assertIn('team', out.getvalue())
+        with self.assertNumQueries(0):
+            self.client.get('/api/team/')
+            self.client.get('/api/events/', {'type': 'upcoming', 'excludeDeleted': 'true'})
+
+
+class PayloadStampedeTests(TestCase):
+    def setUp(self):
+        import threading
+        from core.payloads import payload
+
+        cache.clear()
+        self.builds = 0
+        self.value = 'v1'
+        self.counter_lock = threading.Lock()
+
+        def build_slow():
+            with self.counter_lock:
+                self.builds += 1
+            time.sleep(0.2)
+            return self.value
+
+        async def abuild_slow():
+            self.builds += 1
+            await asyncio.sleep(0.2)
+            return self.value
+
+        payload('slow_test')(build_slow)
+        payload('aslow_test')(abuild_slow)
+
+    def tearDown(self):
+        from core.payloads import _registry
+        _registry.pop('slow_test')
+        _registry.pop('aslow_test')
+
+    def fetch_concurrently(self, count=8):
+        from concurrent.futures import ThreadPoolExecutor
+        from core.payloads import get_payload
+        with ThreadPoolExecutor(count) as pool:
+            return list(pool.map(lambda _: get_payload('slow_test'), range(count)))
+
+    def test_concurrent_misses_build_once(self):
+        self.assertEqual(self.fetch_concurrently(), ['v1'] * 8)
+        self.assertEqual(self.builds, 1)
+
+    def test_stale_entry_is_served_while_one_request_rebuilds(self):
+        from core.payloads import _payload_key, get_payload
+
+        get_payload('slow_test')
+        key = _payload_key('slow_test', 0, {})
+        cache.set(key, (0, 'v1'))  # past its soft expiry
+        self.value = 'v2'
+        results = self.fetch_concurrently()
+        self.assertEqual(self.builds, 2)
+        # The lock holder gets the new value; the others don't wait for it
+        self.assertEqual(set(results), {'v1', 'v2'})
+        self.assertEqual(get_payload('slow_test'), 'v2')
+
+    def test_async_misses_build_once(self):
+        from core.payloads import aget_payload
+
+        async def fetch_all():
+            return await asyncio.gather(*(aget_payload('aslow_test') for _ in range(8)))
+
+        self.assertEqual(asyncio.run(fetch_all()), ['v1'] * 8)
+        self.assertEqual(self.builds, 1)
+
+    def test_expiry_is_jittered_below_the_timeout(self):
+        from core.payloads import _entry
+
+        now = timezone.now().timestamp()
+        expiries = {_entry('slow_test', None, now)[0][0] - now for _ in range(20)}
+        self.assertGreater(len(expiries), 1)
+        timeout = settings.PAYLOAD_CACHE_SECONDS
+        for fresh_for in expiries:
+            self.assertGreaterEqual(fresh_for, timeout * (1 - settings.PAYLOAD_TTL_JITTER) - 1)
+            self.assertLessEqual(fresh_for, timeout + 1)
+
+    @override_settings(SHARED_CACHE=False, LOCAL_PAYLOAD_CACHE_SECONDS=5)
+    def test_per_process_caches_keep_payloads_briefly(self):
+        # Other workers never see this one's invalidations
+        from core.payloads import _entry
+
+        (fresh_until, _data, _built_at), timeout = _entry('slow_test', None, 0)
+        self.assertLessEqual(fresh_until - timezone.now().timestamp(), 5)
+        self.assertEqual(timeout, 5)
+
+
+class StartupTests(TestCase):
+    def test_urlconf_defers_view_modules(self):
+        from django.urls import resolve
+        from core.urls import LazyView
+        match = resolve('/api/team/')
+        self.assertIsInstance(match.func, LazyView)
+        self.assertTrue(match.func.csrf_exempt)
+        response = self.client.get('/api/team/')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['success'])
+
+    def test_cold_start_stays_within_budget(self):
+        from core.management.commands.bench_startup import DEFERRED_MODULES, measure_startup
+        elapsed, modules = measure_startup()
+        loaded = {name.strip() for name in modules}
+        for name in DEFERRED_MODULES:
+            self.assertNotIn(name, loaded)
+        self.assertNotIn('core.views.donations', loaded)
+        self.assertLess(elapsed * 1000, settings.STARTUP_BUDGET_MS)
+
+    def test_health_check_keeps_view_modules_deferred(self):
+        # Populating the resolver (first reverse() or request) must not
+        # resolve every LazyView
+        from core.management.commands.bench_startup import deferred_loaded, modules_after_health_check
+        self.assertEqual(deferred_loaded(modules_after_health_check()), [])
+
+
+class JSONRenderingTests(TestCase):
+    def test_orjson_renderer_matches_drf_output(self):
+        from datetime import date, datetime, time as dt_time, timezone as dt_timezone
+        from decimal import Decimal
+        from django.utils.translation import gettext_lazy
+        from rest_framework.exceptions import ErrorDetail
+        from rest_framework.renderers import JSONRenderer
+        from core.renderers import ORJSONRenderer
+
+        data = {
+            'amount': Decimal('1250.50'),
+            'utc': datetime(2025, 3, 1, 9, 30, 0, 123456, tzinfo=dt_timezone.utc),
+            'naive': datetime(2025, 3, 1, 9, 30),
+            'day': date(2025, 3, 1),
+            'at': dt_time(18, 0),
+            'text': 'Nyame ne hene \u2028\u2029 \u2713',
+            'error': ErrorDetail('Required', code='required'),
+            'lazy': gettext_lazy('Home'),
+            1: [1.5, None, True],
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertEqual(
+            ORJSONRenderer().render(data, 'application/json; indent=2'),
+            JSONRenderer().render(data, 'application/json; indent=2'),
+        )
+
+    def test_invalid_json_body_is_a_bad_request(self):
+        response = self.client.post('/api/donations/submit/', '{"amount": ', content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['data']['error'], 'Invalid JSON data')
+
+    def test_json_benchmark_reports_identical_output(self):
+        out = StringIO()
+        call_command('bench_json', rows=50, repeat=1, stdout=out)
+        self.assertIn('output identical', out.getvalue())
+
+
+class ListProjectionTests(TestCase):
+    def test_full_projections_match_the_serializers(self):
+        from core.models import Event
+        from core.projections import EVENT_LIST, GALLERY_LIST
+        from core.serializers import EventSerializer, GalleryItemSerializer
+
+        now = timezone.now()
+        Event.objects.create(title='Rally', description='d', event_type='rally', start_date=now,
+                             end_date=now + timedelta(hours=2), location='Ahinsan', image='events/rally.jpg')
+        GalleryItem.objects.create(title='Camp', category='camp', video='gallery/videos/camp.mp4', date=now.date())
+        self.assertEqual(EVENT_LIST.rows(Event.objects.all()), EventSerializer(Event.objects.all(), many=True).data)
+        self.assertEqual(
+            GALLERY_LIST.rows(GalleryItem.objects.all()),
+            GalleryItemSerializer(GalleryItem.objects.all(), many=True).data,
+        )
+
+    def test_website_cards_leave_out_private_and_heavy_columns(self):
+        from core.models import BlogPost, Testimonial
+
+        cache.clear()
+        Testimonial.objects.create(name='Ama', phone='0240000000', content='Blessed', status='approved',
+                                   admin_notes='called back')
+        card = self.client.get('/api/testimonials/', {'forWebsite': 'true'}).json()['testimonials'][0]
+        self.assertEqual(card['name'], 'Ama')
+        self.assertNotIn('phone', card)
+        self.assertNotIn('admin_notes', card)
+
+        BlogPost.objects.create(title='Revival', content='<p>long</p>', excerpt='short', is_published=True)
+        post = self.client.get('/api/blog/', {'forWebsite': 'true'}).json()['posts'][0]
+        self.assertEqual(post['summary'], 'short')
+        self.assertNotIn('content', post)
+        self.assertNotIn('content_html', post)
+        detail = self.client.get(f'/api/blog/{post["slug"]}/').json()['post']
+        self.assertEqual(detail['content'], '<p>long</p>')
+
+    def test_projection_benchmark_checks_output(self):
+        out = StringIO()
+        call_command('bench_projections', rows=5, repeat=1, stdout=out)
+        self.assertIn('rolled back', out.getvalue())
+
+
+class SparseFieldsetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_fields_narrow_payload_and_sql(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from core.models import TeamMember
+
+        TeamMember.objects.create(name='Kofi', position='Secretary', quote='Serve with joy', phone='0240000000')
+        TeamMember.objects.create(name='Ama', position='President')
+        with CaptureQueriesContext(connection) as queries:
+            team = self.client.get('/api/team/', {'fields': 'name,position,image'}).json()['team']
+        self.assertEqual(team, [
+            {'name': 'Ama', 'position': 'President', 'image': None},
+            {'name': 'Kofi', 'position': 'Secretary', 'image': None},
+        ])
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('"quote"', queries[0]['sql'])
+
+        # The full listing is cached separately from the narrowed one
+        full = self.client.get('/api/team/').json()['team']
+        self.assertEqual(full[1]['description'], 'Serve with joy')
+        self.assertEqual(self.client.get('/api/team/', {'exclude': 'phone,quote,description'}).json()['team'][1].keys(),
+                         full[1].keys() - {'phone', 'quote', 'description'})
+
+    def test_ads_strip_fields(self):
+        Advertisement.objects.create(
+            title='Youth camp', description='d', category='food', advertiser_name='A', advertiser_contact='0240000000',
+            location='Kumasi', status='approved', images=[{'url': '/media/advertisements/a.jpg'}],
+            expires_at=timezone.now() + timedelta(days=3))
+        ads = self.client.get('/api/advertisements/', {'fields': 'title,images'}).json()['advertisements']
+        self.assertEqual(ads, [{'title': 'Youth camp', 'images': [{'url': '/media/advertisements/a.jpg'}]}])
+
+    async def test_async_listings_accept_fieldsets(self):
+        await Announcement.objects.acreate(title='Rally', venue='Ahinsan')
+        response = await self.async_client.get('/api/announcements/', {'fields': 'title'})
+        self.assertEqual(response.json()['announcements'], [{'title': 'Rally'}])
+        response = await self.async_client.get('/api/announcements/')
+        self.assertIn('venue', response.json()['announcements'][0])
+
+    def test_unknown_field_names_share_cache_keys(self):
+        from unittest import mock
+        from core import payloads
+
+        builds = []
+        builder, models = payloads._registry['events']
+
+        async def counting(**params):
+            builds.append(params)
+            return await builder(**params)
+
+        with mock.patch.dict(payloads._registry, {'events': (counting, models)}):
+            for junk in ('junk1', 'junk2', 'junk1,junk3'):
+                self.assertEqual(self.client.get('/api/events/', {'fields': junk}).status_code, 200)
+            self.client.get('/api/events/', {'fields': 'title,junk1'})
+            self.client.get('/api/events/', {'fields': 'title,junk2'})
+            self.client.get('/api/events/', {'exclude': 'junk1'})
+            self.client.get('/api/events/')
+        self.assertEqual([(p['fields'], p['exclude']) for p in builds], [((), ()), (('title',), ()), (None, ())])
+
+
+class GalleryFilterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        day = timezone.now().date()
+        GalleryItem.objects.create(title='Camp 1', category='camp', congregation='Ahinsan', image='gallery/1.jpg',
+                                   date=day, is_featured=True)
+        GalleryItem.objects.create(title='Camp 2', category='camp', congregation='Kotei',
+                                   video='gallery/videos/2.mp4', date=day - timedelta(days=40))
+        GalleryItem.objects.create(title='Rally', category='rally', congregation='Ahinsan',
+                                   youtube_url='https://youtu.be/x', date=day - timedelta(days=400))
+
+    def test_filters_and_facets(self):
+        with self.assertNumQueries(2):
+            body = self.client.get('/api/gallery/', {'category': 'camp'}).json()
+        self.assertEqual([m['title'] for m in body['media']], ['Camp 2', 'Camp 1'])
+        self.assertEqual(body['facets'], {
+            'total': 2,
+            # Categories ignore the category filter itself
+            'category': {'camp': 2, 'rally': 1},
+            'congregation': {'Ahinsan': 1, 'Kotei': 1},
+            'media_type': {'image': 1, 'video': 1},
+        })
+
+        titles = lambda params: [m['title'] for m in self.client.get('/api/gallery/', params).json()['media']]
+        self.assertEqual(titles({'mediaType': 'youtube'}), ['Rally'])
+        self.assertEqual(titles({'featured': 'true'}), ['Camp 1'])
+        since = (timezone.now().date() - timedelta(days=60)).isoformat()
+        self.assertCountEqual(titles({'dateFrom': since}), ['Camp 1', 'Camp 2'])
+        self.assertCountEqual(titles({'congregation': 'Ahinsan', 'dateTo': since}), ['Rally'])
+
+    def test_rejects_bad_filters(self):
+        self.assertEqual(self.client.get('/api/gallery/', {'dateFrom': '2025-13-40'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/gallery/', {'mediaType': 'gif'}).status_code, 400)
+
+
+class EventCalendarTests(TestCase):
+    def setUp(self):
+        from datetime import datetime, timezone as dt_timezone
+        from core.models import Event
+
+        cache.clear()
+        at = lambda *args: datetime(*args, tzinfo=dt_timezone.utc)
+        for title, start, end in [
+            ('Camp', at(2025, 2, 27, 8), at(2025, 3, 2, 18)),
+            ('Rally', at(2025, 3, 15, 9), at(2025, 3, 15, 13)),
+            ('Picnic', at(2025, 4, 5, 10), at(2025, 4, 5, 16)),
+        ]:
+            Event.objects.create(title=title, description='d', event_type='rally', start_date=start, end_date=end,
+                                 location='Ahinsan')
+
+    def test_range_filter_matches_overlapping_events(self):
+        titles = lambda params: [e['title'] for e in self.client.get('/api/events/', params).json()['events']]
+        self.assertEqual(titles({'from': '2025-03-01', 'to': '2025-03-31'}), ['Rally', 'Camp'])
+        self.assertEqual(titles({'from': '2025-03-15'}), ['Picnic', 'Rally'])
+        self.assertEqual(titles({'to': '2025-02-27'}), ['Camp'])
+        self.assertEqual(self.client.get('/api/events/', {'from': 'soon'}).status_code, 400)
+
+    def test_calendar_groups_a_month_by_day(self):
+        with self.assertNumQueries(1):
+            body = self.client.get('/api/events/calendar/', {'month': '2025-03'}).json()
+        self.assertEqual(body['month'], '2025-03')
+        self.assertEqual(
+            [(day['date'], [e['title'] for e in day['events']]) for day in body['days']],
+            [('2025-03-01', ['Camp']), ('2025-03-02', ['Camp']), ('2025-03-15', ['Rally'])],
+        )
+        self.assertEqual(body['days'][2]['events'][0]['start_date'], '2025-03-15T09:00:00Z')
+        self.assertNotIn('description', body['days'][2]['events'][0])
+        self.assertEqual(self.client.get('/api/events/calendar/', {'month': '2025-13'}).status_code, 400)
+
+
+class BlogRenderingTests(TestCase):
+    def test_save_renders_escaped_html_and_summary(self):
+        from core.models import BlogPost
+
+        post = BlogPost.objects.create(
+            title='Revival Week',
+            content='Day one <script>x</script>\nsee https://ypg.org\n\n' + 'Praise and worship. ' * 150,
+        )
+        self.assertEqual(
+            post.content_html.split('\n\n')[0],
+            '<p>Day one &lt;script&gt;x&lt;/script&gt;<br>see '
+            '<a href="https://ypg.org" rel="nofollow">https://ypg.org</a></p>',
+        )
+        self.assertEqual(post.summary, 'Day one <script>x</script> see https://ypg.org')
+        self.assertEqual(post.word_count, 455)
+        self.assertEqual(post.reading_time, 3)
+
+        post.excerpt = 'A week of prayer'
+        post.save(update_fields=['excerpt'])
+        post.refresh_from_db()
+        self.assertEqual(post.summary, 'A week of prayer')
+
+    def test_slug_collisions_take_one_query(self):
+        from core.models import BlogPost
+
+        for slug in ['revival', 'revival-1', 'revival-2', 'revival-week']:
+            BlogPost.objects.create(title='x', slug=slug, content='c')
+        post = BlogPost(title='Revival', content='c')
+        with self.assertNumQueries(2):  # slug lookup + insert
+            post.save()
+        self.assertEqual(post.slug, 'revival-3')
+
+    def test_detail_view_counts_without_resaving(self):
+        from core.models import BlogPost
+
+        post = BlogPost.objects.create(title='Camp', content='Camp notes', is_published=True)
+        updated_at = post.updated_at
+        body = self.client.get(f'/api/blog/{post.slug}/').json()['post']
+        self.assertEqual(body['views'], 1)
+        self.assertEqual(body['content_html'], '<p>Camp notes</p>')
+        post.refresh_from_db()
+        self.assertEqual((post.views, post.updated_at), (1, updated_at))
+
+
+class RelatedPostsTests(TestCase):
+    def setUp(self):
+        from core.models import BlogPost
+
+        self.posts = {}
+        for slug, title, category, content in [
+            ('camp', 'Youth camp recap', 'Youth', 'Camp games, bonfire worship and leadership training for the youth.'),
+            ('camp-prep', 'Preparing for camp', 'Youth', 'Packing list for camp: tents, bonfire wood, youth guides.'),
+            ('hymns', 'Favourite hymns', 'Worship', 'The choir sang hymns of praise and thanksgiving.'),
+            ('choir', 'Choir rehearsal', 'Worship', 'Choir practice: new hymns, harmonies and praise songs.'),
+            ('draft', 'Camp draft', 'Youth', 'Unpublished camp bonfire youth notes.'),
+        ]:
+            self.posts[slug] = BlogPost.objects.create(
+                title=title, slug=slug, category=category, content=content, is_published=slug != 'draft',
+            )
+
+    def related(self, slug):
+        return [post['slug'] for post in self.client.get(f'/api/blog/{slug}/related/').json()['posts']]
+
+    def test_rebuild_links_posts_on_the_same_topic(self):
+        from core.related import rebuild_related
+
+        self.assertEqual(rebuild_related(k=2), (4, 4))
+        with self.assertNumQueries(1):
+            self.assertEqual(self.related('camp')[0], 'camp-prep')
+        self.assertEqual(self.related('hymns')[0], 'choir')
+        self.assertEqual(self.related('draft'), [])
+        self.assertEqual(self.related('missing'), [])
+        post = self.client.get('/api/blog/choir/related/').json()['posts'][0]
+        self.assertEqual(set(post), {'id', 'title', 'slug', 'summary', 'image', 'category', 'date', 'reading_time'})
+        # Lists are only rewritten when they change
+        self.assertEqual(rebuild_related(k=2), (4, 0))
+
+    def test_refresh_follows_an_edit_and_an_unpublish(self):
+        from core.related import rebuild_related, refresh_related
+
+        rebuild_related(k=2)
+        choir = self.posts['choir']
+        choir.title, choir.category = 'Camp choir', 'Youth'
+        choir.content = 'The youth camp choir sang around the bonfire.'
+        choir.save()
+        refresh_related([choir.pk], k=2)
+        self.assertEqual(set(self.related('choir')), {'camp', 'camp-prep'})
+
+        camp_prep = self.posts['camp-prep']
+        camp_prep.is_published = False
+        camp_prep.save()
+        refresh_related([camp_prep.pk], k=2)
+        self.assertNotIn('camp-prep', self.related('camp'))
+        self.assertEqual(self.related('camp-prep'), [])
+
+    def test_refresh_scores_a_new_post_against_the_stored_index(self):
+        from core.models import BlogPost, BlogPostVector, RelatedTerm
+        from core.related import rebuild_related, refresh_related
+
+        rebuild_related(k=2)
+        terms = set(RelatedTerm.objects.values_list('term', flat=True))
+        bonfire = BlogPost.objects.create(
+            title='Camp bonfire night', slug='bonfire', category='Youth',
+            content='Youth camp bonfire stories and leadership games.', is_published=True,
+        )
+        refresh_related([bonfire.pk], k=2)
+        self.assertEqual(set(self.related('bonfire')), {'camp', 'camp-prep'})
+        self.assertIn('bonfire', self.related('camp'))
+        self.assertEqual(BlogPostVector.objects.count(), 5)
+        # The vocabulary only changes with a full rebuild
+        self.assertEqual(set(RelatedTerm.objects.values_list('term', flat=True)), terms)
+
+        bonfire.delete()
+        refresh_related([bonfire.pk], k=2)
+        self.assertNotIn('bonfire', self.related('camp'))
+        self.assertEqual(BlogPostVector.objects.count(), 4)
+
+    def test_benchmark_reports_rebuild_time(self):
+        from core.models import BlogPost
+
+        BlogPost.objects.all().delete()
+        out = StringIO()
+        call_command('bench_related', posts=40, words=30, stdout=out)
+        self.assertIn('40 posts', out.getvalue())
+        self.assertFalse(BlogPost.objects.exists())
+
+
+class SiteStatsTests(TestCase):
+    def donation(self, amount, status='pending'):
+        from core.models import Donation
+
+        return Donation.objects.create(donor_name='Kofi', email='kofi@example.com', phone='0240000000',
+                                       amount=amount, payment_method='momo', payment_status=status)
+
+    def test_signals_track_creates_status_changes_and_deletes(self):
+        from decimal import Decimal
+        from core.models import TeamMember
+        from core.stats import compute_site_stats, get_site_stats
+
+        first = self.donation('50.00', 'verified')
+        second = self.donation('20.50')
+        member = TeamMember.objects.create(name='Ama', position='President')
+        stats = get_site_stats()
+        self.assertEqual((stats.verified_donations, stats.verified_donation_amount), (1, Decimal('50.00')))
+
+        second.payment_status = 'verified'
+        second.save()
+        member.is_active = False
+        member.save()
+        first.delete()
+        stats = get_site_stats()
+        self.assertEqual((stats.verified_donations, stats.verified_donation_amount), (1, Decimal('20.50')))
+        self.assertEqual((stats.team_members, stats.active_team_members), (1, 0))
+        self.assertEqual({field: getattr(stats, field) for field in compute_site_stats()}, compute_site_stats())
+
+    def test_reconcile_corrects_drift(self):
+        from core.models import SiteStats
+        from core.stats import get_site_stats
+
+        self.donation('10.00', 'verified')
+        get_site_stats()
+        SiteStats.objects.update(verified_donations=7, contact_messages=3)
+        out = StringIO()
+        call_command('reconcile_site_stats', stdout=out)
+        self.assertIn('verified_donations: 7 -> 1', out.getvalue())
+        self.assertIn('2 counter(s) corrected', out.getvalue())
+        self.assertEqual(get_site_stats().contact_messages, 0)
+
+    def test_stats_are_updated_before_payloads_are_invalidated(self):
+        from unittest import mock
+        from core import payloads
+        from core.stats import get_site_stats
+
+        donation = self.donation('30.00')
+        get_site_stats()
+        seen = []
+        generation_key = payloads._generation_key
+
+        def record(name):
+            if name == 'impact_statistics':
+                # What a request rebuilding the payload right now would read
+                seen.append(get_site_stats().verified_donations)
+            return generation_key(name)
+
+        donation.payment_status = 'verified'
+        with mock.patch.object(payloads, '_generation_key', side_effect=record):
+            donation.save()
+        self.assertEqual(seen, [1])
+
+    def test_endpoints_read_the_stats_row(self):
+        cache.clear()
+        self.donation('75.00', 'verified')
+        with self.assertNumQueries(1):
+            body = self.client.get('/api/impact-statistics/').json()
+        self.assertEqual(body['data']['total_amount'], 75.0)
+
+        client = APIClient()
+        client.force_login(User.objects.create_user(username='admin', password='pass12345'))
+        analytics = client.get('/api/analytics/').json()['analytics']
+        self.assertEqual((analytics['total_donations'], analytics['total_events']), (75.0, 0))
+
+
+class PendingCountsTests(TestCase):
+    def setUp(self):
+        from core.models import ContactMessage, MinistryRegistration, Testimonial
+
+        cache.clear()
+        Testimonial.objects.create(name='Ama', content='Blessed')
+        Testimonial.objects.create(name='Kofi', content='Grateful', status='approved')
+        Testimonial.objects.create(name='Yaw', content='Removed', is_deleted=True)
+        self.message = ContactMessage.objects.create(name='Esi', email='esi@example.com', subject='Hi', message='Hello')
+        MinistryRegistration.objects.create(name='Kwame', ministry='Choir', congregation='Ahinsan')
+
+    def test_counts_come_from_one_query(self):
+        from core.payloads import get_payload
+
+        with self.assertNumQueries(1):
+            counts = get_payload('pending_counts')
+        self.assertEqual(counts, {
+            'testimonials': 1, 'contact_messages': 1, 'advertisements': 0, 'donations': 0,
+            'ministry_registrations': 1, 'total': 3,
+        })
+
+    def test_endpoint_requires_login_and_follows_writes(self):
+        self.assertEqual(self.client.get('/api/admin/pending-counts/').status_code, 401)
+        client = APIClient()
+        client.force_login(User.objects.create_user(username='admin', password='pass12345'))
+        self.assertEqual(client.get('/api/admin/pending-counts/').json()['counts']['contact_messages'], 1)
+        self.message.is_read = True
+        self.message.save()
+        counts = client.get('/api/admin/pending-counts/').json()['counts']
+        self.assertEqual((counts['contact_messages'], counts['total']), (0, 2))
+
+
+@override_settings(LIVE_EVENTS_STREAM_SECONDS=0.3, LIVE_EVENTS_POLL_SECONDS=0.05)
+class LiveEventsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='admin', password='pass12345')
+
+    async def collect(self, response):
+        return ''.join([chunk.decode() async for chunk in response.streaming_content])
+
+    def test_views_publish_and_a_reconnect_replays_from_last_event_id(self):
+        self.assertEqual(self.client.get('/api/admin/events/').status_code, 401)
+        self.client.force_login(self.user)
+        self.client.post('/api/contact/submit/', {'name': 'Esi', 'email': 'esi@example.com', 'subject': 'Hi',
+                                                  'message': 'Hello'}, content_type='application/json')
+        message_id = ContactMessage.objects.get().id
+        self.client.post(f'/api/contact/{message_id}/read/')
+
+        # Under WSGI the stream sends what is pending and closes
+        epoch = cache.get('live_events_epoch')
+        response = self.client.get('/api/admin/events/', HTTP_LAST_EVENT_ID=f'{epoch}-0')
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        body = response.content.decode()
+        self.assertIn(
+            f'id: {epoch}-1\nevent: change\ndata: {{"type":"contact_message","action":"created","id":{message_id}',
+            body,
+        )
+        self.assertIn(f'id: {epoch}-2\nevent: change', body)
+        body = self.client.get('/api/admin/events/', HTTP_LAST_EVENT_ID=f'{epoch}-2').content.decode()
+        self.assertNotIn('event: change', body)
+
+        cache.delete('live_event_1')
+        body = self.client.get('/api/admin/events/', HTTP_LAST_EVENT_ID=f'{epoch}-0').content.decode()
+        self.assertIn(f'id: {epoch}-2\nevent: reset', body)
+
+    def test_ids_from_another_numbering_get_a_reset(self):
+        from core.live import publish
+
+        self.client.force_login(self.user)
+        publish('donation', 'created', 1)
+        epoch = cache.get('live_events_epoch')
+        # A worker with its own counter, or one that started over, never
+        # replays its events as the ones the client is missing
+        for last_event_id in ('0', 'other-0', f'{epoch}-x'):
+            body = self.client.get('/api/admin/events/', HTTP_LAST_EVENT_ID=last_event_id).content.decode()
+            self.assertNotIn('event: change', body)
+            self.assertIn(f'id: {epoch}-1\nevent: reset', body)
+
+        cache.clear()
+        publish('donation', 'created', 2)
+        self.assertNotEqual(cache.get('live_events_epoch'), epoch)
+        body = self.client.get('/api/admin/events/', HTTP_LAST_EVENT_ID=f'{epoch}-0').content.decode()
+        self.assertNotIn('event: change', body)
+
+    @override_settings(SHARED_CACHE=False)
+    def test_refuses_to_stream_without_a_shared_cache(self):
+        self.client.force_login(self.user)
+        response = self.client.get('/api/admin/events/')
+        self.assertEqual(response.status_code, 503)
+        self.assertTrue(response.json()['poll'])
+
+    async def test_asgi_stream_pushes_events_published_while_open(self):
+        from asgiref.sync import sync_to_async
+        from django.test import AsyncClient
+        from core.live import publish
+
+        client = AsyncClient()
+        await client.aforce_login(self.user)
+        response = await client.get('/api/admin/events/')
+
+        async def publish_soon():
+            await asyncio.sleep(0.1)
+            await sync_to_async(publish)('donation', 'created', 7)
+
+        body, _ = await asyncio.gather(self.collect(response), publish_soon())
+        epoch = await cache.aget('live_events_epoch')
+        self.assertTrue(body.startswith(f'retry: 3000\nid: {epoch}-0\nevent: ready'))
+        self.assertIn(f'id: {epoch}-1\nevent: change\ndata: {{"type":"donation","action":"created","id":7', body)
+
+
+class DashboardSyncTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='admin', password='pass12345')
+        self.client.force_login(self.user)
+
+    def test_since_returns_changed_rows_and_deleted_ids(self):
+        from core.models import Event
+
+        now = timezone.now()
+
+        def event(title):
+            return Event.objects.create(title=title, description='d', event_type='rally', start_date=now,
+                                        end_date=now + timedelta(hours=2), location='Ahinsan')
+
+        kept, edited, removed = event('Kept'), event('Edited'), event('Removed')
+        first = self.client.get('/api/events/').json()
+        self.assertTrue(first['full'])
+        self.assertEqual(len(first['events']), 3)
+
+        edited.title = 'Edited again'
+        edited.save()
+        added = event('Added')
+        removed_id = removed.id
+        removed.delete()
+
+        changes = self.client.get('/api/events/', {'since': first['synced_at']}).json()
+        self.assertFalse(changes['full'])
+        self.assertEqual({e['id'] for e in changes['events']}, {edited.id, added.id})
+        self.assertEqual(changes['deleted'], [removed_id])
+        self.assertNotIn(kept.id, changes['deleted'])
+
+    def test_rows_leaving_a_filtered_list_are_reported_as_deleted(self):
+        message = ContactMessage.objects.create(name='Esi', email='esi@example.com', subject='Hi', message='Hello')
+        synced_at = self.client.get('/api/contact/').json()['synced_at']
+        message.is_deleted = True
+        message.save()
+
+        active = self.client.get('/api/contact/', {'since': synced_at}).json()
+        self.assertEqual(active['messages'], [])
+        self.assertEqual(active['deleted'], [message.id])
+        trash = self.client.get('/api/contact/', {'since': synced_at, 'deleted': 'true'}).json()
+        self.assertEqual([m['id'] for m in trash['messages']], [message.id])
+        self.assertEqual(trash['deleted'], [])
+
+    def test_cached_lists_sync_from_when_they_were_built(self):
+        from core.changes import parse_since
+        from core.models import TeamMember
+
+        TeamMember.objects.create(name='Ama', position='President')
+        self.client.get('/api/team/')
+        # Written without signals: the cached list doesn't have it yet, as
+        # in the gap between a commit and the payload invalidation
+        kwame, = TeamMember.objects.bulk_create([TeamMember(name='Kwame', position='Secretary')])
+        cached = self.client.get('/api/team/').json()
+        self.assertEqual([m['name'] for m in cached['team']], ['Ama'])
+        self.assertLess(parse_since(cached['synced_at']), kwame.updated_at)
+        changes = self.client.get('/api/team/', {'since': cached['synced_at']}).json()
+        self.assertIn('Kwame', [m['name'] for m in changes['team']])
+
+    def test_bad_and_expired_since(self):
+        from core.models import Sale, Tombstone
+
+        self.assertEqual(self.client.get('/api/sales/', {'since': 'yesterday'}).status_code, 400)
+        self.assertEqual(self.client.get('/api/events/', {'since': 'yesterday'}).status_code, 400)
+
+        Sale.objects.create(item_name='T-shirt', price=50, quantity=2, date=timezone.localdate(), sold_by='Kofi')
+        old = (timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_DAYS + 1)).timestamp()
+        response = self.client.get('/api/sales/', {'since': old}).json()
+        self.assertTrue(response['full'])
+        self.assertEqual(len(response['sales']), 1)
+
+        sale = Sale.objects.get()
+        sale.delete()
+        Tombstone.objects.update(deleted_at=timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_DAYS + 1))
+        out = StringIO()
+        call_command('prune_tombstones', stdout=out)
+        self.assertIn('Pruned 1 tombstone(s)', out.getvalue())
+        self.assertFalse(Tombstone.objects.exists())
+
+
+class FragmentCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_lists_reserialize_only_changed_rows(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from core.fragments import serialize_list
+        from core.models import Sale
+        from core.serializers import SaleSerializer
+
+        for name in ('Cap', 'Mug', 'Shirt'):
+            Sale.objects.create(item_name=name, price=10, quantity=1, date=timezone.localdate(), sold_by='Ama')
+        sales = Sale.objects.order_by('-created_at', '-id')
+        expected = SaleSerializer(sales.all(), many=True).data
+        self.assertEqual(serialize_list(SaleSerializer, sales), expected)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(serialize_list(SaleSerializer, sales), expected)
+        self.assertEqual(len(queries), 1)  # just (pk, updated_at)
+
+        mug = Sale.objects.get(item_name='Mug')
+        mug.quantity = 3
+        mug.save()
+        with CaptureQueriesContext(connection) as queries:
+            rows = serialize_list(SaleSerializer, sales)
+        self.assertEqual(rows, SaleSerializer(sales.all(), many=True).data)
+        self.assertEqual(rows[1]['total_amount'], '30.00')
+        self.assertIn(f'IN ({mug.pk})', queries[1]['sql'])
+
+    def test_fieldsets_and_models_without_updated_at_skip_the_cache(self):
+        from core.fragments import serialize_list
+        from core.models import MinistryRegistration
+        from core.serializers import AdvertisementSerializer, MinistryRegistrationSerializer
+
+        Advertisement.objects.create(title='Camp', description='d', category='food', advertiser_name='A',
+                                     advertiser_contact='0240000000', location='Kumasi',
+                                     expires_at=timezone.now() + timedelta(days=3))
+        rows = serialize_list(AdvertisementSerializer, Advertisement.objects.all(), fields=('title',))
+        self.assertEqual(rows, [{'title': 'Camp'}])
+        self.assertEqual(serialize_list(MinistryRegistrationSerializer, MinistryRegistration.objects.all()), [])
+        self.assertFalse([key for key in cache._cache if 'fragment_' in key])
+
+
+class ReorderTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='admin', password='pass12345')
+
+    def test_team_reorder_is_one_bulk_update(self):
+        from core.models import TeamMember
+
+        members = [TeamMember.objects.create(name=name, position='Member') for name in ('Ama', 'Kofi', 'Esi')]
+        self.client.get('/api/team/')  # cached
+        ids = [members[2].id, members[0].id, members[1].id]
+        self.assertEqual(self.client.post('/api/team/reorder/', {'ids': ids}, content_type='application/json').status_code, 401)
+
+        self.client.force_login(self.user)
+        response = self.client.post('/api/team/reorder/', {'ids': ids}, content_type='application/json')
+        self.assertEqual(response.json(), {'success': True, 'updated': 3})
+        self.assertEqual([m['name'] for m in self.client.get('/api/team/').json()['team']], ['Esi', 'Ama', 'Kofi'])
+
+        # Only rows whose position moved are written
+        response = self.client.post('/api/team/reorder/', {'ids': [members[0].id, members[2].id, members[1].id]},
+                                    content_type='application/json')
+        self.assertEqual(response.json()['updated'], 2)
+
+    def test_reorder_rejects_bad_id_lists(self):
+        from core.models import SocialMediaLink, TeamMember
+
+        self.client.force_login(self.user)
+        link = SocialMediaLink.objects.create(platform_name='facebook', url='https://facebook.com/ypg')
+        council = TeamMember.objects.create(name='Yaw', position='Patron', is_council=True)
+        for body in ({}, {'ids': []}, {'ids': [link.id, link.id]}, {'ids': ['1']}, {'ids': [link.id + 100]}):
+            response = self.client.post('/api/social-media/reorder/', body, content_type='application/json')
+            self.assertEqual(response.status_code, 400, body)
+        # Council members are not part of the executive team list
+        response = self.client.post('/api/team/reorder/', {'ids': [council.id]}, content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/council/reorder/', {'ids': [council.id]}, content_type='application/json')
+        self.assertEqual(response.json()['updated'], 1)
+
+
+class AnalyticsRollupTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='admin', password='pass12345')
+
+    def test_tracking_fills_hourly_buckets(self):
+        for event_type in ('page_view', 'page_view', 'donation'):
+            self.client.post('/api/analytics/track/', {'event_type': event_type}, content_type='application/json')
+        self.client.post('/api/analytics/track/', {'event_type': 'unique_visitor', 'device_id': 'a'},
+                         content_type='application/json')
+        self.client.post('/api/analytics/track/', {'event_type': 'unique_visitor', 'device_id': 'a'},
+                         content_type='application/json')
+
+        self.assertEqual(self.client.get('/api/analytics/history/').status_code, 401)
+        self.client.force_login(self.user)
+        response = self.client.get('/api/analytics/history/', {'range': '48h'}).json()
+        self.assertEqual(response['granularity'], 'hour')
+        self.assertEqual(len(response['history']), 48)
+        self.assertEqual(response['history'][-1]['page_views'], 2)
+        self.assertEqual(response['history'][-1]['donations_received'], 1)
+        self.assertEqual(response['history'][-1]['unique_visitors'], 1)
+        self.assertEqual(sum(point['page_views'] for point in response['history']), 2)
+
+    def test_hourly_unique_visitors_add_up_to_the_day(self):
+        from core.models import AnalyticsRollup
+        from core.rollups import record_hit
+
+        # Enough devices that some collide in a register or move the
+        # estimate by other than exactly one
+        today = timezone.now().date()
+        for device in range(400):
+            added = Analytics.record_visitor(f'device-{device}', today)
+            if added:
+                record_hit('unique_visitors', amount=added)
+        hours = AnalyticsRollup.objects.filter(granularity='hour').values_list('unique_visitors', flat=True)
+        self.assertEqual(sum(hours), Analytics.objects.get(date=today).unique_visitors)
+
+    def test_weeks_and_months_come_from_compacted_rollups(self):
+        from core.models import AnalyticsRollup
+        from core.rollups import floor
+
+        today = timezone.localdate()
+        for days_ago in range(70):
+            Analytics.objects.create(date=today - timedelta(days=days_ago), page_views=10)
+        for device in ('a', 'b'):
+            Analytics.record_visitor(device, today - timedelta(days=40))
+            Analytics.record_visitor(device, today - timedelta(days=41))
+        AnalyticsRollup.objects.create(granularity='hour', period_start=floor(timezone.now(), 'hour') - timedelta(days=30))
+
+        out = StringIO()
+        call_command('compact_analytics', stdout=out)
+        self.assertIn('pruned 1 hourly bucket(s)', out.getvalue())
+        self.assertFalse(AnalyticsRollup.objects.filter(granularity='hour').exists())
+
+        self.client.force_login(self.user)
+        weeks = self.client.get('/api/analytics/history/', {'range': '8w', 'granularity': 'week'}).json()['history']
+        self.assertEqual(len(weeks), 8)
+        self.assertEqual(sum(week['page_views'] for week in weeks), 10 * (today.weekday() + 1 + 7 * 7))
+        # Visitors on two days of the same week are counted once
+        self.assertIn(2, [week['unique_visitors'] for week in weeks])
+
+        # Today's visits show up before the next compaction
+        Analytics.objects.filter(date=today).update(page_views=15)
+        months = self.client.get('/api/analytics/history/', {'range': '3m'}).json()
+        self.assertEqual(months['granularity'], 'day')
+        months = self.client.get('/api/analytics/history/', {'range': '3m', 'granularity': 'month'}).json()['history']
+        self.assertEqual(len(months), 3)
+        self.assertEqual(months[-1]['page_views'], 10 * today.day + 5)
+
+    def test_ranges_are_bounded_and_validated(self):
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.get('/api/analytics/history/', {'range': '5y'}).json()['granularity'], 'week')
+        for params in ({'range': 'forever'}, {'range': '5y', 'granularity': 'day'},
+                       {'range': '30d', 'granularity': 'hour'}, {'granularity': 'decade'}):
+            response = self.client.get('/api/analytics/history/', params)
+            self.assertEqual(response.status_code, 400, params)
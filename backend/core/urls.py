@@ -1,184 +1,228 @@
 from django.urls import path
-from . import views
-from .vision_mission_views import api_vision_mission, api_vision_mission_update
-from advertisement_views import api_advertisements, api_advertisements_admin, api_create_advertisement, api_update_advertisement, api_delete_advertisement
-from settings_views import api_settings_profile, api_settings_website
-from ystore_views import api_ystore_items, api_ystore_item_detail
-from .finance_views import (
-    api_sales, api_create_sale, api_update_sale, api_delete_sale,
-    api_expenses, api_create_expense, api_update_expense, api_delete_expense,
-    api_contributions, api_create_contribution, api_update_contribution, api_delete_contribution
-)
+from django.utils.module_loading import import_string
+
+from . import async_views
+from .metrics import api_metrics
+from .profiling import api_profile_report
+
+
+class LazyView:
+    """URL callback that imports its view module on the first request.
+
+    Sync views only: Django checks for coroutine functions before calling,
+    so async views (core.async_views) are referenced directly.
+    """
+
+    def __init__(self, dotted_path):
+        self.dotted_path = dotted_path
+        self.__module__, self.__name__ = dotted_path.rsplit('.', 1)
+        self.__qualname__ = self.__name__
+        self._view = None
+
+    def resolve(self):
+        if self._view is None:
+            self._view = import_string(self.dotted_path)
+        return self._view
+
+    def __call__(self, request, *args, **kwargs):
+        return self.resolve()(request, *args, **kwargs)
+
+    def __getattr__(self, name):
+        # csrf_exempt, _non_atomic_requests etc. come from the real view.
+        # Dunder probes (copy, pickle) must not trigger the import, nor may
+        # the resolver's view_class check on every pattern (URLPattern.lookup_str)
+        # when it is first populated: these are all function views.
+        if name.startswith('__') or name in ('view_class', 'view_initkwargs'):
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+
+lazy = LazyView
 
 urlpatterns = [
     # Authentication API endpoints
-    path('api/auth/csrf/', views.api_get_csrf_token, name='api_get_csrf_token'),
-    path('api/auth/login/', views.api_supervisor_login, name='api_supervisor_login'),
-    path('api/auth/login', views.api_supervisor_login, name='api_supervisor_login_no_slash'),
-    path('api/auth/logout/', views.api_supervisor_logout, name='api_supervisor_logout'),
-    path('api/auth/logout', views.api_supervisor_logout, name='api_supervisor_logout_no_slash'),
-    path('api/auth/status/', views.api_supervisor_status, name='api_supervisor_status'),
-    path('api/auth/credentials/', views.api_supervisor_change_credentials, name='api_supervisor_change_credentials'),
-    path('api/auth/credentials', views.api_supervisor_change_credentials, name='api_supervisor_change_credentials_no_slash'),
-    path('api/auth/password-otp/request/', views.api_request_password_change_otp, name='api_request_password_change_otp'),
-    path('api/auth/password-otp/request', views.api_request_password_change_otp, name='api_request_password_change_otp_no_slash'),
-    path('api/auth/forgot-password/', views.api_forgot_password, name='api_forgot_password'),
-    path('api/auth/forgot-password', views.api_forgot_password, name='api_forgot_password_no_slash'),
-    path('api/auth/reset-password-confirm/', views.api_reset_password_confirm, name='api_reset_password_confirm'),
-    path('api/auth/reset-password-confirm', views.api_reset_password_confirm, name='api_reset_password_confirm_no_slash'),
-    path('api/auth/create-supervisor/', views.api_create_supervisor, name='api_create_supervisor'),
-    path('api/debug/session/', views.api_debug_session, name='api_debug_session'),
-    path('api/test/cookie/', views.api_test_cookie, name='api_test_cookie'),
+    path('api/auth/csrf/', lazy('core.views.auth.api_get_csrf_token'), name='api_get_csrf_token'),
+    path('api/auth/login/', lazy('core.views.auth.api_supervisor_login'), name='api_supervisor_login'),
+    path('api/auth/login', lazy('core.views.auth.api_supervisor_login'), name='api_supervisor_login_no_slash'),
+    path('api/auth/logout/', lazy('core.views.auth.api_supervisor_logout'), name='api_supervisor_logout'),
+    path('api/auth/logout', lazy('core.views.auth.api_supervisor_logout'), name='api_supervisor_logout_no_slash'),
+    path('api/auth/status/', lazy('core.views.auth.api_supervisor_status'), name='api_supervisor_status'),
+    path('api/auth/credentials/', lazy('core.views.auth.api_supervisor_change_credentials'), name='api_supervisor_change_credentials'),
+    path('api/auth/credentials', lazy('core.views.auth.api_supervisor_change_credentials'), name='api_supervisor_change_credentials_no_slash'),
+    path('api/auth/password-otp/request/', lazy('core.views.auth.api_request_password_change_otp'), name='api_request_password_change_otp'),
+    path('api/auth/password-otp/request', lazy('core.views.auth.api_request_password_change_otp'), name='api_request_password_change_otp_no_slash'),
+    path('api/auth/forgot-password/', lazy('core.views.auth.api_forgot_password'), name='api_forgot_password'),
+    path('api/auth/forgot-password', lazy('core.views.auth.api_forgot_password'), name='api_forgot_password_no_slash'),
+    path('api/auth/reset-password-confirm/', lazy('core.views.auth.api_reset_password_confirm'), name='api_reset_password_confirm'),
+    path('api/auth/reset-password-confirm', lazy('core.views.auth.api_reset_password_confirm'), name='api_reset_password_confirm_no_slash'),
+    path('api/auth/create-supervisor/', lazy('core.views.auth.api_create_supervisor'), name='api_create_supervisor'),
+    path('api/debug/session/', lazy('core.views.auth.api_debug_session'), name='api_debug_session'),
+    path('api/test/cookie/', lazy('core.views.auth.api_test_cookie'), name='api_test_cookie'),
     
     # Events API endpoints
-    path('api/events/', views.api_events, name='api_events'),
-    path('api/events/<int:event_id>/', views.api_event_detail, name='api_event_detail'),
-    path('api/events/create/', views.api_create_event, name='api_create_event'),
-    path('api/events/<int:event_id>/update/', views.api_update_event, name='api_update_event'),
-    path('api/events/<int:event_id>/delete/', views.api_delete_event, name='api_delete_event'),
+    path('api/events/', async_views.api_events, name='api_events'),
+    path('api/events/calendar/', async_views.api_events_calendar, name='api_events_calendar'),
+    path('api/events/<int:event_id>/', lazy('core.views.events.api_event_detail'), name='api_event_detail'),
+    path('api/events/create/', lazy('core.views.events.api_create_event'), name='api_create_event'),
+    path('api/events/<int:event_id>/update/', lazy('core.views.events.api_update_event'), name='api_update_event'),
+    path('api/events/<int:event_id>/delete/', lazy('core.views.events.api_delete_event'), name='api_delete_event'),
     
     # Team API endpoints
-    path('api/team/', views.api_team_members, name='api_team_members'),
-    path('api/team/<int:member_id>/', views.api_team_member_detail, name='api_team_member_detail'),
-    path('api/team/create/', views.api_create_team_member, name='api_create_team_member'),
-    path('api/team/<int:member_id>/update/', views.api_update_team_member, name='api_update_team_member'),
-    path('api/team/<int:member_id>/delete/', views.api_delete_team_member, name='api_delete_team_member'),
+    path('api/team/', lazy('core.views.team.api_team_members'), name='api_team_members'),
+    path('api/team/<int:member_id>/', lazy('core.views.team.api_team_member_detail'), name='api_team_member_detail'),
+    path('api/team/create/', lazy('core.views.team.api_create_team_member'), name='api_create_team_member'),
+    path('api/team/<int:member_id>/update/', lazy('core.views.team.api_update_team_member'), name='api_update_team_member'),
+    path('api/team/<int:member_id>/delete/', lazy('core.views.team.api_delete_team_member'), name='api_delete_team_member'),
+    path('api/team/reorder/', lazy('core.views.team.api_reorder_team_members'), name='api_reorder_team_members'),
     
     # Council API endpoints
-    path('api/council/', views.api_council_members, name='api_council_members'),
-    path('api/council/create/', views.api_create_council_member, name='api_create_council_member'),
-    path('api/council/<int:member_id>/update/', views.api_update_council_member, name='api_update_council_member'),
-    path('api/council/<int:member_id>/delete/', views.api_delete_council_member, name='api_delete_council_member'),
+    path('api/council/', lazy('core.views.team.api_council_members'), name='api_council_members'),
+    path('api/council/create/', lazy('core.views.team.api_create_council_member'), name='api_create_council_member'),
+    path('api/council/<int:member_id>/update/', lazy('core.views.team.api_update_council_member'), name='api_update_council_member'),
+    path('api/council/<int:member_id>/delete/', lazy('core.views.team.api_delete_council_member'), name='api_delete_council_member'),
+    path('api/council/reorder/', lazy('core.views.team.api_reorder_council_members'), name='api_reorder_council_members'),
     
     # Donations API endpoints
-    path('api/donations/', views.api_donations, name='api_donations'),
-    path('api/donations/submit/', views.api_submit_donation, name='api_submit_donation'),
-    path('api/donations/<int:donation_id>/verify/', views.api_verify_donation, name='api_verify_donation'),
-    path('api/donations/<int:donation_id>/delete/', views.api_delete_donation, name='api_delete_donation'),
-    path('api/donations/analytics/', views.api_donation_analytics, name='api_donation_analytics'),
-    path('api/donations/process-payment/', views.api_process_payment, name='api_process_payment'),
-    path('api/impact-statistics/', views.api_impact_statistics, name='api_impact_statistics'),
+    path('api/donations/', lazy('core.views.donations.api_donations'), name='api_donations'),
+    path('api/donations/submit/', lazy('core.views.donations.api_submit_donation'), name='api_submit_donation'),
+    path('api/donations/<int:donation_id>/verify/', lazy('core.views.donations.api_verify_donation'), name='api_verify_donation'),
+    path('api/donations/<int:donation_id>/delete/', lazy('core.views.donations.api_delete_donation'), name='api_delete_donation'),
+    path('api/donations/analytics/', lazy('core.views.donations.api_donation_analytics'), name='api_donation_analytics'),
+    path('api/donations/process-payment/', lazy('core.views.donations.api_process_payment'), name='api_process_payment'),
+    path('api/impact-statistics/', lazy('core.views.donations.api_impact_statistics'), name='api_impact_statistics'),
     
     # Contact API endpoints
-    path('api/contact/', views.api_contact_messages, name='api_contact_messages'),
-    path('api/contact/submit/', views.api_submit_contact, name='api_submit_contact'),
-    path('api/contact/<int:message_id>/read/', views.api_mark_contact_read, name='api_mark_contact_read'),
-    path('api/contact/<int:message_id>/delete/', views.api_delete_contact, name='api_delete_contact'),
+    path('api/contact/', lazy('core.views.contact.api_contact_messages'), name='api_contact_messages'),
+    path('api/contact/submit/', lazy('core.views.contact.api_submit_contact'), name='api_submit_contact'),
+    path('api/contact/<int:message_id>/read/', lazy('core.views.contact.api_mark_contact_read'), name='api_mark_contact_read'),
+    path('api/contact/<int:message_id>/delete/', lazy('core.views.contact.api_delete_contact'), name='api_delete_contact'),
     
     # Ministry API endpoints
-    path('api/ministry/register/', views.api_submit_ministry_registration, name='api_submit_ministry_registration'),
-    path('api/ministry/update/<int:registration_id>/', views.api_update_ministry_registration, name='api_update_ministry_registration_update'),
-    path('api/ministry/<int:registration_id>/', views.api_update_ministry_registration, name='api_update_ministry_registration'),
-    path('api/ministry/<int:registration_id>/approve/', views.api_approve_ministry_registration, name='api_approve_ministry_registration'),
-    path('api/ministry/<int:registration_id>/delete/', views.api_delete_ministry_registration, name='api_delete_ministry_registration'),
-    path('api/ministry/', views.api_ministry_registrations, name='api_ministry_registrations'),
+    path('api/ministry/register/', lazy('core.views.ministries.api_submit_ministry_registration'), name='api_submit_ministry_registration'),
+    path('api/ministry/update/<int:registration_id>/', lazy('core.views.ministries.api_update_ministry_registration'), name='api_update_ministry_registration_update'),
+    path('api/ministry/<int:registration_id>/', lazy('core.views.ministries.api_update_ministry_registration'), name='api_update_ministry_registration'),
+    path('api/ministry/<int:registration_id>/approve/', lazy('core.views.ministries.api_approve_ministry_registration'), name='api_approve_ministry_registration'),
+    path('api/ministry/<int:registration_id>/delete/', lazy('core.views.ministries.api_delete_ministry_registration'), name='api_delete_ministry_registration'),
+    path('api/ministry/', lazy('core.views.ministries.api_ministry_registrations'), name='api_ministry_registrations'),
     # Ministries CRUD
-    path('api/ministries/', views.api_ministries, name='api_ministries'),
-    path('api/ministries/create/', views.api_create_ministry, name='api_create_ministry'),
-    path('api/ministries/<int:ministry_id>/update/', views.api_update_ministry, name='api_update_ministry'),
-    path('api/ministries/<int:ministry_id>/delete/', views.api_delete_ministry, name='api_delete_ministry'),
+    path('api/ministries/', async_views.api_ministries, name='api_ministries'),
+    path('api/ministries/create/', lazy('core.views.ministries.api_create_ministry'), name='api_create_ministry'),
+    path('api/ministries/<int:ministry_id>/update/', lazy('core.views.ministries.api_update_ministry'), name='api_update_ministry'),
+    path('api/ministries/<int:ministry_id>/delete/', lazy('core.views.ministries.api_delete_ministry'), name='api_delete_ministry'),
     
     # Blog API endpoints
-    path('api/blog/create/', views.api_create_blog_post, name='api_create_blog_post'),
-    path('api/blog/<slug:slug>/update/', views.api_update_blog_post, name='api_update_blog_post'),
-    path('api/blog/<slug:slug>/delete/', views.api_delete_blog_post, name='api_delete_blog_post'),
-    path('api/blog/<slug:slug>/', views.api_blog_post_detail, name='api_blog_post_detail'),
-    path('api/blog/', views.api_blog_posts, name='api_blog_posts'),
+    path('api/blog/create/', lazy('core.views.blog.api_create_blog_post'), name='api_create_blog_post'),
+    path('api/blog/<slug:slug>/update/', lazy('core.views.blog.api_update_blog_post'), name='api_update_blog_post'),
+    path('api/blog/<slug:slug>/delete/', lazy('core.views.blog.api_delete_blog_post'), name='api_delete_blog_post'),
+    path('api/blog/<slug:slug>/related/', lazy('core.views.blog.api_blog_related_posts'), name='api_blog_related_posts'),
+    path('api/blog/<slug:slug>/', lazy('core.views.blog.api_blog_post_detail'), name='api_blog_post_detail'),
+    path('api/blog/', lazy('core.views.blog.api_blog_posts'), name='api_blog_posts'),
     
     # Testimonials API endpoints
-    path('api/testimonials/', views.api_testimonials, name='api_testimonials'),
-    path('api/testimonials/create/', views.api_create_testimonial, name='api_create_testimonial'),
-    path('api/testimonials/<int:testimonial_id>/update/', views.api_update_testimonial, name='api_update_testimonial'),
-    path('api/testimonials/<int:testimonial_id>/delete/', views.api_delete_testimonial, name='api_delete_testimonial'),
-    path('api/testimonials/<int:testimonial_id>/restore/', views.api_restore_testimonial, name='api_restore_testimonial'),
-    path('api/testimonials/<int:testimonial_id>/approve/', views.api_approve_testimonial, name='api_approve_testimonial'),
-    path('api/testimonials/<int:testimonial_id>/deny/', views.api_deny_testimonial, name='api_deny_testimonial'),
-    path('api/testimonials/submit/', views.api_submit_testimonial, name='api_submit_testimonial'),
+    path('api/testimonials/', async_views.api_testimonials, name='api_testimonials'),
+    path('api/testimonials/create/', lazy('core.views.testimonials.api_create_testimonial'), name='api_create_testimonial'),
+    path('api/testimonials/<int:testimonial_id>/update/', lazy('core.views.testimonials.api_update_testimonial'), name='api_update_testimonial'),
+    path('api/testimonials/<int:testimonial_id>/delete/', lazy('core.views.testimonials.api_delete_testimonial'), name='api_delete_testimonial'),
+    path('api/testimonials/<int:testimonial_id>/restore/', lazy('core.views.testimonials.api_restore_testimonial'), name='api_restore_testimonial'),
+    path('api/testimonials/<int:testimonial_id>/approve/', lazy('core.views.testimonials.api_approve_testimonial'), name='api_approve_testimonial'),
+    path('api/testimonials/<int:testimonial_id>/deny/', lazy('core.views.testimonials.api_deny_testimonial'), name='api_deny_testimonial'),
+    path('api/testimonials/submit/', lazy('core.views.testimonials.api_submit_testimonial'), name='api_submit_testimonial'),
     
     # Gallery API endpoints
-    path('api/gallery/', views.api_gallery_items, name='api_gallery_items'),
-    path('api/gallery/create/', views.api_create_gallery_item, name='api_create_gallery_item'),
-    path('api/gallery/<int:item_id>/update/', views.api_update_gallery_item, name='api_update_gallery_item'),
-    path('api/gallery/<int:item_id>/delete/', views.api_delete_gallery_item, name='api_delete_gallery_item'),
+    path('api/gallery/', async_views.api_gallery_items, name='api_gallery_items'),
+    path('api/gallery/create/', lazy('core.views.gallery.api_create_gallery_item'), name='api_create_gallery_item'),
+    path('api/gallery/<int:item_id>/update/', lazy('core.views.gallery.api_update_gallery_item'), name='api_update_gallery_item'),
+    path('api/gallery/<int:item_id>/delete/', lazy('core.views.gallery.api_delete_gallery_item'), name='api_delete_gallery_item'),
     
     # Congregations API endpoints
-    path('api/congregations/', views.api_congregations, name='api_congregations'),
-    path('api/congregations/create/', views.api_create_congregation, name='api_create_congregation'),
-    path('api/congregations/<int:congregation_id>/update/', views.api_update_congregation, name='api_update_congregation'),
-    path('api/congregations/<int:congregation_id>/delete/', views.api_delete_congregation, name='api_delete_congregation'),
+    path('api/congregations/', lazy('core.views.congregations.api_congregations'), name='api_congregations'),
+    path('api/congregations/create/', lazy('core.views.congregations.api_create_congregation'), name='api_create_congregation'),
+    path('api/congregations/<int:congregation_id>/update/', lazy('core.views.congregations.api_update_congregation'), name='api_update_congregation'),
+    path('api/congregations/<int:congregation_id>/delete/', lazy('core.views.congregations.api_delete_congregation'), name='api_delete_congregation'),
     
     # Analytics API endpoints
-    path('api/analytics/', views.api_analytics, name='api_analytics'),
-    path('api/analytics/track/', views.api_track_analytics, name='api_track_analytics'),
+    path('api/analytics/', lazy('core.views.analytics.api_analytics'), name='api_analytics'),
+    path('api/analytics/track/', lazy('core.views.analytics.api_track_analytics'), name='api_track_analytics'),
+    path('api/analytics/history/', lazy('core.views.analytics.api_analytics_history'), name='api_analytics_history'),
+    path('api/admin/pending-counts/', lazy('core.views.analytics.api_pending_counts'), name='api_pending_counts'),
+    path('api/admin/events/', async_views.api_admin_events, name='api_admin_events'),
     
     # Branch President API endpoints
-    path('branch-presidents/', views.api_branch_presidents, name='api_branch_presidents'),
-    path('branch-presidents/admin/', views.api_branch_presidents_admin, name='api_branch_presidents_admin'),
-    path('branch-presidents/create/', views.api_branch_president_create, name='api_branch_president_create'),
-    path('branch-presidents/<int:president_id>/update/', views.api_branch_president_update, name='api_branch_president_update'),
-    path('branch-presidents/<int:president_id>/delete/', views.api_branch_president_delete, name='api_branch_president_delete'),
+    path('branch-presidents/', lazy('core.views.leadership.api_branch_presidents'), name='api_branch_presidents'),
+    path('branch-presidents/admin/', lazy('core.views.leadership.api_branch_presidents_admin'), name='api_branch_presidents_admin'),
+    path('branch-presidents/create/', lazy('core.views.leadership.api_branch_president_create'), name='api_branch_president_create'),
+    path('branch-presidents/<int:president_id>/update/', lazy('core.views.leadership.api_branch_president_update'), name='api_branch_president_update'),
+    path('branch-presidents/<int:president_id>/delete/', lazy('core.views.leadership.api_branch_president_delete'), name='api_branch_president_delete'),
     
     # Advertisement API endpoints
-    path('api/advertisements/', api_advertisements, name='api_advertisements'),
-    path('api/advertisements/admin/', api_advertisements_admin, name='api_advertisements_admin'),
-    path('api/advertisements/create/', api_create_advertisement, name='api_create_advertisement'),
-    path('api/advertisements/<int:ad_id>/update/', api_update_advertisement, name='api_update_advertisement'),
-    path('api/advertisements/<int:ad_id>/delete/', api_delete_advertisement, name='api_delete_advertisement'),
+    path('api/advertisements/', lazy('advertisement_views.api_advertisements'), name='api_advertisements'),
+    path('api/advertisements/admin/', lazy('advertisement_views.api_advertisements_admin'), name='api_advertisements_admin'),
+    path('api/advertisements/create/', lazy('advertisement_views.api_create_advertisement'), name='api_create_advertisement'),
+    path('api/advertisements/<int:ad_id>/update/', lazy('advertisement_views.api_update_advertisement'), name='api_update_advertisement'),
+    path('api/advertisements/<int:ad_id>/delete/', lazy('advertisement_views.api_delete_advertisement'), name='api_delete_advertisement'),
     
     # Settings API endpoints
-    path('api/settings/profile/', api_settings_profile, name='api_settings_profile'),
-    path('api/settings/website/', api_settings_website, name='api_settings_website'),
+    path('api/settings/profile/', lazy('settings_views.api_settings_profile'), name='api_settings_profile'),
+    path('api/settings/website/', lazy('settings_views.api_settings_website'), name='api_settings_website'),
     # Slash-less aliases: the frontend calls these without a trailing slash,
     # and the automatic 301 redirect would convert PUT bodies into GETs.
-    path('api/settings/website', api_settings_website),
-    path('api/settings/profile', api_settings_profile),
+    path('api/settings/website', lazy('settings_views.api_settings_website')),
+    path('api/settings/profile', lazy('settings_views.api_settings_profile')),
     
     # Y-Store API endpoints
-    path('api/ystore/', api_ystore_items, name='api_ystore_items'),
-    path('api/ystore/item/', api_ystore_item_detail, name='api_ystore_item_detail'),
+    path('api/ystore/', lazy('ystore_views.api_ystore_items'), name='api_ystore_items'),
+    path('api/ystore/item/', lazy('ystore_views.api_ystore_item_detail'), name='api_ystore_item_detail'),
     
     # Past Executives API endpoints
-    path('api/past-executives/', views.api_past_executives, name='api_past_executives'),
-    path('api/past-executives/create/', views.api_past_executive_create, name='api_past_executive_create'),
-    path('api/past-executives/<int:executive_id>/update/', views.api_past_executive_update, name='api_past_executive_update'),
-    path('api/past-executives/<int:executive_id>/delete/', views.api_past_executive_delete, name='api_past_executive_delete'),
-    path('api/past-executives/<int:executive_id>/hard-delete/', views.api_past_executive_hard_delete, name='api_past_executive_hard_delete'),
+    path('api/past-executives/', lazy('core.views.leadership.api_past_executives'), name='api_past_executives'),
+    path('api/past-executives/create/', lazy('core.views.leadership.api_past_executive_create'), name='api_past_executive_create'),
+    path('api/past-executives/<int:executive_id>/update/', lazy('core.views.leadership.api_past_executive_update'), name='api_past_executive_update'),
+    path('api/past-executives/<int:executive_id>/delete/', lazy('core.views.leadership.api_past_executive_delete'), name='api_past_executive_delete'),
+    path('api/past-executives/<int:executive_id>/hard-delete/', lazy('core.views.leadership.api_past_executive_hard_delete'), name='api_past_executive_hard_delete'),
+    path('api/past-executives/reorder/', lazy('core.views.leadership.api_past_executive_reorder'), name='api_past_executive_reorder'),
     
     # Finance Management API endpoints
     # Sales endpoints
-    path('api/sales/', api_sales, name='api_sales'),
-    path('api/sales/create/', api_create_sale, name='api_create_sale'),
-    path('api/sales/<int:sale_id>/update/', api_update_sale, name='api_update_sale'),
-    path('api/sales/<int:sale_id>/delete/', api_delete_sale, name='api_delete_sale'),
+    path('api/sales/', lazy('core.finance_views.api_sales'), name='api_sales'),
+    path('api/sales/create/', lazy('core.finance_views.api_create_sale'), name='api_create_sale'),
+    path('api/sales/<int:sale_id>/update/', lazy('core.finance_views.api_update_sale'), name='api_update_sale'),
+    path('api/sales/<int:sale_id>/delete/', lazy('core.finance_views.api_delete_sale'), name='api_delete_sale'),
     
     # Expenses endpoints
-    path('api/expenses/', api_expenses, name='api_expenses'),
-    path('api/expenses/create/', api_create_expense, name='api_create_expense'),
-    path('api/expenses/<int:expense_id>/update/', api_update_expense, name='api_update_expense'),
-    path('api/expenses/<int:expense_id>/delete/', api_delete_expense, name='api_delete_expense'),
+    path('api/expenses/', lazy('core.finance_views.api_expenses'), name='api_expenses'),
+    path('api/expenses/create/', lazy('core.finance_views.api_create_expense'), name='api_create_expense'),
+    path('api/expenses/<int:expense_id>/update/', lazy('core.finance_views.api_update_expense'), name='api_update_expense'),
+    path('api/expenses/<int:expense_id>/delete/', lazy('core.finance_views.api_delete_expense'), name='api_delete_expense'),
     
     # Contributions endpoints
-    path('api/contributions/', api_contributions, name='api_contributions'),
-    path('api/contributions/create/', api_create_contribution, name='api_create_contribution'),
-    path('api/contributions/<int:contribution_id>/update/', api_update_contribution, name='api_update_contribution'),
-    path('api/contributions/<int:contribution_id>/delete/', api_delete_contribution, name='api_delete_contribution'),
+    path('api/contributions/', lazy('core.finance_views.api_contributions'), name='api_contributions'),
+    path('api/contributions/create/', lazy('core.finance_views.api_create_contribution'), name='api_create_contribution'),
+    path('api/contributions/<int:contribution_id>/update/', lazy('core.finance_views.api_update_contribution'), name='api_update_contribution'),
+    path('api/contributions/<int:contribution_id>/delete/', lazy('core.finance_views.api_delete_contribution'), name='api_delete_contribution'),
 
     # Vision & Mission API endpoints
-    path('api/vision-mission/', api_vision_mission, name='api_vision_mission'),
-    path('api/vision-mission/update/', api_vision_mission_update, name='api_vision_mission_update'),
+    path('api/vision-mission/', lazy('core.vision_mission_views.api_vision_mission'), name='api_vision_mission'),
+    path('api/vision-mission/update/', lazy('core.vision_mission_views.api_vision_mission_update'), name='api_vision_mission_update'),
     
     # Social Media API endpoints
-    path('api/social-media/', views.api_social_media_links, name='api_social_media_links'),
-    path('api/social-media/admin/', views.api_social_media_links_admin, name='api_social_media_links_admin'),
-    path('api/social-media/create/', views.api_social_media_create, name='api_social_media_create'),
-    path('api/social-media/<int:link_id>/update/', views.api_social_media_update, name='api_social_media_update'),
-    path('api/social-media/<int:link_id>/delete/', views.api_social_media_delete, name='api_social_media_delete'),
+    path('api/social-media/', lazy('core.views.social_media.api_social_media_links'), name='api_social_media_links'),
+    path('api/social-media/admin/', lazy('core.views.social_media.api_social_media_links_admin'), name='api_social_media_links_admin'),
+    path('api/social-media/create/', lazy('core.views.social_media.api_social_media_create'), name='api_social_media_create'),
+    path('api/social-media/<int:link_id>/update/', lazy('core.views.social_media.api_social_media_update'), name='api_social_media_update'),
+    path('api/social-media/<int:link_id>/delete/', lazy('core.views.social_media.api_social_media_delete'), name='api_social_media_delete'),
+    path('api/social-media/reorder/', lazy('core.views.social_media.api_social_media_reorder'), name='api_social_media_reorder'),
     
     # Announcement API endpoints
-    path('api/announcements/', views.api_announcements, name='api_announcements'),
-    path('api/announcements/create/', views.api_create_announcement, name='api_create_announcement'),
-    path('api/announcements/<int:announcement_id>/update/', views.api_update_announcement, name='api_update_announcement'),
-    path('api/announcements/<int:announcement_id>/delete/', views.api_delete_announcement, name='api_delete_announcement'),
+    path('api/announcements/', async_views.api_announcements, name='api_announcements'),
+    path('api/announcements/create/', lazy('core.views.announcements.api_create_announcement'), name='api_create_announcement'),
+    path('api/announcements/<int:announcement_id>/update/', lazy('core.views.announcements.api_update_announcement'), name='api_update_announcement'),
+    path('api/announcements/<int:announcement_id>/delete/', lazy('core.views.announcements.api_delete_announcement'), name='api_delete_announcement'),
+
+    # Metrics endpoint (Prometheus text format)
+    path('api/metrics/', api_metrics, name='api_metrics'),
+
+    # Request profiler reports (see core.profiling)
+    path('api/profiler/<str:profile_id>/', api_profile_report, name='api_profile_report'),
 ]
 
 
@@ -0,0 +1,7 @@
+"""
+API views, one module per domain.
+
+core/urls.py refers to these by dotted path and imports a module only when
+one of its URLs is first requested, so a cold worker does not load every
+view (and its dependencies) before serving anything.
+"""
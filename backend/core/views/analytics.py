@@ -0,0 +1,162 @@
+"""
+Analytics API endpoints
+"""
+
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..models import Analytics
+from ..payloads import get_payload
+from ..rollups import history, record_hit
+from ..serializers import AnalyticsSerializer
+from ..stats import get_site_stats
+
+
+# Analytics API endpoints
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_analytics(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Get analytics data"""
+    try:
+        today = timezone.now().date()
+
+        # Build visitor history for the last 30 days
+        from datetime import timedelta
+        start_date = today - timedelta(days=29)
+        history_rows = list(Analytics.objects.filter(date__gte=start_date).order_by('date'))
+        history = [
+            {
+                'date': h.date.strftime('%Y-%m-%d'),
+                'page_views': h.page_views,
+                'unique_visitors': h.unique_visitors,
+            }
+            for h in history_rows
+        ]
+        # Today's row is part of the history; only the first load of the day creates it
+        analytics = next((h for h in history_rows if h.date == today), None)
+        if analytics is None:
+            analytics, created = Analytics.objects.get_or_create(date=today)
+
+        # Totals come from the SiteStats row maintained by core.stats
+        stats = get_site_stats()
+
+        serializer = AnalyticsSerializer(analytics)
+        data = serializer.data
+        data.update({
+            'weekly_unique_visitors': Analytics.unique_visitors_between(today - timedelta(days=6), today),
+            'monthly_unique_visitors': Analytics.unique_visitors_between(start_date, today),
+            'total_donations': float(stats.verified_donation_amount),
+            'total_events': stats.events,
+            'total_team_members': stats.active_team_members,
+            'total_blog_posts': stats.published_blog_posts,
+            'total_testimonials': stats.active_testimonials,
+            'total_ministry_registrations': stats.ministry_registrations,
+            'total_contact_messages': stats.contact_messages,
+            'history': history,
+        })
+        
+        return Response({
+            'success': True,
+            'analytics': data
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_analytics_history(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Visitor history: ?range=48h|30d|12w|12m|5y and optional ?granularity=hour|day|week|month"""
+    try:
+        try:
+            data = history(request.GET.get('range'), request.GET.get('granularity') or None)
+        except ValueError as e:
+            return Response({
+                'success': False,
+                'error': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
+        return Response({
+            'success': True,
+            **data
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_track_analytics(request):
+    """Track analytics event"""
+    try:
+        data = request.data
+        event_type = data.get('event_type', 'page_view')
+        device_id = data.get('device_id')
+
+        today = timezone.now().date()
+
+        if event_type == 'unique_visitor':
+            # Devices are deduplicated by the day's HyperLogLog sketch;
+            # requests without a device_id still count as one new visitor.
+            import uuid
+            added = Analytics.record_visitor(device_id or uuid.uuid4().hex, today)
+            if added:
+                record_hit('unique_visitors', amount=added)
+            return Response({
+                'success': True,
+                'message': 'Analytics tracked successfully'
+            })
+
+        analytics, created = Analytics.objects.get_or_create(date=today)
+
+        counter = {
+            'page_view': 'page_views',
+            'donation': 'donations_received',
+            'contact_submission': 'contact_submissions',
+        }.get(event_type)
+        if counter:
+            setattr(analytics, counter, getattr(analytics, counter) + 1)
+            analytics.save(update_fields=['page_views', 'donations_received', 'contact_submissions'])
+            record_hit(counter)
+
+        return Response({
+            'success': True,
+            'message': 'Analytics tracked successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_pending_counts(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Get the number of items waiting for an admin (dashboard badges)"""
+    try:
+        return Response({
+            'success': True,
+            'counts': get_payload('pending_counts')
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
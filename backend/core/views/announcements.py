@@ -0,0 +1,100 @@
+"""
+Announcement API endpoints
+"""
+
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..models import Announcement
+from ..serializers import AnnouncementSerializer
+
+
+# Announcement API endpoints
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_create_announcement(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Create a new announcement"""
+    try:
+        data = request.data
+        date_val = data.get('date') or None
+        announcement = Announcement.objects.create(
+            title=data.get('title', ''),
+            date=date_val,
+            venue=data.get('venue', ''),
+            is_anticipated=data.get('is_anticipated', False)
+        )
+        serializer = AnnouncementSerializer(announcement)
+        return Response({
+            'success': True,
+            'announcement': serializer.data
+        }, status=status.HTTP_201_CREATED)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_update_announcement(request, announcement_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Update an announcement"""
+    try:
+        announcement = Announcement.objects.get(id=announcement_id)
+        data = request.data
+        announcement.title = data.get('title', announcement.title)
+        announcement.date = data.get('date') or None
+        announcement.venue = data.get('venue', announcement.venue)
+        announcement.is_anticipated = data.get('is_anticipated', announcement.is_anticipated)
+        announcement.save()
+        serializer = AnnouncementSerializer(announcement)
+        return Response({
+            'success': True,
+            'announcement': serializer.data
+        })
+    except Announcement.DoesNotExist:
+        return Response({
+            'success': False,
+            'error': 'Announcement not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_delete_announcement(request, announcement_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Delete an announcement"""
+    try:
+        announcement = Announcement.objects.get(id=announcement_id)
+        announcement.delete()
+        return Response({
+            'success': True,
+            'message': 'Announcement deleted successfully'
+        })
+    except Announcement.DoesNotExist:
+        return Response({
+            'success': False,
+            'error': 'Announcement not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
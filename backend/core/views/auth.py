@@ -0,0 +1,586 @@
+"""
+Supervisor authentication API endpoints
+"""
+import logging
+
+from django.conf import settings
+from django.contrib.auth import authenticate, login, logout
+from django.contrib.auth.models import User
+from django.core.mail import send_mail
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt, ensure_csrf_cookie, get_token
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes, authentication_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..models import Supervisor
+from ..otp import issue_otp, verify_otp, masked_recipient
+from .common import CsrfExemptSessionAuthentication, rate_limit, get_client_ip
+
+logger = logging.getLogger(__name__)
+
+
+# Authentication API endpoints
+@csrf_exempt
+@ensure_csrf_cookie
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_get_csrf_token(request):
+    """Sets the csrftoken cookie so the login page can send X-CSRFToken.
+
+    Needed because a browser holding a still-valid session gets CSRF-checked
+    even on the login endpoint, which would otherwise reject with
+    'CSRF token missing'.
+    """
+    get_token(request)
+    return Response({'success': True})
+
+
+@api_view(['POST'])
+@permission_classes([AllowAny])
+@authentication_classes([CsrfExemptSessionAuthentication])
+@rate_limit(max_requests=8, window_seconds=300)
+def api_supervisor_login(request):
+    """Supervisor login endpoint"""
+    try:
+        data = request.data
+        username = data.get('username')
+        password = data.get('password')
+        
+        if not username or not password:
+            return Response({
+                'success': False,
+                'error': 'Username and password are required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Authenticate user
+        user = authenticate(request, username=username, password=password)
+        
+        if user is not None:
+            # Check if user is a supervisor
+            try:
+                supervisor = Supervisor.objects.get(user=user)
+            except Supervisor.DoesNotExist:
+                return Response({
+                    'success': False,
+                    'error': 'Access denied. Supervisor privileges required.'
+                }, status=status.HTTP_403_FORBIDDEN)
+            
+            # Log in the user
+            login(request, user)
+            
+            # Update supervisor info
+            supervisor.last_login_ip = get_client_ip(request)
+            session_token = supervisor.generate_session_token()
+            
+            # Debug session information
+            session_key = request.session.session_key
+            session_data = dict(request.session)
+            
+            # Create response
+            response = Response({
+                'success': True,
+                'user': {
+                    'username': user.username,
+                    'role': 'supervisor',
+                    'loginTime': timezone.now().isoformat(),
+                    'session_token': session_token
+                },
+                'message': 'Login successful',
+                'debug': {
+                    'session_key': session_key,
+                    'session_data': session_data,
+                    'user_authenticated': request.user.is_authenticated
+                }
+            })
+            
+            # Ensure session cookie is set properly
+            if session_key:
+                response.set_cookie(
+                    'sessionid',
+                    session_key,
+                    max_age=86400,  # 24 hours
+                    secure=True,
+                    samesite='None',
+                    httponly=True
+                )
+            
+            return response
+        else:
+            return Response({
+                'success': False,
+                'error': 'Invalid credentials'
+            }, status=status.HTTP_401_UNAUTHORIZED)
+            
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_supervisor_logout(request):
+    """Supervisor logout endpoint"""
+    try:
+        if request.user.is_authenticated:
+            try:
+                supervisor = Supervisor.objects.get(user=request.user)
+                supervisor.clear_session()
+            except Supervisor.DoesNotExist:
+                pass
+            
+            logout(request)
+        
+        return Response({
+            'success': True,
+            'message': 'Logged out successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_supervisor_status(request):
+    """Check supervisor authentication status"""
+    try:
+        if request.user.is_authenticated:
+            try:
+                supervisor = Supervisor.objects.get(user=request.user)
+                return Response({
+                    'success': True,
+                    'authenticated': True,
+                    'user': {
+                        'username': request.user.username,
+                        'role': 'supervisor',
+                        'loginTime': supervisor.updated_at.isoformat()
+                    }
+                })
+            except Supervisor.DoesNotExist:
+                return Response({
+                    'success': True,
+                    'authenticated': False
+                })
+        else:
+            return Response({
+                'success': True,
+                'authenticated': False
+            })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET', 'PUT'])
+@permission_classes([AllowAny])
+def api_supervisor_change_credentials(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Get or change supervisor credentials"""
+    try:
+        # Debug: Check if there are any users and supervisors in the database
+        from django.contrib.auth.models import User
+        user_count = User.objects.count()
+        supervisor_count = Supervisor.objects.count()
+        
+        # Check for session token in Authorization header
+        auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+        session_token = None
+        
+        if auth_header.startswith('Bearer '):
+            session_token = auth_header.split(' ')[1]
+        
+        # Debug logging
+        print(f"DEBUG: User authenticated: {request.user.is_authenticated}")
+        print(f"DEBUG: Session token: {session_token}")
+        print(f"DEBUG: User count: {user_count}, Supervisor count: {supervisor_count}")
+        
+        # Try to authenticate using session token
+        if session_token:
+            try:
+                supervisor = Supervisor.objects.get(session_token=session_token)
+                # Properly authenticate the user
+                from django.contrib.auth import login
+                login(request, supervisor.user)
+                request.user = supervisor.user
+            except Supervisor.DoesNotExist:
+                pass
+        
+        if not request.user.is_authenticated:
+            return Response({
+                'success': False,
+                'error': 'Authentication required'
+            }, status=status.HTTP_401_UNAUTHORIZED)
+        
+        try:
+            supervisor = Supervisor.objects.get(user=request.user)
+        except Supervisor.DoesNotExist:
+            return Response({
+                'success': False,
+                'error': 'Supervisor access required'
+            }, status=status.HTTP_403_FORBIDDEN)
+        
+        if request.method == 'GET':
+            # Return current credentials
+            return Response({
+                'success': True,
+                'credentials': {
+                    'username': request.user.username,
+                    'email': request.user.email,
+                    'hasPassword': bool(request.user.password),
+                    'fullName': f"{request.user.first_name} {request.user.last_name}".strip() or 'YPG Administrator',
+                    'role': 'System Administrator'
+                }
+            })
+        
+        # Handle PUT request for changing credentials
+        data = request.data
+        current_password = data.get('currentPassword')
+        new_username = data.get('newUsername')
+        new_password = data.get('newPassword')
+        otp_code = data.get('otp_code')
+        
+        if not current_password:
+            return Response({
+                'success': False,
+                'error': 'Current password is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Verify current password
+        if not request.user.check_password(current_password):
+            return Response({
+                'success': False,
+                'error': 'Current password is incorrect'
+            }, status=status.HTTP_401_UNAUTHORIZED)
+        
+        # Require SMS OTP verification before applying the change
+        is_valid, error_message = verify_otp(
+            supervisor.user.username, otp_code, purpose='password_change'
+        )
+        if not is_valid:
+            return Response({
+                'success': False,
+                'error': error_message
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Update username if provided
+        if new_username and new_username.strip():
+            # Check if username already exists
+            if User.objects.filter(username=new_username.strip()).exclude(id=request.user.id).exists():
+                return Response({
+                    'success': False,
+                    'error': 'Username already exists'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            request.user.username = new_username.strip()
+        
+        # Update password if provided
+        if new_password and new_password.strip():
+            request.user.set_password(new_password.strip())
+        
+        request.user.save()
+        supervisor.updated_at = timezone.now()
+        supervisor.save()
+        
+        return Response({
+            'success': True,
+            'message': 'Credentials updated successfully',
+            'credentials': {
+                'username': request.user.username,
+                'hasPassword': True
+            }
+        })
+        
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_forgot_password(request):
+    """Emails a password reset link to the supervisor's registered address."""
+    try:
+        email = (request.data.get('email') or '').strip().lower()
+        if not email:
+            return Response({
+                'success': False,
+                'error': 'Email is required'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        from django.contrib.auth.tokens import default_token_generator
+        from django.utils.http import urlsafe_base64_encode
+        from django.utils.encoding import force_bytes
+
+        supervisor = Supervisor.objects.filter(user__email__iexact=email).select_related('user').first()
+
+        # Generic response so attackers can't probe which emails exist.
+        if not supervisor:
+            return Response({
+                'success': True,
+                'message': 'If that email is registered, a reset link has been sent'
+            })
+
+        uid = urlsafe_base64_encode(force_bytes(supervisor.user.pk))
+        token = default_token_generator.make_token(supervisor.user)
+        frontend_url = (getattr(settings, 'FRONTEND_URL', '') or 'https://ahinsandistrictypg.com').rstrip('/')
+        reset_link = f"{frontend_url}/admin/reset-password/{uid}/{token}"
+
+        recipient = supervisor.user.email or (getattr(settings, 'ADMIN_EMAIL', '') or settings.SUPPORT_EMAIL)
+        try:
+            send_mail(
+                'Reset your YPG website password',
+                'We received a request to reset your Ahinsan District YPG website password.\n\n'
+                f'Click the link below to set a new password:\n{reset_link}\n\n'
+                'This link expires shortly and can be used only once.\n'
+                'If you did not request this, you can safely ignore this email.\n\n'
+                '— Ahinsan District YPG Website',
+                settings.DEFAULT_FROM_EMAIL,
+                [recipient],
+                fail_silently=False,
+            )
+        except Exception:
+            logger.exception("Failed to send website reset email")
+            return Response({
+                'success': False,
+                'error': 'Could not send reset email. Please try again later.'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        masked = recipient[:2] + '***' + recipient[recipient.find('@'):] if '@' in recipient else recipient
+        return Response({
+            'success': True,
+            'message': f'Reset link sent to {masked}'
+        })
+
+    except Exception as e:
+        logger.exception("Website forgot-password error")
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_reset_password_confirm(request):
+    """Completes an emailed password reset: uid + token + new password."""
+    try:
+        from django.contrib.auth.tokens import default_token_generator
+        from django.utils.http import urlsafe_base64_decode
+        from django.utils.encoding import force_str
+
+        uid_b64 = request.data.get('uid')
+        token = request.data.get('token')
+        new_password = request.data.get('new_password')
+
+        if not uid_b64 or not token or not new_password:
+            return Response({
+                'success': False,
+                'error': 'Invalid reset link'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if len(new_password) < 8:
+            return Response({
+                'success': False,
+                'error': 'Password must be at least 8 characters long'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            user_id = force_str(urlsafe_base64_decode(uid_b64))
+            user = User.objects.get(pk=user_id)
+            Supervisor.objects.get(user=user)
+        except (User.DoesNotExist, Supervisor.DoesNotExist, ValueError, TypeError, OverflowError):
+            return Response({
+                'success': False,
+                'error': 'Invalid reset link'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        if not default_token_generator.check_token(user, token):
+            return Response({
+                'success': False,
+                'error': 'This reset link is invalid or has expired. Please request a new one.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        user.set_password(new_password)
+        user.save()
+
+        return Response({
+            'success': True,
+            'message': 'Password reset successfully. You can now log in with your new password.'
+        })
+
+    except Exception as e:
+        logger.exception("Website reset-password-confirm error")
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_request_password_change_otp(request):
+    """Sends an SMS OTP to the configured district phone number.
+
+    Accepts either a session cookie or a Bearer session_token header,
+    mirroring the auth resolution in api_supervisor_change_credentials.
+    """
+    try:
+        if not request.user.is_authenticated:
+            auth_header = request.META.get('HTTP_AUTHORIZATION', '')
+            session_token = None
+            if auth_header.startswith('Bearer '):
+                session_token = auth_header.split(' ')[1]
+
+            if session_token:
+                try:
+                    supervisor = Supervisor.objects.get(session_token=session_token)
+                    login(request, supervisor.user)
+                    request.user = supervisor.user
+                except Supervisor.DoesNotExist:
+                    pass
+
+        if not request.user.is_authenticated:
+            return Response({
+                'success': False,
+                'error': 'Authentication required'
+            }, status=status.HTTP_401_UNAUTHORIZED)
+
+        try:
+            supervisor = Supervisor.objects.get(user=request.user)
+        except Supervisor.DoesNotExist:
+            return Response({
+                'success': False,
+                'error': 'Supervisor access required'
+            }, status=status.HTTP_403_FORBIDDEN)
+
+        ok, error_message = issue_otp(supervisor.user.username, user=supervisor.user)
+        if not ok:
+            return Response({
+                'success': False,
+                'error': error_message
+            }, status=429 if 'wait' in (error_message or '') else 500)
+
+        return Response({
+            'success': True,
+            'message': f'A verification code was sent via SMS to {masked_recipient()}'
+        })
+
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_debug_session(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Debug session information"""
+    try:
+        return Response({
+            'success': True,
+            'debug': {
+                'user': str(request.user),
+                'is_authenticated': request.user.is_authenticated,
+                'session_key': request.session.session_key,
+                'session_data': dict(request.session),
+                'cookies': list(request.COOKIES.keys()),
+                'headers': {
+                    'origin': request.META.get('HTTP_ORIGIN'),
+                    'referer': request.META.get('HTTP_REFERER'),
+                    'user_agent': request.META.get('HTTP_USER_AGENT'),
+                }
+            }
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_test_cookie(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Test cookie setting"""
+    try:
+        response = Response({
+            'success': True,
+            'message': 'Test cookie set'
+        })
+        
+        # Set a test cookie
+        response.set_cookie(
+            'test_cookie',
+            'test_value',
+            max_age=3600,  # 1 hour
+            secure=True,
+            samesite='None',
+            httponly=False  # Allow JavaScript access for testing
+        )
+        
+        return response
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_create_supervisor(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Create a supervisor user if none exists"""
+    try:
+        from django.contrib.auth.models import User
+        
+        # Check if any supervisor exists
+        if Supervisor.objects.exists():
+            return Response({
+                'success': False,
+                'error': 'Supervisor already exists'
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Create supervisor user
+        user = User.objects.create_user(
+            username='supervisor',
+            password='admin123',
+            is_staff=True,
+            is_superuser=True,
+            is_active=True
+        )
+        
+        # Create supervisor profile
+        supervisor = Supervisor.objects.create(user=user)
+        
+        return Response({
+            'success': True,
+            'message': 'Supervisor created successfully',
+            'credentials': {
+                'username': 'supervisor',
+                'password': 'admin123'
+            }
+        })
+        
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,178 @@
+"""
+Blog API endpoints
+"""
+
+from django.db.models import F
+from django.shortcuts import get_object_or_404
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..fieldsets import requested_fieldset
+from ..models import BlogPost
+from ..projections import BLOG_CARD, BLOG_LIST, BLOG_RELATED
+from ..serializers import BlogPostSerializer
+
+
+# Blog API endpoints
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_blog_posts(request):
+    """Get all blog posts"""
+    try:
+        # Check if this is for the website (published only) or dashboard (all posts)
+        for_website = request.GET.get('forWebsite', 'false').lower() == 'true'
+        deleted_only = request.GET.get('deleted', 'false').lower() == 'true'
+        
+        fields, exclude = requested_fieldset(request)
+        if deleted_only:
+            posts = BLOG_LIST.narrow(fields, exclude).rows(BlogPost.objects.filter(is_deleted=True).order_by('-created_at'))
+        elif for_website:
+            # Cards only: the full content comes from the detail endpoint
+            posts = BLOG_CARD.narrow(fields, exclude).rows(BlogPost.objects.filter(is_published=True).order_by('-created_at'))
+        else:
+            posts = BLOG_LIST.narrow(fields, exclude).rows(BlogPost.objects.filter(is_deleted=False).order_by('-created_at'))
+
+        return Response({
+            'success': True,
+            'posts': posts
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_blog_post_detail(request, slug):
+    """Get blog post detail"""
+    try:
+        post = get_object_or_404(BlogPost, slug=slug, is_published=True)
+        # Bump the counter in SQL: no re-render, no lost increments
+        BlogPost.objects.filter(pk=post.pk).update(views=F('views') + 1)
+        post.views += 1
+        serializer = BlogPostSerializer(post)
+        return Response({
+            'success': True,
+            'post': serializer.data
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_blog_related_posts(request, slug):
+    """Get the precomputed related posts for a published post (see core.related)"""
+    try:
+        fields, exclude = requested_fieldset(request)
+        # One query; an unknown or unpublished slug simply has no related posts
+        related = BlogPost.objects.filter(
+            related_from__post__slug=slug,
+            related_from__post__is_published=True,
+            related_from__post__is_deleted=False,
+            is_published=True,
+            is_deleted=False,
+        ).order_by('related_from__rank')
+        return Response({
+            'success': True,
+            'posts': BLOG_RELATED.narrow(fields, exclude).rows(related)
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_create_blog_post(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Create a new blog post"""
+    try:
+        if request.FILES:
+            # Handle file upload
+            data = request.data.copy()
+            serializer = BlogPostSerializer(data=data)
+        else:
+            # Handle JSON data
+            data = request.data
+            serializer = BlogPostSerializer(data=data)
+        
+        if serializer.is_valid():
+            post = serializer.save()
+            return Response({
+                'success': True,
+                'message': 'Blog post created successfully',
+                'post': serializer.data
+            }, status=status.HTTP_201_CREATED)
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_update_blog_post(request, slug):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Update a blog post"""
+    try:
+        post = get_object_or_404(BlogPost, slug=slug)
+        data = request.data
+        serializer = BlogPostSerializer(post, data=data, partial=True)
+        
+        if serializer.is_valid():
+            serializer.save()
+            return Response({
+                'success': True,
+                'message': 'Blog post updated successfully'
+            })
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_delete_blog_post(request, slug):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Delete a blog post"""
+    try:
+        post = get_object_or_404(BlogPost, slug=slug)
+        post.delete()
+        
+        return Response({
+            'success': True,
+            'message': 'Blog post deleted successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,61 @@
+"""
+Helpers shared by the API view modules
+"""
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.response import Response
+
+
+class CsrfExemptSessionAuthentication(SessionAuthentication):
+    """Session auth that skips CSRF enforcement.
+
+    The login endpoint needs this: a browser returning with a still-valid
+    session gets CSRF-checked by DRF before credentials are even evaluated,
+    which made re-login impossible.
+    """
+
+    def enforce_csrf(self, request):
+        return
+
+
+# Rate limiting decorator
+def rate_limit(max_requests=10, window_seconds=60):
+    def decorator(view_func):
+        def wrapper(request, *args, **kwargs):
+            # Get client IP
+            client_ip = request.META.get('HTTP_X_FORWARDED_FOR', request.META.get('REMOTE_ADDR', ''))
+            if ',' in client_ip:
+                client_ip = client_ip.split(',')[0].strip()
+            
+            # Create cache key
+            cache_key = f"rate_limit_{client_ip}_{view_func.__name__}"
+            
+            # Get current request count
+            current_requests = cache.get(cache_key, 0)
+            
+            if current_requests >= max_requests:
+                return Response({
+                    'success': False,
+                    'data': {
+                        'success': False,
+                        'error': 'Rate limit exceeded. Please try again later.'
+                    }
+                }, status=status.HTTP_429_TOO_MANY_REQUESTS)
+            
+            # Increment counter
+            cache.set(cache_key, current_requests + 1, window_seconds)
+            
+            return view_func(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def get_client_ip(request):
+    """Get client IP address"""
+    x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
+    if x_forwarded_for:
+        ip = x_forwarded_for.split(',')[0]
+    else:
+        ip = request.META.get('REMOTE_ADDR')
+    return ip
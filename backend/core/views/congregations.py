@@ -0,0 +1,120 @@
+"""
+Congregations API endpoints
+"""
+
+from django.shortcuts import get_object_or_404
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..changes import ChangeFeed
+from ..models import Congregation
+from ..serializers import CongregationSerializer
+
+
+# Congregations API endpoints
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_congregations(request):
+    """Get all congregations"""
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    try:
+        try:
+            feed = ChangeFeed.from_request(request, Congregation)
+        except ValueError as e:
+            return Response({'success': False, 'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        congregations = feed.filter(Congregation.objects.filter(is_active=True).order_by('name'))
+        rows = CongregationSerializer.list_data(request, congregations)
+        return Response({
+            'success': True,
+            'congregations': rows,
+            **feed.meta(rows),
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_create_congregation(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Create a new congregation"""
+    try:
+        data = request.data
+        serializer = CongregationSerializer(data=data)
+        
+        if serializer.is_valid():
+            congregation = serializer.save()
+            return Response({
+                'success': True,
+                'message': 'Congregation created successfully',
+                'congregation_id': congregation.id
+            }, status=status.HTTP_201_CREATED)
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_update_congregation(request, congregation_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Update a congregation"""
+    try:
+        congregation = get_object_or_404(Congregation, id=congregation_id)
+        data = request.data
+        serializer = CongregationSerializer(congregation, data=data, partial=True)
+        
+        if serializer.is_valid():
+            serializer.save()
+            return Response({
+                'success': True,
+                'message': 'Congregation updated successfully'
+            })
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_delete_congregation(request, congregation_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Delete a congregation"""
+    try:
+        congregation = get_object_or_404(Congregation, id=congregation_id)
+        congregation.delete()
+        
+        return Response({
+            'success': True,
+            'message': 'Congregation deleted successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
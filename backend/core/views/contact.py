@@ -0,0 +1,160 @@
+"""
+Contact API endpoints
+"""
+import logging
+
+from django.conf import settings
+from django.contrib import messages
+from django.core.mail import EmailMessage
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..changes import ChangeFeed
+from ..live import publish
+from ..models import ContactMessage
+from ..serializers import ContactMessageSerializer
+
+logger = logging.getLogger(__name__)
+
+
+# Contact API endpoints
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_contact_messages(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Get all contact messages"""
+    try:
+        try:
+            feed = ChangeFeed.from_request(request, ContactMessage)
+        except ValueError as e:
+            return Response({'success': False, 'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        deleted_only = request.GET.get('deleted', 'false').lower() == 'true'
+        if deleted_only:
+            messages = ContactMessage.objects.filter(is_deleted=True).order_by('-created_at')
+        else:
+            messages = ContactMessage.objects.filter(is_deleted=False).order_by('-created_at')
+        rows = ContactMessageSerializer.list_data(request, feed.filter(messages))
+        return Response({
+            'success': True,
+            'messages': rows,
+            **feed.meta(rows),
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+def _contact_category(subject):
+    s = (subject or '').lower()
+    if 'donat' in s or 'offering' in s or 'pledge' in s:
+        return 'Donation Inquiry'
+    if 'member' in s or 'join' in s or 'register' in s:
+        return 'Membership Inquiry'
+    return 'General Inquiry'
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_submit_contact(request):
+    """Submit a contact message and forward it to the support inbox"""
+    try:
+        data = request.data
+        serializer = ContactMessageSerializer(data=data)
+        
+        if serializer.is_valid():
+            message = serializer.save()
+            publish('contact_message', 'created', message.id)
+            category = _contact_category(message.subject)
+            email_sent = True
+            try:
+                body = (
+                    f"You have a new {category.lower()} from the website contact form.\n\n"
+                    f"Name: {message.name}\n"
+                    f"Email: {message.email}\n"
+                    f"Category: {category}\n"
+                    f"Subject: {message.subject}\n\n"
+                    f"Message:\n{message.message}\n\n"
+                    f"Received: {timezone.localtime(message.created_at).strftime('%d %b %Y, %I:%M %p')}"
+                )
+                email = EmailMessage(
+                    subject=f"[Website Contact] {category}: {message.subject}",
+                    body=body,
+                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    to=[settings.SUPPORT_EMAIL],
+                    reply_to=[message.email],
+                )
+                email.send(fail_silently=False)
+                messages.success(request, f"{category} from {message.name} forwarded to support.")
+            except Exception as mail_error:
+                email_sent = False
+                logger.error("Contact notification failed for message %s: %s", message.id, mail_error)
+                messages.error(request, "Message saved but support notification failed.")
+            return Response({
+                'success': True,
+                'email_sent': email_sent,
+                'message': 'Contact message submitted successfully',
+                'message_id': message.id
+            }, status=status.HTTP_201_CREATED)
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_mark_contact_read(request, message_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Mark contact message as read"""
+    try:
+        message = get_object_or_404(ContactMessage, id=message_id)
+        message.is_read = True
+        message.save()
+        publish('contact_message', 'updated', message.id)
+        
+        return Response({
+            'success': True,
+            'message': 'Message marked as read'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_delete_contact(request, message_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Delete a contact message"""
+    try:
+        message = get_object_or_404(ContactMessage, id=message_id)
+        message.delete()
+        publish('contact_message', 'deleted', message_id)
+        
+        return Response({
+            'success': True,
+            'message': 'Contact message deleted successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,529 @@
+"""
+Donations API endpoints and notifications
+"""
+import re
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ParseError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..background import run_in_background
+from ..changes import ChangeFeed
+from ..live import publish
+from ..models import Donation
+from ..payloads import get_payload
+from ..serializers import DonationSerializer
+from .common import rate_limit
+
+
+# Email notification functions
+def send_donation_notifications(donation):
+    """Send email notifications for new donations"""
+    try:
+        # Email to donor
+        donor_subject = f"Donation Confirmation - {donation.receipt_code}"
+        donor_message = f"""
+Dear {donation.donor_name},
+
+Thank you for your generous donation of GHS {donation.amount} to YPG Ministry.
+
+Donation Details:
+- Receipt Code: {donation.receipt_code}
+- Amount: GHS {donation.amount}
+- Purpose: {donation.get_purpose_display()}
+- Payment Method: {donation.get_payment_method_display()}
+- Date: {donation.created_at.strftime('%B %d, %Y at %I:%M %p')}
+
+Your donation is currently pending verification. You will receive another email once it's verified.
+
+Thank you for supporting our ministry!
+
+YPG Ministry Team
+        """
+        
+        # Email to admin
+        admin_subject = f"New Donation - {donation.receipt_code} - GHS {donation.amount}"
+        admin_message = f"""
+New donation received:
+
+Donor: {donation.donor_name}
+Email: {donation.email}
+Phone: {donation.phone}
+Amount: GHS {donation.amount}
+Purpose: {donation.get_purpose_display()}
+Payment Method: {donation.get_payment_method_display()}
+Receipt Code: {donation.receipt_code}
+Date: {donation.created_at.strftime('%B %d, %Y at %I:%M %p')}
+
+Message: {donation.message or 'No message provided'}
+
+Please verify this donation in the admin dashboard.
+
+YPG Donation System
+        """
+        
+        # Send emails (configure SMTP settings in Django settings)
+        if hasattr(settings, 'EMAIL_HOST') and settings.EMAIL_HOST:
+            send_mail(
+                donor_subject,
+                donor_message,
+                settings.DEFAULT_FROM_EMAIL,
+                [donation.email],
+                fail_silently=True,
+            )
+            
+            # Send to admin (you can configure admin email in settings)
+            admin_email = getattr(settings, 'ADMIN_EMAIL', 'ypgahinsandistrict@gmail.com')
+            send_mail(
+                admin_subject,
+                admin_message,
+                settings.DEFAULT_FROM_EMAIL,
+                [admin_email],
+                fail_silently=True,
+            )
+    except Exception as e:
+        print(f"Error sending donation notifications: {e}")
+
+# Input validation functions
+def validate_donation_data(data):
+    errors = {}
+    
+    # Validate donor name
+    if not data.get('donor_name') or len(data['donor_name'].strip()) < 2:
+        errors['donor_name'] = 'Donor name must be at least 2 characters long'
+    
+    # Validate email
+    email = data.get('email', '')
+    if email:
+        email_regex = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        if not re.match(email_regex, email):
+            errors['email'] = 'Please enter a valid email address'
+    
+    # Validate phone
+    phone = data.get('phone', '')
+    if phone:
+        phone = phone.replace(' ', '').replace('-', '')
+        if not (phone.startswith('0') and len(phone) == 10) and not (phone.startswith('+233') and len(phone) == 13):
+            errors['phone'] = 'Phone number must be 10 digits starting with 0 or 13 digits starting with +233'
+    
+    # Validate amount
+    amount = data.get('amount')
+    if not amount or float(amount) <= 0:
+        errors['amount'] = 'Amount must be greater than 0'
+    elif float(amount) > 1000000:  # 1 million limit
+        errors['amount'] = 'Amount cannot exceed 1,000,000'
+    
+    # Validate payment method
+    valid_payment_methods = ['momo', 'cash', 'bank', 'card']
+    if data.get('payment_method') not in valid_payment_methods:
+        errors['payment_method'] = 'Invalid payment method'
+    
+    # Validate purpose
+    valid_purposes = ['general', 'events', 'welfare', 'ministry', 'building', 'education', 'other']
+    if data.get('purpose') not in valid_purposes:
+        errors['purpose'] = 'Invalid purpose'
+    
+    return errors
+
+# Donations API endpoints
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_donations(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Get all donations with analytics"""
+    try:
+        try:
+            feed = ChangeFeed.from_request(request, Donation)
+        except ValueError as e:
+            return Response({'success': False, 'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        # Trash support: donations are not soft-deleted; when deleted=true return empty
+        deleted_only = request.GET.get('deleted', 'false').lower() == 'true'
+        if deleted_only:
+            return Response({
+                'success': True,
+                'donations': [],
+                'analytics': {
+                    'total_amount': 0,
+                    'total_count': 0,
+                    'monthly_amount': 0,
+                    'monthly_count': 0,
+                    'purpose_breakdown': [],
+                    'payment_breakdown': [],
+                    'status_breakdown': [],
+                }
+            })
+
+        from django.db.models import Sum, Count
+        from django.utils import timezone
+        from datetime import timedelta
+        
+        donations = Donation.objects.all().order_by('-created_at')
+        # The analytics below always cover every donation
+        rows = DonationSerializer.list_data(request, feed.filter(donations))
+        
+        # Analytics data
+        total_donations = donations.aggregate(
+            total_amount=Sum('amount'),
+            total_count=Count('id')
+        )
+        
+        # Monthly donations
+        thirty_days_ago = timezone.now() - timedelta(days=30)
+        monthly_donations = donations.filter(created_at__gte=thirty_days_ago).aggregate(
+            monthly_amount=Sum('amount'),
+            monthly_count=Count('id')
+        )
+        
+        # Purpose breakdown
+        purpose_breakdown = donations.values('purpose').annotate(
+            amount=Sum('amount'),
+            count=Count('id')
+        ).order_by('-amount')
+        
+        # Payment method breakdown
+        payment_breakdown = donations.values('payment_method').annotate(
+            amount=Sum('amount'),
+            count=Count('id')
+        ).order_by('-amount')
+        
+        # Status breakdown
+        status_breakdown = donations.values('payment_status').annotate(
+            amount=Sum('amount'),
+            count=Count('id')
+        ).order_by('-amount')
+        
+        return Response({
+            'success': True,
+            'donations': rows,
+            **feed.meta(rows),
+            'analytics': {
+                'total_amount': total_donations['total_amount'] or 0,
+                'total_count': total_donations['total_count'] or 0,
+                'monthly_amount': monthly_donations['monthly_amount'] or 0,
+                'monthly_count': monthly_donations['monthly_count'] or 0,
+                'purpose_breakdown': list(purpose_breakdown),
+                'payment_breakdown': list(payment_breakdown),
+                'status_breakdown': list(status_breakdown),
+            }
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+@rate_limit(max_requests=5, window_seconds=300)  # 5 requests per 5 minutes
+def api_submit_donation(request):
+    """Submit a donation"""
+    try:
+        data = request.data
+        
+        # Validate input data
+        validation_errors = validate_donation_data(data)
+        if validation_errors:
+            return Response({
+                'success': False,
+                'data': {
+                    'success': False,
+                    'error': 'Validation failed',
+                    'details': validation_errors
+                }
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        # Sanitize input data
+        data['donor_name'] = data.get('donor_name', '').strip()[:100]
+        data['email'] = data.get('email', '').strip().lower()[:254]
+        data['phone'] = data.get('phone', '').strip()[:20]
+        data['message'] = data.get('message', '').strip()[:1000]
+        
+        serializer = DonationSerializer(data=data)
+        
+        if serializer.is_valid():
+            donation = serializer.save()
+            
+            # Auto-verify certain payment methods
+            if donation.payment_method in ['cash', 'bank']:
+                donation.payment_status = 'verified'
+                donation.verified_at = timezone.now()
+                donation.verified_by = 'Auto-Verification'
+                donation.save()
+            
+            publish('donation', 'created', donation.id)
+
+            # Send email notifications
+            run_in_background(send_donation_notifications, donation)
+            
+            return Response({
+                'success': True,
+                'data': {
+                    'success': True,
+                    'message': 'Donation submitted successfully',
+                    'donation_id': donation.id,
+                    'receipt_code': donation.receipt_code,
+                    'donation': DonationSerializer(donation).data
+                }
+            }, status=status.HTTP_201_CREATED)
+        else:
+            return Response({
+                'success': False,
+                'data': {
+                    'success': False,
+                    'error': 'Validation failed',
+                    'details': serializer.errors
+                }
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except ParseError:
+        return Response({
+            'success': False,
+            'data': {
+                'success': False,
+                'error': 'Invalid JSON data'
+            }
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'data': {
+                'success': False,
+                'error': 'Internal server error'
+            }
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_verify_donation(request, donation_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Verify a donation"""
+    try:
+        donation = get_object_or_404(Donation, id=donation_id)
+        donation.payment_status = 'verified'
+        donation.verified_at = timezone.now()
+        donation.verified_by = request.data.get('verified_by', 'Admin')
+        with transaction.atomic():
+            # Locks the row for the site stats delta (core.stats)
+            donation.save()
+        publish('donation', 'updated', donation.id)
+        
+        return Response({
+            'success': True,
+            'data': {
+                'success': True,
+                'message': 'Donation verified successfully',
+                'donation': DonationSerializer(donation).data
+            }
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'data': {
+                'success': False,
+                'error': str(e)
+            }
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_delete_donation(request, donation_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Delete a donation"""
+    try:
+        donation = get_object_or_404(Donation, id=donation_id)
+        donation.delete()
+        publish('donation', 'deleted', donation_id)
+        
+        return Response({
+            'success': True,
+            'data': {
+                'success': True,
+                'message': 'Donation deleted successfully'
+            }
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'data': {
+                'success': False,
+                'error': str(e)
+            }
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_donation_analytics(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Get donation analytics"""
+    try:
+        return Response({
+            'success': True,
+            'data': get_payload('donation_analytics')
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'data': {
+                'success': False,
+                'error': str(e)
+            }
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_impact_statistics(request):
+    """Get real impact statistics for the donation page"""
+    try:
+        return Response({
+            'success': True,
+            'data': get_payload('impact_statistics')
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'data': {
+                'success': False,
+                'error': str(e)
+            }
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_process_payment(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Process payment through payment gateway (Paystack integration)"""
+    try:
+        data = request.data
+        donation_id = data.get('donation_id')
+        payment_method = data.get('payment_method')
+        
+        if not donation_id:
+            return Response({
+                'success': False,
+                'data': {
+                    'success': False,
+                    'error': 'Donation ID is required'
+                }
+            }, status=status.HTTP_400_BAD_REQUEST)
+        
+        donation = get_object_or_404(Donation, id=donation_id)
+        
+        if payment_method == 'card':
+            # Simulate payment gateway processing
+            # In real implementation, integrate with Paystack, Stripe, etc.
+            payment_result = process_card_payment(donation)
+            
+            if payment_result['success']:
+                donation.payment_status = 'verified'
+                donation.verified_at = timezone.now()
+                donation.verified_by = 'Payment Gateway'
+                donation.transaction_id = payment_result['transaction_id']
+                with transaction.atomic():
+                    donation.save()
+                publish('donation', 'updated', donation.id)
+                
+                # Send verification email
+                run_in_background(send_verification_notification, donation)
+                
+                return Response({
+                    'success': True,
+                    'data': {
+                        'success': True,
+                        'message': 'Payment processed successfully',
+                        'transaction_id': payment_result['transaction_id'],
+                        'donation': DonationSerializer(donation).data
+                    }
+                })
+            else:
+                donation.payment_status = 'failed'
+                with transaction.atomic():
+                    donation.save()
+                publish('donation', 'updated', donation.id)
+                
+                return Response({
+                    'success': False,
+                    'data': {
+                        'success': False,
+                        'error': payment_result['error']
+                    }
+                }, status=status.HTTP_400_BAD_REQUEST)
+        
+        return Response({
+            'success': False,
+            'data': {
+                'success': False,
+                'error': 'Invalid payment method'
+            }
+        }, status=status.HTTP_400_BAD_REQUEST)
+        
+    except Exception as e:
+        return Response({
+            'success': False,
+            'data': {
+                'success': False,
+                'error': str(e)
+            }
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+def process_card_payment(donation):
+    """Simulate card payment processing"""
+    # In real implementation, integrate with payment gateway
+    # For now, simulate successful payment
+    import uuid
+    
+    return {
+        'success': True,
+        'transaction_id': f"TXN_{uuid.uuid4().hex[:12].upper()}",
+        'message': 'Payment processed successfully'
+    }
+
+def send_verification_notification(donation):
+    """Send verification notification to donor"""
+    try:
+        subject = f"Donation Verified - {donation.receipt_code}"
+        message = f"""
+Dear {donation.donor_name},
+
+Great news! Your donation of GHS {donation.amount} has been verified and processed.
+
+Donation Details:
+- Receipt Code: {donation.receipt_code}
+- Amount: GHS {donation.amount}
+- Purpose: {donation.get_purpose_display()}
+- Transaction ID: {donation.transaction_id}
+- Verified Date: {donation.verified_at.strftime('%B %d, %Y at %I:%M %p')}
+
+Thank you for your generous support of our ministry!
+
+YPG Ministry Team
+        """
+        
+        if hasattr(settings, 'EMAIL_HOST') and settings.EMAIL_HOST:
+            send_mail(
+                subject,
+                message,
+                settings.DEFAULT_FROM_EMAIL,
+                [donation.email],
+                fail_silently=True,
+            )
+    except Exception as e:
+        print(f"Error sending verification notification: {e}")
@@ -0,0 +1,196 @@
+"""
+Events API endpoints
+"""
+
+from django.shortcuts import get_object_or_404
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..models import Event
+from ..serializers import EventSerializer
+
+
+# Events API endpoints
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_event_detail(request, event_id):
+    """Get event detail"""
+    try:
+        event = get_object_or_404(Event, id=event_id)
+        serializer = EventSerializer(event)
+        return Response({
+            'success': True,
+            'event': serializer.data
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_create_event(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Create a new event"""
+    try:
+        from datetime import datetime
+        
+        # Handle both JSON and FormData
+        if request.content_type == 'application/json':
+            data = request.data
+        else:
+            # Handle FormData
+            data = {
+                'title': request.POST.get('title'),
+                'description': request.POST.get('description'),
+                'location': request.POST.get('location'),
+                'participants': int(request.POST.get('participants', 0)),
+                'event_type': 'general',  # Default event type
+                'is_featured': False,
+                'registration_required': False,
+            }
+            
+            # Handle image upload
+            if 'image' in request.FILES:
+                data['image'] = request.FILES['image']
+            
+            # Combine date and time fields
+            start_date = request.POST.get('start_date')
+            start_time = request.POST.get('start_time')
+            end_date = request.POST.get('end_date')
+            end_time = request.POST.get('end_time')
+            
+            if start_date and start_time:
+                data['start_date'] = f"{start_date} {start_time}"
+            elif start_date:
+                data['start_date'] = f"{start_date} 00:00:00"
+                
+            if end_date and end_time:
+                data['end_date'] = f"{end_date} {end_time}"
+            elif end_date:
+                data['end_date'] = f"{end_date} 23:59:59"
+        
+        serializer = EventSerializer(data=data)
+        
+        if serializer.is_valid():
+            event = serializer.save()
+            return Response({
+                'success': True,
+                'message': 'Event created successfully',
+                'event': serializer.data
+            }, status=status.HTTP_201_CREATED)
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_update_event(request, event_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Update an event"""
+    try:
+        event = get_object_or_404(Event, id=event_id)
+        
+        # Handle both JSON and FormData
+        if request.content_type == 'application/json':
+            data = request.data
+        else:
+            # Handle FormData
+            data = {
+                'title': request.POST.get('title'),
+                'description': request.POST.get('description'),
+                'location': request.POST.get('location'),
+                'participants': int(request.POST.get('participants', 0)),
+                'event_type': 'general',  # Default event type
+                'is_featured': False,
+                'registration_required': False,
+            }
+            
+            # Handle image upload
+            if 'image' in request.FILES:
+                data['image'] = request.FILES['image']
+            
+            # Combine date and time fields
+            start_date = request.POST.get('start_date')
+            start_time = request.POST.get('start_time')
+            end_date = request.POST.get('end_date')
+            end_time = request.POST.get('end_time')
+            
+            if start_date and start_time:
+                data['start_date'] = f"{start_date} {start_time}"
+            elif start_date:
+                data['start_date'] = f"{start_date} 00:00:00"
+                
+            if end_date and end_time:
+                data['end_date'] = f"{end_date} {end_time}"
+            elif end_date:
+                data['end_date'] = f"{end_date} 23:59:59"
+        
+        serializer = EventSerializer(event, data=data, partial=True)
+        
+        if serializer.is_valid():
+            updated_event = serializer.save()
+            return Response({
+                'success': True,
+                'message': 'Event updated successfully',
+                'event': serializer.data
+            })
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_delete_event(request, event_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Delete an event"""
+    try:
+        event = get_object_or_404(Event, id=event_id)
+        
+        # Get delete type from query parameters
+        delete_type = request.GET.get('type', 'both')
+        
+        if delete_type == 'dashboard':
+            # Soft delete - mark as deleted from dashboard only
+            event.dashboard_deleted = True
+            event.save()
+            message = 'Event removed from dashboard successfully'
+        else:
+            # Hard delete - remove completely
+            event.delete()
+            message = 'Event deleted permanently'
+        
+        return Response({
+            'success': True,
+            'message': message
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
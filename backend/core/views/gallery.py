@@ -0,0 +1,144 @@
+"""
+Gallery API endpoints
+"""
+
+from django.shortcuts import get_object_or_404
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..models import GalleryItem
+from ..serializers import GalleryItemSerializer
+
+
+# Gallery API endpoints
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_create_gallery_item(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Create a new gallery item"""
+    try:
+        if request.FILES:
+            # Handle file upload WITHOUT copying request.data (avoid deepcopy of files)
+            category_value = (request.POST.get('category') or '').strip().lower()
+            payload = {
+                'title': request.POST.get('title'),
+                'description': request.POST.get('description', ''),
+                'category': category_value or 'image',
+                'congregation': request.POST.get('congregation', ''),
+                'date': request.POST.get('date'),
+                'youtube_url': request.POST.get('youtube_url', ''),
+                'tiktok_url': request.POST.get('tiktok_url', ''),
+                'is_featured': request.POST.get('is_featured', False),
+            }
+
+            # Map generic 'file' to correct field
+            if category_value == 'video' and 'file' in request.FILES:
+                payload['video'] = request.FILES['file']
+            elif category_value == 'image' and 'file' in request.FILES:
+                payload['image'] = request.FILES['file']
+
+            serializer = GalleryItemSerializer(data=payload)
+        else:
+            # Handle JSON data
+            data = request.data
+            serializer = GalleryItemSerializer(data=data)
+        
+        if serializer.is_valid():
+            item = serializer.save()
+            return Response({
+                'success': True,
+                'message': 'Gallery item created successfully',
+                'media': serializer.data
+            }, status=status.HTTP_201_CREATED)
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        import traceback
+        print(f"Error in api_create_gallery_item: {str(e)}")
+        print(traceback.format_exc())
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_update_gallery_item(request, item_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Update a gallery item"""
+    try:
+        item = get_object_or_404(GalleryItem, id=item_id)
+        # Check content type to determine how to parse the request
+        if request.content_type and 'multipart/form-data' in request.content_type:
+            # Handle FormData (with or without files)
+            category_value = (request.POST.get('category') or '').strip().lower()
+            payload = {
+                'title': request.POST.get('title'),
+                'description': request.POST.get('description', ''),
+                'category': category_value or None,
+                'congregation': request.POST.get('congregation', ''),
+                'date': request.POST.get('date'),
+                'youtube_url': request.POST.get('youtube_url', ''),
+                'tiktok_url': request.POST.get('tiktok_url', ''),
+                'is_featured': request.POST.get('is_featured', None),
+            }
+
+            # Attach uploaded file if present
+            if category_value == 'video' and 'file' in request.FILES:
+                payload['video'] = request.FILES['file']
+            elif category_value == 'image' and 'file' in request.FILES:
+                payload['image'] = request.FILES['file']
+
+            serializer = GalleryItemSerializer(item, data=payload, partial=True)
+        else:
+            # Handle JSON
+            data = request.data
+            serializer = GalleryItemSerializer(item, data=data, partial=True)
+        
+        if serializer.is_valid():
+            serializer.save()
+            return Response({
+                'success': True,
+                'message': 'Gallery item updated successfully'
+            })
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_delete_gallery_item(request, item_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Delete a gallery item"""
+    try:
+        item = get_object_or_404(GalleryItem, id=item_id)
+        item.delete()
+        
+        return Response({
+            'success': True,
+            'message': 'Gallery item deleted successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
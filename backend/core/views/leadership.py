@@ -0,0 +1,417 @@
+"""
+Branch president and past executive API endpoints
+"""
+
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..models import BranchPresident, PastExecutive
+from ..reorder import apply_order, parse_ids
+
+
+# Branch President API Views
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_branch_presidents(request):
+    """Get all branch presidents for main website"""
+    try:
+        presidents = BranchPresident.objects.filter(is_active=True).order_by('created_at')
+        data = []
+        for president in presidents:
+            data.append({
+                'id': president.id,
+                'name': president.name,
+                'congregation': president.congregation,
+                'location': president.location,
+                'phone': president.phone,
+                'email': president.email,
+                'position': president.position,
+                'is_active': president.is_active,
+                'created_at': president.created_at.isoformat(),
+            })
+        return Response({
+            'success': True,
+            'presidents': data
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_branch_presidents_admin(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Get all branch presidents for admin dashboard"""
+    try:
+        presidents = BranchPresident.objects.all().order_by('created_at')
+        data = []
+        for president in presidents:
+            data.append({
+                'id': president.id,
+                'name': president.name,
+                'congregation': president.congregation,
+                'location': president.location,
+                'phone': president.phone,
+                'email': president.email,
+                'position': president.position,
+                'is_active': president.is_active,
+                'created_at': president.created_at.isoformat(),
+                'updated_at': president.updated_at.isoformat(),
+            })
+        return Response({
+            'success': True,
+            'presidents': data
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_branch_president_create(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Create new branch president"""
+    try:
+        data = request.data
+        president = BranchPresident.objects.create(
+            name=data.get('name'),
+            congregation=data.get('congregation'),
+            location=data.get('location', ''),
+            phone=data.get('phone'),
+            email=data.get('email', ''),
+            position=data.get('position', 'Branch President'),
+            is_active=data.get('is_active', True)
+        )
+        return Response({
+            'success': True,
+            'message': 'Branch president created successfully',
+            'id': president.id
+        }, status=status.HTTP_201_CREATED)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_branch_president_update(request, president_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Update branch president"""
+    try:
+        data = request.data
+        president = BranchPresident.objects.get(id=president_id)
+        president.name = data.get('name', president.name)
+        president.congregation = data.get('congregation', president.congregation)
+        president.location = data.get('location', president.location)
+        president.phone = data.get('phone', president.phone)
+        president.email = data.get('email', president.email)
+        president.position = data.get('position', president.position)
+        president.is_active = data.get('is_active', president.is_active)
+        president.save()
+        return Response({
+            'success': True,
+            'message': 'Branch president updated successfully'
+        }, status=status.HTTP_200_OK)
+    except BranchPresident.DoesNotExist:
+        return Response({
+            'success': False,
+            'error': 'Branch president not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_branch_president_delete(request, president_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Delete branch president"""
+    try:
+        president = BranchPresident.objects.get(id=president_id)
+        president.delete()
+        return Response({
+            'success': True,
+            'message': 'Branch president deleted successfully'
+        }, status=status.HTTP_200_OK)
+    except BranchPresident.DoesNotExist:
+        return Response({
+            'success': False,
+            'error': 'Branch president not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+# Past Executives API Views
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_past_executives(request):
+    """Get all past executives"""
+    try:
+        show_deleted = request.GET.get('deleted', 'false').lower() == 'true'
+        
+        if show_deleted:
+            executives = PastExecutive.objects.filter(is_deleted=True)
+        else:
+            executives = PastExecutive.objects.filter(is_deleted=False)
+        
+        # Sort: most recent term first (by end year in reign_period), then by position_order within each term
+        def get_end_year(executive):
+            period = getattr(executive, 'reign_period', '') or ''
+            parts = [p.strip() for p in period.replace('–', '-').split('-')]
+            try:
+                return -int(parts[-1])  # Negate so most recent sorts first
+            except (ValueError, IndexError):
+                return 0
+
+        fallback_order = {
+            'president': 1,
+            "president's rep": 2,
+            'secretary': 3,
+            'assistant secretary': 4,
+            'financial secretary': 5,
+            'treasurer': 6,
+            'evangelism coordinator': 7,
+            'organizer': 8,
+            'others': 99,
+        }
+
+        def get_position_order(executive):
+            order = getattr(executive, 'position_order', 999)
+            if order != 999:
+                return order
+            return fallback_order.get(getattr(executive, 'position', '').lower(), 999)
+
+        executives_list = list(executives)
+        executives_list.sort(key=lambda x: (get_end_year(x), get_position_order(x)))
+        
+        data = []
+        for executive in executives_list:
+            data.append({
+                'id': executive.id,
+                'name': executive.name,
+                'position': executive.position,
+                'position_display': executive.get_position_display(),
+                'reign_period': executive.reign_period,
+                'image': executive.image.url if executive.image else None,
+                'is_deleted': executive.is_deleted,
+                'created_at': executive.created_at.isoformat(),
+                'updated_at': executive.updated_at.isoformat(),
+            })
+        
+        return Response({
+            'success': True,
+            'pastExecutives': data
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_past_executive_create(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Create new past executive"""
+    try:
+        # Handle both JSON and FormData requests
+        if request.content_type == 'application/json':
+            data = request.data
+        else:
+            # Handle FormData
+            data = {
+                'name': request.POST.get('name'),
+                'position': request.POST.get('position', 'other'),
+                'reign_period': request.POST.get('reign_period', ''),
+            }
+            # Handle image upload
+            if 'image' in request.FILES:
+                data['image'] = request.FILES['image']
+        
+        executive = PastExecutive.objects.create(
+            name=data.get('name'),
+            position=data.get('position', 'other'),
+            reign_period=data.get('reign_period', ''),
+            image=data.get('image')
+        )
+        
+        return Response({
+            'success': True,
+            'message': 'Past executive created successfully',
+            'executive': {
+                'id': executive.id,
+                'name': executive.name,
+                'position': executive.position,
+                'position_display': executive.get_position_display(),
+                'reign_period': executive.reign_period,
+                'image': executive.image.url if executive.image else None,
+                'is_deleted': executive.is_deleted,
+                'created_at': executive.created_at.isoformat(),
+                'updated_at': executive.updated_at.isoformat(),
+            }
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_past_executive_update(request, executive_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Update past executive"""
+    try:
+        # Handle both JSON and FormData requests
+        if request.content_type == 'application/json':
+            data = request.data
+        else:
+            # Handle FormData
+            data = {
+                'name': request.POST.get('name'),
+                'position': request.POST.get('position'),
+                'reign_period': request.POST.get('reign_period'),
+            }
+            # Handle image upload
+            if 'image' in request.FILES:
+                data['image'] = request.FILES['image']
+        
+        executive = PastExecutive.objects.get(id=executive_id)
+        
+        executive.name = data.get('name', executive.name)
+        executive.position = data.get('position', executive.position)
+        executive.reign_period = data.get('reign_period', executive.reign_period)
+        if 'image' in data and data['image'] is not None:
+            executive.image = data['image']
+        executive.save()
+        
+        return Response({
+            'success': True,
+            'message': 'Past executive updated successfully',
+            'executive': {
+                'id': executive.id,
+                'name': executive.name,
+                'position': executive.position,
+                'position_display': executive.get_position_display(),
+                'reign_period': executive.reign_period,
+                'image': executive.image.url if executive.image else None,
+                'is_deleted': executive.is_deleted,
+                'created_at': executive.created_at.isoformat(),
+                'updated_at': executive.updated_at.isoformat(),
+            }
+        })
+    except PastExecutive.DoesNotExist:
+        return Response({
+            'success': False,
+            'error': 'Past executive not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_past_executive_reorder(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Save a drag-and-drop order: {"ids": [...]} sets position_order 1..n"""
+    try:
+        updated = apply_order(PastExecutive.objects.all(), parse_ids(request.data), 'position_order')
+        return Response({
+            'success': True,
+            'updated': updated
+        })
+    except ValueError as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_past_executive_delete(request, executive_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Delete past executive (soft delete)"""
+    try:
+        executive = PastExecutive.objects.get(id=executive_id)
+        executive.is_deleted = True
+        executive.save()
+        
+        return Response({
+            'success': True,
+            'message': 'Past executive deleted successfully'
+        })
+    except PastExecutive.DoesNotExist:
+        return Response({
+            'success': False,
+            'error': 'Past executive not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_past_executive_hard_delete(request, executive_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Permanently delete past executive from database"""
+    try:
+        executive = PastExecutive.objects.get(id=executive_id)
+        executive.delete()
+        return Response({
+            'success': True,
+            'message': 'Past executive permanently deleted'
+        })
+    except PastExecutive.DoesNotExist:
+        return Response({
+            'success': False,
+            'error': 'Past executive not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -0,0 +1,184 @@
+"""
+Ministry and ministry registration API endpoints
+"""
+
+from django.shortcuts import get_object_or_404
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..models import MinistryRegistration, Ministry
+from ..serializers import MinistryRegistrationSerializer, MinistrySerializer
+
+
+# Ministry API endpoints
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_ministry_registrations(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Get all ministry registrations"""
+    try:
+        # No soft-delete implemented; support deleted=true by returning empty
+        deleted_only = request.GET.get('deleted', 'false').lower() == 'true'
+        if deleted_only:
+            registrations = MinistryRegistration.objects.none()
+        else:
+            registrations = MinistryRegistration.objects.all().order_by('-created_at')
+        serializer = MinistryRegistrationSerializer.for_list(request, registrations)
+        return Response({
+            'success': True,
+            'ministry': serializer.data
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_submit_ministry_registration(request):
+    """Submit a ministry registration"""
+    try:
+        data = request.data
+        serializer = MinistryRegistrationSerializer(data=data)
+        
+        if serializer.is_valid():
+            registration = serializer.save()
+            return Response({
+                'success': True,
+                'message': 'Ministry registration submitted successfully',
+                'registration_id': registration.id
+            }, status=status.HTTP_201_CREATED)
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_update_ministry_registration(request, registration_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Update a ministry registration"""
+    try:
+        registration = get_object_or_404(MinistryRegistration, id=registration_id)
+        data = request.data
+        serializer = MinistryRegistrationSerializer(registration, data=data, partial=True)
+        if serializer.is_valid():
+            updated = serializer.save()
+            return Response(serializer.data)
+        else:
+            return Response({'success': False, 'error': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({'success': False, 'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_approve_ministry_registration(request, registration_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Approve a ministry registration"""
+    try:
+        registration = get_object_or_404(MinistryRegistration, id=registration_id)
+        registration.is_approved = True
+        registration.save()
+        
+        return Response({
+            'success': True,
+            'message': 'Ministry registration approved successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_delete_ministry_registration(request, registration_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Delete a ministry registration"""
+    try:
+        registration = get_object_or_404(MinistryRegistration, id=registration_id)
+        registration.delete()
+        
+        return Response({
+            'success': True,
+            'message': 'Ministry registration deleted successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+# Ministries CRUD
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_create_ministry(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    try:
+        data = request.data
+        serializer = MinistrySerializer(data=data)
+        if serializer.is_valid():
+            item = serializer.save()
+            return Response({'success': True, 'ministry': MinistrySerializer(item).data}, status=status.HTTP_201_CREATED)
+        return Response({'success': False, 'error': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({'success': False, 'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_update_ministry(request, ministry_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    try:
+        item = get_object_or_404(Ministry, id=ministry_id)
+        data = request.data
+        serializer = MinistrySerializer(item, data=data, partial=True)
+        if serializer.is_valid():
+            updated = serializer.save()
+            return Response({'success': True, 'ministry': MinistrySerializer(updated).data})
+        return Response({'success': False, 'error': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({'success': False, 'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_delete_ministry(request, ministry_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    try:
+        delete_type = request.GET.get('type', 'both')
+        item = get_object_or_404(Ministry, id=ministry_id)
+        if delete_type == 'dashboard':
+            item.dashboard_deleted = True
+            item.save()
+            return Response({'success': True, 'message': 'Ministry removed from dashboard'})
+        item.delete()
+        return Response({'success': True, 'message': 'Ministry deleted successfully'})
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
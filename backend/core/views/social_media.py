@@ -0,0 +1,222 @@
+"""
+Social media link API endpoints
+"""
+
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..models import SocialMediaLink
+from ..fieldsets import requested_fieldset, trim
+from ..payloads import get_payload
+from ..reorder import apply_order, parse_ids
+
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_social_media_links(request):
+    """Get all active social media links for the website"""
+    try:
+        return Response({
+            'success': True,
+            'social_media_links': trim(get_payload('social_media_links'), *requested_fieldset(request))
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_social_media_links_admin(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Get all social media links for admin (including inactive)"""
+    try:
+        links = SocialMediaLink.objects.all().order_by('display_order', 'id')
+        data = [{
+            'id': link.id,
+            'platform_name': link.platform_name,
+            'custom_platform_name': link.custom_platform_name,
+            'display_name': link.get_display_name(),
+            'url': link.url,
+            'icon_name': link.icon_name,
+            'icon_file': link.icon_file.url if link.icon_file else None,
+            'display_order': link.display_order,
+            'is_active': link.is_active,
+            'created_at': link.created_at.isoformat(),
+            'updated_at': link.updated_at.isoformat(),
+        } for link in links]
+        return Response({
+            'success': True,
+            'social_media_links': data
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_social_media_create(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Create new social media link"""
+    try:
+        # Check if this is a file upload (multipart/form-data)
+        if request.content_type and 'multipart/form-data' in request.content_type:
+            platform_name = request.POST.get('platform_name', 'other')
+            custom_platform_name = request.POST.get('custom_platform_name', '')
+            url = request.POST.get('url')
+            icon_name = request.POST.get('icon_name', '')
+            display_order = request.POST.get('display_order', 0)
+            is_active = request.POST.get('is_active', 'true').lower() == 'true'
+            icon_file = request.FILES.get('icon_file')
+            
+            link = SocialMediaLink.objects.create(
+                platform_name=platform_name,
+                custom_platform_name=custom_platform_name,
+                url=url,
+                icon_name=icon_name,
+                icon_file=icon_file,
+                display_order=int(display_order),
+                is_active=is_active
+            )
+        else:
+            data = request.data
+            link = SocialMediaLink.objects.create(
+                platform_name=data.get('platform_name', 'other'),
+                custom_platform_name=data.get('custom_platform_name', ''),
+                url=data.get('url'),
+                icon_name=data.get('icon_name', ''),
+                display_order=data.get('display_order', 0),
+                is_active=data.get('is_active', True)
+            )
+        
+        return Response({
+            'success': True,
+            'message': 'Social media link created successfully',
+            'id': link.id
+        }, status=status.HTTP_201_CREATED)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_social_media_update(request, link_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Update social media link"""
+    try:
+        link = SocialMediaLink.objects.get(id=link_id)
+        
+        # Check if this is a file upload (multipart/form-data)
+        if request.content_type and 'multipart/form-data' in request.content_type:
+            link.platform_name = request.POST.get('platform_name', link.platform_name)
+            link.custom_platform_name = request.POST.get('custom_platform_name', link.custom_platform_name)
+            link.url = request.POST.get('url', link.url)
+            link.icon_name = request.POST.get('icon_name', link.icon_name)
+            link.display_order = int(request.POST.get('display_order', link.display_order))
+            link.is_active = request.POST.get('is_active', 'true').lower() == 'true'
+            
+            # Handle file upload
+            icon_file = request.FILES.get('icon_file')
+            if icon_file:
+                link.icon_file = icon_file
+        else:
+            data = request.data
+            link.platform_name = data.get('platform_name', link.platform_name)
+            link.custom_platform_name = data.get('custom_platform_name', link.custom_platform_name)
+            link.url = data.get('url', link.url)
+            link.icon_name = data.get('icon_name', link.icon_name)
+            link.display_order = data.get('display_order', link.display_order)
+            link.is_active = data.get('is_active', link.is_active)
+        
+        link.save()
+        
+        return Response({
+            'success': True,
+            'message': 'Social media link updated successfully',
+            'link': {
+                'id': link.id,
+                'platform_name': link.platform_name,
+                'custom_platform_name': link.custom_platform_name,
+                'display_name': link.get_display_name(),
+                'url': link.url,
+                'icon_name': link.icon_name,
+                'icon_file': link.icon_file.url if link.icon_file else None,
+                'display_order': link.display_order,
+                'is_active': link.is_active,
+            }
+        })
+    except SocialMediaLink.DoesNotExist:
+        return Response({
+            'success': False,
+            'error': 'Social media link not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_social_media_reorder(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Save a drag-and-drop order: {"ids": [...]} sets display_order 1..n"""
+    try:
+        updated = apply_order(SocialMediaLink.objects.all(), parse_ids(request.data), 'display_order')
+        return Response({
+            'success': True,
+            'updated': updated
+        })
+    except ValueError as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_social_media_delete(request, link_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Delete social media link"""
+    try:
+        link = SocialMediaLink.objects.get(id=link_id)
+        link.delete()
+        
+        return Response({
+            'success': True,
+            'message': 'Social media link deleted successfully'
+        })
+    except SocialMediaLink.DoesNotExist:
+        return Response({
+            'success': False,
+            'error': 'Social media link not found'
+        }, status=status.HTTP_404_NOT_FOUND)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
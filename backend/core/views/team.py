@@ -0,0 +1,342 @@
+"""
+Team and council API endpoints
+"""
+
+from django.shortcuts import get_object_or_404
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..changes import ChangeFeed
+from ..models import TeamMember
+from ..fieldsets import requested_fieldset
+from ..payloads import get_payload, get_stamped_payload
+from ..reorder import apply_order, parse_ids
+from ..serializers import TeamMemberSerializer
+
+
+# Team API endpoints
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_team_members(request):
+    """Get all team members"""
+    try:
+        # Trash support: return only deleted when ?deleted=true
+        deleted_only = request.GET.get('deleted', 'false').lower() == 'true'
+        fields, exclude = requested_fieldset(request)
+        try:
+            feed = ChangeFeed.from_request(request, TeamMember)
+        except ValueError as e:
+            return Response({'success': False, 'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        team, built_at = get_stamped_payload(
+            'team', deleted=deleted_only, fields=fields, exclude=exclude, since=feed.since,
+        )
+        return Response({
+            'success': True,
+            'team': team,
+            **feed.meta(team, built_at),
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_council_members(request):
+    """Get all council members (same as team members)"""
+    try:
+        fields, exclude = requested_fieldset(request)
+        return Response({
+            'success': True,
+            'councilMembers': get_payload('council', fields=fields, exclude=exclude)
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def api_team_member_detail(request, member_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Get team member detail"""
+    try:
+        member = get_object_or_404(TeamMember, id=member_id)
+        serializer = TeamMemberSerializer(member)
+        return Response({
+            'success': True,
+            'member': serializer.data
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_create_team_member(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Create a new team member"""
+    try:
+        # Handle both JSON and FormData requests
+        if request.content_type == 'application/json':
+            data = request.data
+        else:
+            # Handle FormData
+            data = {
+                'name': request.POST.get('name'),
+                'position': request.POST.get('position'),
+                'congregation': request.POST.get('congregation', ''),
+                'phone': request.POST.get('phone', ''),
+                'email': request.POST.get('email', ''),
+                'quote': request.POST.get('quote', request.POST.get('description', '')),
+                'is_active': True,
+                'order': 0
+            }
+            # Handle image upload
+            if 'image' in request.FILES:
+                data['image'] = request.FILES['image']
+        
+        serializer = TeamMemberSerializer(data=data)
+        
+        if serializer.is_valid():
+            member = serializer.save(is_council=False)
+            return Response({
+                'success': True,
+                'message': 'District executive created successfully',
+                'member': serializer.data
+            }, status=status.HTTP_201_CREATED)
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_update_team_member(request, member_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Update a team member"""
+    try:
+        member = get_object_or_404(TeamMember, id=member_id)
+        
+        # Handle both JSON and FormData requests
+        if request.content_type == 'application/json':
+            data = request.data
+        else:
+            # Handle FormData
+            data = {
+                'name': request.POST.get('name'),
+                'position': request.POST.get('position'),
+                'congregation': request.POST.get('congregation', ''),
+                'phone': request.POST.get('phone', ''),
+                'email': request.POST.get('email', ''),
+                'quote': request.POST.get('quote', request.POST.get('description', '')),
+            }
+            # Handle image upload
+            if 'image' in request.FILES:
+                data['image'] = request.FILES['image']
+        
+        serializer = TeamMemberSerializer(member, data=data, partial=True)
+        
+        if serializer.is_valid():
+            serializer.save(is_council=False)
+            return Response({
+                'success': True,
+                'message': 'District executive updated successfully',
+                'member': serializer.data
+            })
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_reorder_team_members(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Save a drag-and-drop order: {"ids": [...]} sets position_order 1..n"""
+    try:
+        updated = apply_order(TeamMember.objects.filter(is_council=False), parse_ids(request.data), 'position_order')
+        return Response({
+            'success': True,
+            'updated': updated
+        })
+    except ValueError as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_delete_team_member(request, member_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Delete a team member"""
+    try:
+        member = get_object_or_404(TeamMember, id=member_id)
+        member.delete()
+        return Response({
+            'success': True,
+            'message': 'Team member deleted successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+# Council API endpoints (separate from team)
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_create_council_member(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    try:
+        # Use request.data for both JSON and multipart form data
+        data = request.data.copy()
+        
+        # Handle file upload
+        if 'image' in request.FILES:
+            data['image'] = request.FILES['image']
+        
+        # Map description -> quote for compatibility
+        if 'description' in data and not data.get('quote'):
+            data['quote'] = data.get('description')
+
+        # Set default values
+        data['is_active'] = True
+        data['is_council'] = True
+
+        serializer = TeamMemberSerializer(data=data)
+
+        if serializer.is_valid():
+            member = serializer.save()
+            return Response({
+                'success': True,
+                'message': 'Council member created successfully',
+                'member': TeamMemberSerializer(member).data
+            }, status=status.HTTP_201_CREATED)
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({'success': False, 'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_update_council_member(request, member_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    try:
+        member = get_object_or_404(TeamMember, id=member_id, is_council=True)
+
+        # Use request.data for both JSON and multipart form data
+        data = request.data.copy()
+        
+        # Map description -> quote for compatibility
+        if 'description' in data and not data.get('quote'):
+            data['quote'] = data.get('description')
+
+        # Handle file upload
+        if 'image' in request.FILES:
+            data['image'] = request.FILES['image']
+
+        serializer = TeamMemberSerializer(member, data=data, partial=True)
+        if serializer.is_valid():
+            updated = serializer.save()
+            return Response({
+                'success': True,
+                'message': 'Council member updated successfully',
+                'member': TeamMemberSerializer(updated).data
+            })
+        else:
+            return Response({'success': False, 'error': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({'success': False, 'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_reorder_council_members(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Save a drag-and-drop order: {"ids": [...]} sets order 1..n"""
+    try:
+        updated = apply_order(TeamMember.objects.filter(is_council=True), parse_ids(request.data), 'order')
+        return Response({
+            'success': True,
+            'updated': updated
+        })
+    except ValueError as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_delete_council_member(request, member_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    try:
+        member = get_object_or_404(TeamMember, id=member_id, is_council=True)
+        member.delete()
+        return Response({'success': True, 'message': 'Council member deleted successfully'})
+    except Exception as e:
+        return Response({'success': False, 'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        
+        return Response({
+            'success': True,
+            'message': 'Team member deleted successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
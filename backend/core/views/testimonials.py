@@ -0,0 +1,220 @@
+"""
+Testimonials API endpoints
+"""
+
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from ..live import publish
+from ..models import Testimonial
+from ..serializers import TestimonialSerializer
+
+
+# Testimonials API endpoints
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_create_testimonial(request):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Create a new testimonial"""
+    try:
+        data = request.data
+        serializer = TestimonialSerializer(data=data)
+        
+        if serializer.is_valid():
+            testimonial = serializer.save()
+            publish('testimonial', 'created', testimonial.id)
+            return Response({
+                'success': True,
+                'message': 'Testimonial created successfully',
+                'testimonial_id': testimonial.id
+            }, status=status.HTTP_201_CREATED)
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['PUT'])
+@permission_classes([AllowAny])
+def api_update_testimonial(request, testimonial_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Update a testimonial"""
+    try:
+        testimonial = get_object_or_404(Testimonial, id=testimonial_id)
+        data = request.data
+        serializer = TestimonialSerializer(testimonial, data=data, partial=True)
+        
+        if serializer.is_valid():
+            serializer.save()
+            publish('testimonial', 'updated', testimonial.id)
+            return Response({
+                'success': True,
+                'message': 'Testimonial updated successfully'
+            })
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['DELETE'])
+@permission_classes([AllowAny])
+def api_delete_testimonial(request, testimonial_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Soft delete a testimonial"""
+    try:
+        testimonial = get_object_or_404(Testimonial, id=testimonial_id)
+        testimonial.is_deleted = True
+        testimonial.deleted_at = timezone.now()
+        testimonial.save()
+        publish('testimonial', 'deleted', testimonial.id)
+        
+        return Response({
+            'success': True,
+            'message': 'Testimonial moved to trash successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_restore_testimonial(request, testimonial_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Restore a soft deleted testimonial"""
+    try:
+        testimonial = get_object_or_404(Testimonial, id=testimonial_id)
+        testimonial.is_deleted = False
+        testimonial.deleted_at = None
+        testimonial.save()
+        publish('testimonial', 'updated', testimonial.id)
+        
+        return Response({
+            'success': True,
+            'message': 'Testimonial restored successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_submit_testimonial(request):
+    """Submit a testimonial for review (public endpoint)"""
+    try:
+        # Handle both JSON and FormData
+        if request.content_type == 'application/json':
+            data = request.data
+        else:
+            # Handle FormData
+            data = {
+                'name': request.POST.get('name', ''),
+                'phone': request.POST.get('phone', ''),
+                'congregation': request.POST.get('congregation', ''),
+                'content': request.POST.get('content', ''),
+            }
+            # Handle file upload
+            if 'image' in request.FILES:
+                data['image'] = request.FILES['image']
+        
+        serializer = TestimonialSerializer(data=data)
+        
+        if serializer.is_valid():
+            testimonial = serializer.save(status='pending')
+            publish('testimonial', 'created', testimonial.id)
+            return Response({
+                'success': True,
+                'message': 'Testimonial submitted successfully and is pending review',
+                'testimonial_id': testimonial.id
+            }, status=status.HTTP_201_CREATED)
+        else:
+            return Response({
+                'success': False,
+                'error': serializer.errors
+            }, status=status.HTTP_400_BAD_REQUEST)
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_approve_testimonial(request, testimonial_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Approve a testimonial"""
+    try:
+        testimonial = get_object_or_404(Testimonial, id=testimonial_id)
+        testimonial.status = 'approved'
+        testimonial.is_active = True
+        with transaction.atomic():
+            # Locks the row for the site stats delta (core.stats)
+            testimonial.save()
+        publish('testimonial', 'updated', testimonial.id)
+        
+        return Response({
+            'success': True,
+            'message': 'Testimonial approved successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+@csrf_exempt
+@api_view(['POST'])
+@permission_classes([AllowAny])
+def api_deny_testimonial(request, testimonial_id):
+    if not request.user.is_authenticated:
+        return Response({'success': False, 'error': 'Authentication required'}, status=401)
+    """Deny a testimonial"""
+    try:
+        data = request.data
+        testimonial = get_object_or_404(Testimonial, id=testimonial_id)
+        testimonial.status = 'denied'
+        testimonial.is_active = False
+        testimonial.admin_notes = data.get('admin_notes', '')
+        testimonial.save()
+        publish('testimonial', 'updated', testimonial.id)
+        
+        return Response({
+            'success': True,
+            'message': 'Testimonial denied successfully'
+        })
+    except Exception as e:
+        return Response({
+            'success': False,
+            'error': str(e)
+        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
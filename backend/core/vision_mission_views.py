@@ -7,7 +7,6 @@ from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth import login
-import json
 from .models import VisionMission, Supervisor
 from .serializers import VisionMissionSerializer
 
@@ -86,7 +85,7 @@ def api_vision_mission_update(request):
                 vision_mission.vision_image = request.FILES['vision_image']
         else:
             # Handle JSON data
-            data = json.loads(request.body)
+            data = request.data
 
         # Update text fields
         vision_mission.mission_text = data.get('mission_text', vision_mission.mission_text)
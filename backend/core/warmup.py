@@ -0,0 +1,66 @@
+"""
+Pre-build the cached payloads in core.payloads after a deploy or restart.
+
+Used by ``manage.py warm_caches`` and by the gunicorn hooks in
+gunicorn.conf.py. Entries are built in parallel threads; the caller waits
+at most ``budget`` seconds and anything still running finishes in the
+background instead of delaying readiness.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from django.conf import settings
+from django.db import connections
+
+from .payloads import WARM_VARIANTS, build_payload
+
+
+def _label(name, params):
+    if not params:
+        return name
+    return f'{name} ({", ".join(f"{k}={v}" for k, v in sorted(params.items()))})'
+
+
+def _build(name, params):
+    start = time.perf_counter()
+    try:
+        build_payload(name, **params)
+        return time.perf_counter() - start, None
+    except Exception as e:
+        return time.perf_counter() - start, e
+
+
+def _build_in_thread(name, params):
+    try:
+        return _build(name, params)
+    finally:
+        connections.close_all()
+
+
+def warm_caches(budget=None, workers=4, variants=None):
+    """Build every warm-up variant; returns ``[(label, seconds, error)]``.
+
+    ``seconds`` is None for entries that had not finished within the budget.
+    ``workers=0`` builds everything inline in the calling thread, ignoring
+    the budget.
+    """
+    if budget is None:
+        budget = getattr(settings, 'WARM_CACHES_BUDGET_SECONDS', 10)
+    variants = WARM_VARIANTS if variants is None else variants
+
+    if workers <= 0:
+        return [(_label(name, params), *_build(name, params)) for name, params in variants]
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ypg-warmup')
+    futures = [(_label(name, params), pool.submit(_build_in_thread, name, params)) for name, params in variants]
+    wait([future for _, future in futures], timeout=budget)
+    pool.shutdown(wait=False)
+
+    results = []
+    for label, future in futures:
+        if future.done():
+            seconds, error = future.result()
+            results.append((label, seconds, error))
+        else:
+            results.append((label, None, None))
+    return results
@@ -0,0 +1,73 @@
+"""
+Gunicorn configuration, picked up automatically from the working directory.
+
+SERVER_MODE=wsgi (default) runs sync workers on ypg_backend.wsgi;
+SERVER_MODE=asgi runs uvicorn workers on ypg_backend.asgi so the async
+public endpoints can serve many polling clients per worker.
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8000')}"
+# Read here rather than left to gunicorn's own default so the settings
+# (WEB_CONCURRENCY, SHARED_CACHE) agree with the number actually started
+workers = int(os.environ.get('WEB_CONCURRENCY', '1'))
+
+if os.environ.get('SERVER_MODE', 'wsgi').lower() == 'asgi':
+    wsgi_app = 'ypg_backend.asgi:application'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'ypg_backend.wsgi:application'
+
+
+# Cache priming (core.warmup). A shared cache (REDIS_URL) is primed once, by
+# ``manage.py warm_caches`` in a child process the master starts when it is
+# ready: the builds run on that process's thread pool and database
+# connections, never the master's, so nothing of them is forked into the
+# workers. The master waits at most WARM_CACHES_BUDGET_SECONDS for it, then
+# starts serving while leftovers finish in the child. A per-process memory
+# cache has to be primed in every worker; there the wait is capped by the same
+# budget and leftovers finish in background threads of that worker.
+# WARM_CACHES_ON_START=false turns priming off.
+
+def _warm_caches_enabled():
+    return os.environ.get('WARM_CACHES_ON_START', 'true').lower() == 'true'
+
+
+def _warm_caches(log):
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ypg_backend.settings')
+    import django
+    django.setup()
+    from core.warmup import warm_caches
+
+    try:
+        results = warm_caches()
+    except Exception:
+        log.exception('Cache warm-up failed')
+        return
+    for label, seconds, error in results:
+        if error is not None:
+            log.warning('warm_caches: %s failed: %s', label, error)
+        elif seconds is None:
+            log.info('warm_caches: %s still building (over budget)', label)
+        else:
+            log.info('warm_caches: %s %.1f ms', label, seconds * 1000)
+
+
+def when_ready(server):
+    if not (os.environ.get('REDIS_URL') and _warm_caches_enabled()):
+        return
+    import subprocess
+    import sys
+
+    budget = float(os.environ.get('WARM_CACHES_BUDGET_SECONDS', '10'))
+    manage = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'manage.py')
+    process = subprocess.Popen([sys.executable, manage, 'warm_caches', '--budget', str(budget)])
+    try:
+        process.wait(timeout=budget)
+    except subprocess.TimeoutExpired:
+        server.log.info('warm_caches: still building after %.0fs, serving meanwhile', budget)
+
+
+def post_fork(server, worker):
+    if not os.environ.get('REDIS_URL') and _warm_caches_enabled():
+        _warm_caches(server.log)
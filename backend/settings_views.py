@@ -6,6 +6,7 @@ from django.views.decorators.csrf import csrf_exempt
 import json
 from pathlib import Path
 from core.models import ProfileSettings, WebsiteSettings
+from core.payloads import get_payload
 
 BASE_DIR = Path(__file__).resolve().parent
 SETTINGS_FILE = BASE_DIR / 'site_settings.json'
@@ -211,7 +212,7 @@ def api_settings_profile(request):
                     'success': False,
                     'error': 'Authentication required'
                 }, status=status.HTTP_401_UNAUTHORIZED)
-            data = json.loads(request.body)
+            data = request.data
             current = load_profile_settings()
             current.update(data)
             save_profile_settings(current)
@@ -241,7 +242,7 @@ def api_settings_website(request):
     """Get or update website settings"""
     try:
         if request.method == 'GET':
-            settings = load_settings()
+            settings = get_payload('website_settings')
             response = Response({
                 'success': True,
                 'settings': settings
@@ -256,7 +257,7 @@ def api_settings_website(request):
                     'success': False,
                     'error': 'Authentication required'
                 }, status=status.HTTP_401_UNAUTHORIZED)
-            data = json.loads(request.body)
+            data = request.data
             current = load_settings()
             current.update(data)
             save_settings(current)
@@ -33,7 +33,7 @@ def main():
         return
     
     print("\n1️⃣ Installing Django dependencies...")
-    if not run_command("pip install django djangorestframework django-cors-headers python-decouple dj-database-url psycopg2-binary pillow whitenoise gunicorn", backend_dir):
+    if not run_command("pip install django djangorestframework django-cors-headers python-decouple dj-database-url 'psycopg[binary,pool]' pillow whitenoise gunicorn", backend_dir):
         print("❌ Failed to install dependencies")
         return
     
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 from pathlib import Path
 import os
 from decouple import config
+from corsheaders.defaults import default_headers
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -51,13 +52,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    'whitenoise.middleware.WhiteNoiseMiddleware',
+    'core.staticfiles.AsyncWhiteNoiseMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core.profiling.ProfilerMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -102,6 +105,39 @@ except:
     # Use SQLite if DATABASE_URL is not available or is SQLite
     pass
 
+# Connection management. By default each gunicorn worker keeps its database
+# connection open for DB_CONN_MAX_AGE seconds (checked before reuse) instead
+# of paying a fresh connect + TLS handshake on every request.
+# DB_POOL uses Django's built-in psycopg 3 connection pool (psycopg-pool) and
+# replaces persistent connections. DB_PGBOUNCER makes the settings safe behind
+# pgbouncer in transaction mode, where a session may change between queries.
+# Under ASGI every request runs in its own thread, so thread-bound persistent
+# connections would pile up: SERVER_MODE=asgi turns DB_POOL on by default
+# instead (with SQLite, which has no pool, it connects per request).
+SERVER_MODE = config('SERVER_MODE', default='wsgi').lower()
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=0 if SERVER_MODE == 'asgi' else 600, cast=int)
+DB_CONN_HEALTH_CHECKS = config('DB_CONN_HEALTH_CHECKS', default=True, cast=bool)
+DB_POOL = config('DB_POOL', default=SERVER_MODE == 'asgi', cast=bool)
+DB_POOL_MIN_SIZE = config('DB_POOL_MIN_SIZE', default=2, cast=int)
+DB_POOL_MAX_SIZE = config('DB_POOL_MAX_SIZE', default=10, cast=int)
+DB_POOL_TIMEOUT = config('DB_POOL_TIMEOUT', default=10, cast=int)
+DB_PGBOUNCER = config('DB_PGBOUNCER', default=False, cast=bool)
+
+DATABASES['default']['CONN_MAX_AGE'] = DB_CONN_MAX_AGE
+DATABASES['default']['CONN_HEALTH_CHECKS'] = DB_CONN_HEALTH_CHECKS
+if DATABASES['default']['ENGINE'] == 'django.db.backends.postgresql':
+    if DB_POOL:
+        DATABASES['default']['CONN_MAX_AGE'] = 0  # Pooling and persistent connections are exclusive
+        DATABASES['default'].setdefault('OPTIONS', {})['pool'] = {
+            'min_size': DB_POOL_MIN_SIZE,
+            'max_size': DB_POOL_MAX_SIZE,
+            'timeout': DB_POOL_TIMEOUT,
+        }
+    if DB_PGBOUNCER:
+        # Named cursors do not survive pgbouncer handing the transaction's
+        # server connection to another client.
+        DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = True
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -144,6 +180,21 @@ STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 # Media files (default local)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+# core.media serves MEDIA_ROOT when S3 isn't configured. Behind nginx set
+# MEDIA_ACCEL=x-accel-redirect (with an `internal` location at
+# MEDIA_ACCEL_PREFIX aliased to MEDIA_ROOT); behind Apache/lighttpd use
+# x-sendfile. Empty streams the file from the worker via sendfile().
+MEDIA_ACCEL = config('MEDIA_ACCEL', default='')
+MEDIA_ACCEL_PREFIX = config('MEDIA_ACCEL_PREFIX', default='/protected-media/')
+MEDIA_CACHE_MAX_AGE = config('MEDIA_CACHE_MAX_AGE', default=31536000, cast=int)
+STORAGES = {
+    'default': {
+        'BACKEND': 'core.storage.InstrumentedFileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
 
 # S3 storage for MEDIA in production (or when AWS bucket is configured)
 AWS_ACCESS_KEY_ID = config('AWS_ACCESS_KEY_ID', default=None)
@@ -156,7 +207,7 @@ if AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY and AWS_STORAGE_BUCKET_NAME:
     # Django 5 STORAGES config
     STORAGES = {
         'default': {
-            'BACKEND': 'storages.backends.s3boto3.S3Boto3Storage',
+            'BACKEND': 'core.s3_storage.InstrumentedS3Storage',
         },
         'staticfiles': {
             # Keep WhiteNoise for static files
@@ -180,6 +231,31 @@ if AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY and AWS_STORAGE_BUCKET_NAME:
         region = AWS_S3_REGION_NAME
         MEDIA_URL = f"https://{AWS_STORAGE_BUCKET_NAME}.s3.{region}.amazonaws.com/"
 
+# Cache: Redis when REDIS_URL is set so every gunicorn worker shares it,
+# otherwise a per-process memory cache. WEB_CONCURRENCY is the gunicorn
+# worker count (gunicorn.conf.py). Without REDIS_URL, several workers each
+# see only their own invalidations, so SHARED_CACHE is False and cached
+# payloads are kept for LOCAL_PAYLOAD_CACHE_SECONDS at most (core.payloads).
+REDIS_URL = config('REDIS_URL', default='')
+WEB_CONCURRENCY = config('WEB_CONCURRENCY', default=1, cast=int)
+SHARED_CACHE = bool(REDIS_URL) or WEB_CONCURRENCY <= 1
+LOCAL_PAYLOAD_CACHE_SECONDS = config('LOCAL_PAYLOAD_CACHE_SECONDS', default=5, cast=int)
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            # Room for the per-row fragments next to the payloads (default 300)
+            'OPTIONS': {'MAX_ENTRIES': 5000},
+        }
+    }
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -196,6 +272,8 @@ CORS_ALLOWED_ORIGINS = list(dict.fromkeys(
 ))
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOW_ALL_ORIGINS = DEBUG  # Allow all origins in development
+CORS_ALLOW_HEADERS = (*default_headers, 'x-profile')
+CORS_EXPOSE_HEADERS = ['X-Profile-Id', 'X-Profile-Total-Ms', 'X-Profile-SQL-Count', 'X-Profile-SQL-Ms', 'X-Profile-Top']
 
 CSRF_TRUSTED_ORIGINS = [
     'https://ahinsandistrictypg.com',
@@ -215,6 +293,15 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework.authentication.SessionAuthentication',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 # Security Settings for Production
@@ -234,7 +321,7 @@ else:
     CSRF_COOKIE_SECURE = False
 
 # Email Configuration via Resend SMTP
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+EMAIL_BACKEND = 'core.mail.InstrumentedSMTPBackend'
 EMAIL_HOST = 'smtp.resend.com'
 EMAIL_PORT = 587
 EMAIL_USE_TLS = True
@@ -247,4 +334,58 @@ ADMIN_EMAIL = os.getenv('ADMIN_EMAIL', 'ypgahinsandistrict@gmail.com')
 
 ARKESEL_API_KEY = os.getenv('ARKESEL_API_KEY')
 SMS_SENDER_ID = os.getenv('SMS_SENDER_ID', 'DistYPG')
-OTP_RECIPIENT = os.getenv('OTP_RECIPIENT', '0245660786')
\ No newline at end of file
+OTP_RECIPIENT = os.getenv('OTP_RECIPIENT', '0245660786')
+
+# Cached API payloads (core.payloads): lifetime of a cached listing/summary,
+# and how long warm_caches may hold up startup before finishing in background.
+PAYLOAD_CACHE_SECONDS = config('PAYLOAD_CACHE_SECONDS', default=300, cast=int)
+WARM_CACHES_BUDGET_SECONDS = config('WARM_CACHES_BUDGET_SECONDS', default=10, cast=float)
+# Stampede protection: entries expire up to PAYLOAD_TTL_JITTER (a fraction)
+# early, stay servable PAYLOAD_STALE_SECONDS past that while one request
+# rebuilds under a lock held at most PAYLOAD_LOCK_SECONDS, and a request that
+# finds no entry waits up to PAYLOAD_LOCK_WAIT_SECONDS for the lock holder.
+PAYLOAD_TTL_JITTER = config('PAYLOAD_TTL_JITTER', default=0.1, cast=float)
+PAYLOAD_STALE_SECONDS = config('PAYLOAD_STALE_SECONDS', default=60, cast=int)
+PAYLOAD_LOCK_SECONDS = config('PAYLOAD_LOCK_SECONDS', default=30, cast=int)
+PAYLOAD_LOCK_WAIT_SECONDS = config('PAYLOAD_LOCK_WAIT_SECONDS', default=5, cast=float)
+# Serialized rows cached by (pk, updated_at) for the list endpoints
+# (core.fragments); superseded versions simply age out.
+FRAGMENT_CACHE_SECONDS = config('FRAGMENT_CACHE_SECONDS', default=86400, cast=int)
+
+# Cold start (manage.py bench_startup): import django, settings and the URLconf
+# in a fresh interpreter. View modules load on first request (core.urls.LazyView).
+STARTUP_BUDGET_MS = config('STARTUP_BUDGET_MS', default=1500, cast=float)
+
+# Metrics (/api/metrics/): 'local', 'directory' or 'cache' aggregation across
+# gunicorn workers; scrapers authenticate with METRICS_TOKEN as a bearer token.
+METRICS_MODE = config('METRICS_MODE', default='local')
+METRICS_DIR = config('METRICS_DIR', default='/tmp/ypg-metrics')
+METRICS_FLUSH_SECONDS = config('METRICS_FLUSH_SECONDS', default=5, cast=int)
+METRICS_TOKEN = config('METRICS_TOKEN', default='')
+
+# Request profiler: supervisors send "X-Profile: 1" to profile one request.
+# PROFILER_SAMPLE_RATE (0-1) also samples ordinary traffic; sampled requests
+# slower than PROFILER_SLOW_MS are dumped to PROFILER_DIR.
+PROFILER_SAMPLE_RATE = config('PROFILER_SAMPLE_RATE', default=0.0, cast=float)
+PROFILER_SLOW_MS = config('PROFILER_SLOW_MS', default=1000, cast=int)
+PROFILER_DIR = config('PROFILER_DIR', default='/tmp/ypg-profiles')
+
+# Dashboard live updates (core.live, /api/admin/events/): change events are
+# kept in the cache for LIVE_EVENTS_TTL seconds, at most LIVE_EVENTS_BACKLOG
+# of them are replayed to a reconnecting client, and each stream closes after
+# LIVE_EVENTS_STREAM_SECONDS (EventSource reconnects and resumes). Without
+# Redis, streams poll the cache every LIVE_EVENTS_POLL_SECONDS, and with
+# several workers (SHARED_CACHE False) the endpoint answers 503 instead.
+LIVE_EVENTS_TTL = config('LIVE_EVENTS_TTL', default=600, cast=int)
+LIVE_EVENTS_BACKLOG = config('LIVE_EVENTS_BACKLOG', default=200, cast=int)
+LIVE_EVENTS_STREAM_SECONDS = config('LIVE_EVENTS_STREAM_SECONDS', default=300, cast=float)
+LIVE_EVENTS_POLL_SECONDS = config('LIVE_EVENTS_POLL_SECONDS', default=2, cast=float)
+LIVE_EVENTS_HEARTBEAT_SECONDS = config('LIVE_EVENTS_HEARTBEAT_SECONDS', default=15, cast=float)
+
+# Dashboard ?since= sync (core.changes): hard deletes are remembered this
+# long; a client whose last sync is older gets the full list again.
+SYNC_TOMBSTONE_DAYS = config('SYNC_TOMBSTONE_DAYS', default=30, cast=int)
+
+# Analytics history (core.rollups): hourly buckets are kept this many days;
+# compact_analytics prunes older ones after rolling days into weeks/months.
+ANALYTICS_HOURLY_DAYS = config('ANALYTICS_HOURLY_DAYS', default=14, cast=int)
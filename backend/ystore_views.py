@@ -24,10 +24,10 @@ def api_ystore_items(request):
             # The frontend will handle displaying out-of-stock items appropriately
             items = YStoreItem.objects.all().order_by('-created_at')
             
-            serializer = YStoreItemSerializer(items, many=True)
+            rows = YStoreItemSerializer.list_data(request, items)
             return Response({
                 'success': True,
-                'items': serializer.data
+                'items': rows
             })
         
         elif request.method == 'POST':
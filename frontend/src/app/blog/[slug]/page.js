@@ -18,9 +18,28 @@ async function fetchPost(slug) {
   }
 }
 
+async function fetchRelated(slug) {
+  try {
+    const res = await fetch(
+      `${process.env.NEXT_PUBLIC_API_BASE_URL || "https://api-website.ahinsandistrictypg.com"}/api/blog/${slug}/related/`,
+      {
+        cache: "no-store",
+      }
+    );
+    if (!res.ok) return [];
+    const data = await res.json();
+    return data?.posts || [];
+  } catch {
+    return [];
+  }
+}
+
 export default async function BlogDetailPage({ params }) {
   const { slug } = params;
-  const post = await fetchPost(slug);
+  const [post, related] = await Promise.all([
+    fetchPost(slug),
+    fetchRelated(slug),
+  ]);
 
   if (!post) {
     return (
@@ -40,6 +59,12 @@ export default async function BlogDetailPage({ params }) {
           </span>
           <span>•</span>
           <span>{post.date}</span>
+          {post.reading_time > 0 && (
+            <>
+              <span>•</span>
+              <span>{post.reading_time} min read</span>
+            </>
+          )}
         </div>
         <h1 className="text-2xl md:text-3xl font-bold text-navy-950 mb-4 leading-tight">
           {post.title}
@@ -60,10 +85,37 @@ export default async function BlogDetailPage({ params }) {
       {/* Content */}
       <div className="bg-white rounded-xl shadow-sm border border-gray-100 p-6">
         <div className="prose prose-lg max-w-none prose-headings:text-navy-950 prose-p:text-gray-700 prose-p:leading-relaxed prose-a:text-gold-500 prose-a:no-underline hover:prose-a:underline">
-          <div className="whitespace-pre-line">{post.content}</div>
+          <div dangerouslySetInnerHTML={{ __html: post.content_html }} />
         </div>
       </div>
 
+      {/* Related Posts */}
+      {related.length > 0 && (
+        <div className="mt-8">
+          <h2 className="text-lg font-semibold text-navy-950 mb-4">
+            Related Posts
+          </h2>
+          <div className="space-y-3">
+            {related.map((item) => (
+              <Link
+                key={item.id}
+                href={`/blog/${item.slug}`}
+                className="block bg-white rounded-lg border border-gray-100 p-4 hover:border-gold-500 transition-colors"
+              >
+                <div className="text-xs text-gray-500 mb-1">
+                  {item.category}
+                  {item.reading_time > 0 && ` · ${item.reading_time} min read`}
+                </div>
+                <div className="font-medium text-navy-950">{item.title}</div>
+                <p className="text-sm text-gray-600 line-clamp-2">
+                  {item.summary}
+                </p>
+              </Link>
+            ))}
+          </div>
+        </div>
+      )}
+
       {/* Back Button */}
       <div className="text-center mt-8">
         <Link
@@ -61,6 +61,7 @@ export default async function BlogListPage() {
                 <div className="p-5">
                   <div className="text-xs text-gray-500 mb-2">
                     {post.date} · {post.category}
+                    {post.reading_time > 0 && ` · ${post.reading_time} min read`}
                   </div>
                   <h2 className="text-lg font-semibold mb-2">
                     <Link
@@ -70,7 +71,7 @@ export default async function BlogListPage() {
                       {post.title}
                     </Link>
                   </h2>
-                  <p className="text-gray-600 line-clamp-3">{post.excerpt}</p>
+                  <p className="text-gray-600 line-clamp-3">{post.summary}</p>
                 </div>
               </article>
             ))}